@@ -0,0 +1,204 @@
+"""
+Markdown render layer shared by Typography and chat messages.
+
+Rendered HTML is memoized by a hash of the content and the renderer
+options, so identical static content is only parsed once across all
+sessions. Append-only updates (e.g. an LLM streaming tokens into a
+chat message) are rendered incrementally: blocks which are separated
+by a blank line from a block starting on a finished line can no longer
+change, so their HTML is retained and only the trailing blocks are
+re-parsed on each update. Lists, blockquotes
+and tables may still absorb the blocks following them (e.g. a paragraph
+"2" that becomes a list item "2."), so they are only retained once the
+block following them is retained.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import textwrap
+import threading
+import typing as t
+from collections import OrderedDict
+from html import escape
+
+from panel.pane.markup import Markdown
+
+from ._stylesheets import SharedStyleSheetMixin
+
+# Reference definitions and footnotes may affect the rendering of
+# earlier blocks, so such content is always rendered in full.
+_NONLOCAL_RE = re.compile(r'^ {0,3}\[[^\]]+\]:|\[\^', re.MULTILINE)
+
+# Blocks which may absorb the blocks following them
+_CONTAINERS = {'blockquote_open', 'bullet_list_open', 'ordered_list_open', 'table_open'}
+
+_CACHE_SIZE = 512
+
+_cache: OrderedDict[tuple[t.Any, ...], str] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _options_key(pane: Markdown) -> tuple[t.Any, ...]:
+    options = repr(sorted(pane.renderer_options.items()))
+    extensions = tuple(pane.extensions) if pane.renderer == 'markdown' else ()
+    return (
+        pane.renderer, tuple(pane.plugins), pane.hard_line_break,
+        pane.disable_anchors, options, extensions
+    )
+
+
+def _render(pane: Markdown, text: str) -> str:
+    """
+    Renders the Markdown text to HTML using the pane's renderer.
+    """
+    import markdown
+
+    if pane.renderer == 'markdown':
+        extensions = pane.extensions + ['nl2br'] if pane.hard_line_break else pane.extensions
+        return markdown.markdown(
+            text, extensions=extensions, output_format='xhtml', **pane.renderer_options
+        )
+    parser = _get_parser(pane)
+    try:
+        return parser.render(text)
+    except IndexError:
+        # Likely markdown-it mdurl parser error
+        with parser.reset_rules():
+            parser.disable('link')
+            return parser.render(text)
+
+
+def _get_parser(pane: Markdown):
+    return pane._get_parser(
+        pane.renderer, tuple(pane.plugins), pane.hard_line_break,
+        pane.disable_anchors, **pane.renderer_options
+    )
+
+
+def clear_markdown_cache() -> None:
+    """
+    Clears the cache of rendered Markdown shared across sessions.
+    """
+    with _lock:
+        _cache.clear()
+
+
+class IncrementalMarkdown:
+    """
+    Renders successive versions of a Markdown document, re-parsing
+    only the trailing block when the text is appended to.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._key: tuple[t.Any, ...] | None = None
+        self._source = ''
+        self._html = ''
+        self._headings = False
+
+    def render(self, pane: Markdown, text: str) -> str:
+        """
+        Renders the text to HTML, reusing the rendered prefix if the
+        text extends the previously rendered text.
+        """
+        key = _options_key(pane)
+        digest = (key, hashlib.sha1(text.encode('utf-8', 'surrogatepass')).digest())
+        with _lock:
+            html = _cache.get(digest)
+            if html is not None:
+                _cache.move_to_end(digest)
+        if html is not None:
+            self.reset()
+            return html
+
+        appended = (
+            self._key == key and bool(self._source) and text.startswith(self._source)
+        )
+        if pane.renderer != 'markdown' and '\r' not in text and not _NONLOCAL_RE.search(text):
+            if not appended:
+                self.reset()
+                self._key = key
+            html = self._render_incremental(pane, text)
+            if html is not None:
+                if appended:
+                    # Intermediate states of a stream are not memoized
+                    return html
+                self._store(digest, html)
+                return html
+        self.reset()
+        html = _render(pane, text)
+        self._store(digest, html)
+        return html
+
+    def _store(self, digest: tuple[t.Any, ...], html: str) -> None:
+        with _lock:
+            _cache[digest] = html
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    def _render_incremental(self, pane: Markdown, text: str) -> str | None:
+        parser = _get_parser(pane)
+        tail = text[len(self._source):]
+        env: dict[str, t.Any] = {}
+        try:
+            tokens = parser.parse(tail, env)
+        except IndexError:
+            return None
+        headings = any(token.type == 'heading_open' for token in tokens)
+        if headings and self._headings and not pane.disable_anchors:
+            # Anchor slugs are deduplicated across the whole document
+            return None
+        starts = [
+            i for i, token in enumerate(tokens)
+            if token.level == 0 and token.nesting >= 0 and token.map
+        ]
+        # Retain the blocks up to the last block which starts on a
+        # finished line and is separated by a blank line from a block
+        # which cannot absorb it; markers on an unfinished line (e.g.
+        # "***") may still turn out to continue the preceding block
+        lines = tail.count('\n')
+        cuts = [
+            start for prev, start in zip(starts, starts[1:], strict=False)
+            if tokens[prev].type not in _CONTAINERS
+            and tokens[prev].map[1] < tokens[start].map[0] < lines
+        ]
+        if cuts:
+            last = cuts[-1]
+            stable = tokens[:last]
+            self._html += parser.renderer.render(stable, parser.options, env)
+            self._headings |= any(token.type == 'heading_open' for token in stable)
+            offset = -1
+            for _ in range(tokens[last].map[0]):
+                offset = tail.index('\n', offset + 1)
+            self._source += tail[:offset + 1]
+            tokens = tokens[last:]
+        return self._html + parser.renderer.render(tokens, parser.options, env)
+
+
+class CachedMarkdownMixin:
+    """
+    Mixin for Markdown panes rendering their content through the shared
+    Markdown render cache.
+    """
+
+    def _transform_object(self, obj: t.Any) -> dict[str, t.Any]:
+        if obj is None:
+            obj = ''
+        elif not isinstance(obj, str):
+            obj = obj._repr_markdown_()
+        if self.dedent:  # type: ignore[attr-defined]
+            obj = textwrap.dedent(obj)
+        if not hasattr(self, '_incremental_markdown'):
+            self._incremental_markdown = IncrementalMarkdown()
+        html = self._incremental_markdown.render(self, obj)  # type: ignore[arg-type]
+        return dict(object=escape(html))
+
+
+class CachedMarkdown(SharedStyleSheetMixin, CachedMarkdownMixin, Markdown):
+    """
+    Markdown pane rendering its content through the shared Markdown
+    render cache.
+    """
@@ -0,0 +1,93 @@
+"""
+Registry of raw CSS stylesheets shared by many components.
+
+Raw CSS strings are serialized separately for every model they are
+applied to, e.g. the message stylesheet is copied onto every
+component rendered inside a ChatMessage. CSS registered with the
+registry is instead converted to a single InlineStyleSheet model per
+document, which all models in that document reference by id, so the
+CSS is only sent to the frontend once per session. The registry is
+global and never pruned, so only static CSS declared by the package
+should be registered.
+"""
+from __future__ import annotations
+
+import typing as t
+
+from bokeh.models import InlineStyleSheet
+
+if t.TYPE_CHECKING:
+    from bokeh.document import Document
+
+_registry: set[str] = set()
+
+# The InlineStyleSheet models reference their document, so they are
+# stored on the document and released with it
+_DOC_ATTR = '_pmui_stylesheets'
+
+
+def _document_stylesheets(doc: Document) -> dict[str, InlineStyleSheet]:
+    cache = getattr(doc, _DOC_ATTR, None)
+    if cache is None:
+        cache = {}
+        setattr(doc, _DOC_ATTR, cache)
+    return cache
+
+
+def register_stylesheet(css: str) -> str:
+    """
+    Registers static raw CSS to be shared by all models in a document.
+
+    Parameters
+    ----------
+    css: str
+        The raw CSS.
+
+    Returns
+    -------
+    The CSS, to allow registering stylesheets on declaration.
+    """
+    _registry.add(css)
+    return css
+
+
+def resolve_stylesheets(props: dict[str, t.Any], doc: Document | None) -> dict[str, t.Any]:
+    """
+    Replaces registered raw CSS in the stylesheets property with the
+    InlineStyleSheet shared by all models in the document.
+
+    Parameters
+    ----------
+    props: dict
+        The model properties.
+    doc: bokeh.document.Document
+        The document the model belongs to, CSS is left unchanged if
+        the document is not known.
+    """
+    stylesheets = props.get('stylesheets')
+    if doc is None or not stylesheets:
+        return props
+    cache = _document_stylesheets(doc)
+    resolved = []
+    for stylesheet in stylesheets:
+        if isinstance(stylesheet, str) and stylesheet in _registry:
+            model = cache.get(stylesheet)
+            if model is None:
+                model = cache[stylesheet] = InlineStyleSheet(css=stylesheet)
+            stylesheet = model
+        resolved.append(stylesheet)
+    props['stylesheets'] = resolved
+    return props
+
+
+class SharedStyleSheetMixin:
+    """
+    Mixin for components resolving registered raw CSS to stylesheets
+    shared by all models in a document.
+    """
+
+    def _get_properties(self, doc: Document | None) -> dict[str, t.Any]:
+        return resolve_stylesheets(super()._get_properties(doc), doc)  # type: ignore[misc]
+
+    def _update_properties(self, *events, doc: Document) -> dict[str, t.Any]:
+        return resolve_stylesheets(super()._update_properties(*events, doc=doc), doc)  # type: ignore[misc]
@@ -39,6 +39,7 @@ from panel.io.location import Location
 from panel.io.resources import EXTENSION_CDN, Resources
 from panel.io.state import state
 from panel.models import ReactComponent as BkReactComponent
+from panel.models.esm import DataEvent
 from panel.pane import HTML
 from panel.param import Param
 from panel.util import base_version, classproperty
@@ -46,11 +47,14 @@ from panel.viewable import Child, Children, Viewable
 from panel.widgets.base import CompositeWidget, WidgetBase
 
 from .__version import __version__  # noqa
+from ._stylesheets import SharedStyleSheetMixin
 from ._utils import conffilter, json_dumps
+from .profiling import profiler
 from .theme import MaterialDesign
 
 if t.TYPE_CHECKING:
     from bokeh.document import Document
+    from bokeh.events import Event
     from bokeh.model import Model
     from pyviz_comms import Comm
 
@@ -153,17 +157,47 @@ class ESMTransform:
     ESMTransform allows writing transforms for ReactComponent
     that add additional functionality by wrapping the base
     ESM with a wrapping function.
+
+    The wrapped component is declared once at the module level as a
+    memoized component forwarding its ref, ensuring the component
+    type is stable across renders, i.e. the wrapped component is not
+    remounted and only re-renders when its own state changes.
+
+    If `window.__pmui_render_counts__` is defined the wrappers record
+    the number of renders and mounts of each wrapped component, keyed
+    by the model id and the component name.
     """
 
     _transform: str | None = None
 
+    _wrapper = """\
+{esm}
+
+const {wrapped} = React.memo(React.forwardRef(function {wrapped}(props, ref) {{
+  const mounted = React.useRef(false)
+  const counts = window.__pmui_render_counts__
+  if (counts) {{
+    const key = `${{props.model?.id}}:{input}`
+    const count = counts[key] = counts[key] || {{renders: 0, mounts: 0}}
+    count.renders += 1
+    if (!mounted.current) {{
+      count.mounts += 1
+    }}
+  }}
+  mounted.current = true
+  return {input}(props, ref)
+}}))
+"""
+
     @classmethod
     def apply(cls, component: type[ReactComponent], esm: str, input_component: str) -> tuple[str, str]:
         name = cls.__name__.replace('Transform', '')
         output = f'{name}{component.__name__}'
+        wrapped = f'Memo{input_component}'
+        esm = cls._wrapper.format(esm=esm, input=input_component, wrapped=wrapped)
         return cls._transform.format(  # type: ignore[union-attr]
             esm=esm,
-            input=input_component,
+            input=wrapped,
             output=output
         ), output
 
@@ -171,7 +205,11 @@ class ESMTransform:
 class ThemedTransform(ESMTransform):
     """
     ThemedTransform is a transform that applies a theme to a component.
-    It adds a ThemeProvider and CssBaseline to the component.
+    It adds a ThemeProvider and, once per shadow root, a CssBaseline to
+    the component. Themes are compiled once per theme configuration and
+    dark mode and shared by all components in the session. Since it is
+    the outermost transform, which is rendered by Panel directly, it does
+    not forward a ref.
     """
 
     _transform = """\
@@ -192,9 +230,10 @@ function {output}(props) {{
   if (props.view.is_root && document.documentElement.getAttribute("data-theme-managed") === "false") {{
     apply_global_css(props.model, props.view, theme)
   }}
+  // Components rendered into the React tree of a parent share its baseline styles
   return (
     <ThemeProvider theme={{theme}}>
-      <CssBaseline />
+      {{props.view.use_shadow_dom === false ? null : <CssBaseline />}}
       <{input} {{...props}}/>
       {{attached.length ? <div class="attached">{{attached}}</div> : null}}
     </ThemeProvider>
@@ -211,7 +250,10 @@ import {{ useTheme as useMuiTheme }} from '@mui/material/styles'
 
 {esm}
 
-function {output}(props) {{
+const LOADING_CONTAINER_STYLE = {{display: 'contents', position: 'relative'}}
+const LOADING_SPINNER_SX = {{p: "8px"}}
+
+function {output}(props, ref) {{
   const [loading] = props.model.useState('loading')
   const loading_inset = props.model.esm_constants.loading_inset || 0
   const theme = useMuiTheme()
@@ -221,8 +263,8 @@ function {output}(props) {{
     : 'rgba(255, 255, 255, 0.5)'
 
   return (
-    <div style={{{{ display: 'contents', position: 'relative' }}}}>
-      <{input} {{...props}}/>
+    <div style={{LOADING_CONTAINER_STYLE}}>
+      <{input} {{...props}} ref={{ref}}/>
       {{loading && (
         <div style={{{{
           position: 'absolute',
@@ -233,7 +275,7 @@ function {output}(props) {{
           backgroundColor: overlayColor,
           zIndex: theme.zIndex.modal - 1
         }}}}>
-          <CircularProgress color="primary" sx={{{{p: "8px"}}}} />
+          <CircularProgress color="primary" sx={{LOADING_SPINNER_SX}} />
         </div>
       )}}
     </div>
@@ -257,25 +299,25 @@ import Tooltip from "@mui/material/Tooltip";
 function {output}(props, ref) {{
   const [description] = props.model.useState("description")
   const [description_delay] = props.model.useState("description_delay")
-
-  const Wrapped{input} = React.forwardRef({input})
-  return (description ? (
+  // Always render the Tooltip, which is not shown without a title, so
+  // toggling the description does not remount the wrapped component
+  return (
     <Tooltip
-      title={{description}}
+      title={{description || ""}}
       arrow
       enterDelay={{description_delay}}
       enterNextDelay={{description_delay}}
       placement="right"
       slotProps={{{{ popper: {{ container: props.el }} }}}}
     >
-      <Wrapped{input} {{...props}}/>
-    </Tooltip>) : <{input} {{...props}}/>
+      <{input} {{...props}} ref={{ref}}/>
+    </Tooltip>
   )
 }}
 """
 
 
-class MaterialComponent(ReactComponent):
+class MaterialComponent(SharedStyleSheetMixin, ReactComponent):
     """
     Baseclass for all MaterialComponents which defines the bundle location,
     the JS dependencies and theming support via the ThemedTransform.
@@ -431,6 +473,7 @@ class MaterialComponent(ReactComponent):
         self, doc: Document, root: Model | None = None,
         parent: Model | None = None, comm: Comm | None = None
     ) -> Model:
+        start = profiler.start()
         model = super()._get_model(doc, root, parent, comm)
         # Ensure model loads ESM and CSS bundles from CDN
         # if requested or if in notebook
@@ -443,6 +486,8 @@ class MaterialComponent(ReactComponent):
                 css_bundle=CDN_DIST.replace('.js', '.css'),
                 esm=CDN_DIST,
             )
+        if start is not None:
+            profiler.record(self, 'get_model', start, model=model)
         return model
 
     def _process_param_change(self, params):
@@ -451,15 +496,42 @@ class MaterialComponent(ReactComponent):
             params['color'] = COLOR_ALIASES.get(color, color)
         return super()._process_param_change(params)
 
+    def _update_properties(self, *events: param.parameterized.Event, doc: Document) -> dict[str, t.Any]:
+        start = profiler.start()
+        props = super()._update_properties(*events, doc=doc)
+        if start is not None:
+            profiler.record(self, 'update_properties', start)
+        return props
+
     def _set_on_model(self, msg: Mapping[str, t.Any], root: Model, model: Model) -> list[str]:
+        start = profiler.start()
+        payload = dict(msg) if start is not None else None
         if 'loading' in msg and isinstance(model, BkReactComponent):
             model.data.loading = msg.pop('loading')
-        return super()._set_on_model(msg, root, model)
+        changing = super()._set_on_model(msg, root, model)
+        if start is not None:
+            profiler.record(self, 'set_on_model', start, payload=payload)
+        return changing
+
+    def _process_bokeh_event(self, doc: Document, event: Event) -> None:
+        start = profiler.start() if isinstance(event, DataEvent) else None
+        super()._process_bokeh_event(doc, event)
+        if start is not None:
+            profiler.record(self, 'handle_msg', start, payload=event.data)
+
+    def _send_msg(self, data: t.Any) -> None:
+        start = profiler.start()
+        super()._send_msg(data)
+        if start is not None:
+            profiler.record(self, 'send_msg', start, payload=data)
 
     def _get_properties(self, doc: Document | None) -> dict[str, t.Any]:
+        start = profiler.start()
         props = super()._get_properties(doc)
         props.pop('loading', None)
         props['data'].loading = self.loading
+        if start is not None:
+            profiler.record(self, 'get_properties', start)
         return props
 
     @property
@@ -470,7 +542,9 @@ class MaterialComponent(ReactComponent):
     def _update_loading(self, *_) -> None:
         pass
 
-    def controls(self, parameters: list[str] | None = None, jslink: bool = True, **kwargs) -> Viewable:  # type: ignore[override]
+    def controls(  # type: ignore[override]
+        self, parameters: list[str] | None = None, jslink: bool = True, lazy: bool = False, **kwargs
+    ) -> Viewable:
         """
         Creates a set of widgets which allow manipulating the parameters
         on this instance. By default all parameters which support
@@ -484,6 +558,10 @@ class MaterialComponent(ReactComponent):
         jslink: bool
            Whether to use jslinks instead of Python based links.
            This does not allow using all types of parameters.
+        lazy: bool
+           Whether to group the parameters into collapsible sections
+           whose widgets are only built once they are expanded, see
+           `panel_material_ui.param.LazyParam`.
         kwargs: dict
            Additional kwargs to pass to the Param pane(s) used to
            generate the controls widgets.
@@ -493,6 +571,7 @@ class MaterialComponent(ReactComponent):
         A layout of the controls
         """
         from .layout import Paper, Tabs
+        from .param import LazyParam
         from .widgets import LiteralInput
 
         parameters = parameters or []
@@ -506,29 +585,32 @@ class MaterialComponent(ReactComponent):
         if 'margin' not in kwargs:
             kwargs['margin'] = 0
 
+        def link(p, widget):
+            if (self._source_transforms.get(p, False) is not None and
+                self._property_mapping.get(p, False) is not None):
+                widget.jslink(self, value=p, bidirectional=p != 'loading')
+            if isinstance(widget, LiteralInput):
+                widget.serializer = 'json'
+
+        if lazy:
+            # Widgets are linked as they are built
+            param_type, kwargs = LazyParam, dict(kwargs, on_widget=link if jslink else None)
+        else:
+            param_type = Param
+
         params = [p for p in linkable if p not in Viewable.param]
-        controls = Param(self.param, parameters=params, default_layout=Paper,
-                         name='Controls', **kwargs)
+        controls = param_type(self.param, parameters=params, default_layout=Paper,
+                              name='Controls', **kwargs)
         layout_params = [p for p in linkable if p in Viewable.param]
         if 'name' not in layout_params and self._property_mapping.get('name', False) is not None and not parameters:
             layout_params.insert(0, 'name')
-        style = Param(self.param, parameters=layout_params, default_layout=Paper,
-                      name='Layout', **kwargs)
-        if jslink:
+        style = param_type(self.param, parameters=layout_params, default_layout=Paper,
+                           name='Layout', **kwargs)
+        if jslink and not lazy:
             for p in params:
-                widget = controls._widgets[p]
-                if (self._source_transforms.get(p, False) is not None and
-                    self._property_mapping.get(p, False) is not None):
-                    widget.jslink(self, value=p, bidirectional=True)
-                if isinstance(widget, LiteralInput):
-                    widget.serializer = 'json'
+                link(p, controls._widgets[p])
             for p in layout_params:
-                widget = style._widgets[p]
-                if (self._source_transforms.get(p, False) is not None and
-                    self._property_mapping.get(p, False) is not None):
-                    widget.jslink(self, value=p, bidirectional=p != 'loading')
-                if isinstance(widget, LiteralInput):
-                    widget.serializer = 'json'
+                link(p, style._widgets[p])
 
         if params and layout_params:
             return Tabs(controls.layout[0], style.layout[0])
@@ -612,7 +694,7 @@ class MaterialComponent(ReactComponent):
         <iframe srcdoc="{escaped_html}" width="100%" height="100%" style="border:{border};"></iframe>
         """, width=width, height=height, **kwargs)
 
-    def api(self, jslink: bool=False, sizing_mode="stretch_width", **kwargs)->Viewable:
+    def api(self, jslink: bool=False, sizing_mode="stretch_width", lazy: bool=False, **kwargs)->Viewable:
         """Returns an interactive component for exploring the API of the widget.
 
         Parameters
@@ -620,6 +702,9 @@ class MaterialComponent(ReactComponent):
         jslink: bool
             Whether to use jslinks instead of Python based links.
             This does not allow using all types of parameters.
+        lazy: bool
+            Whether to only build the widgets of the expanded
+            sections of the parameter editor.
         sizing_mode: str
             Sizing mode for the component.
         kwargs: dict
@@ -634,7 +719,7 @@ class MaterialComponent(ReactComponent):
         import panel_material_ui as pmui
         return pmui.Tabs(
             pn.pane.HTML(self.param, name="Parameter Table", sizing_mode="stretch_width"),
-            pmui.Row(self.controls(jslink=jslink), self, name="Parameter Editor", sizing_mode="stretch_width"),
+            pmui.Row(self.controls(jslink=jslink, lazy=lazy), self, name="Parameter Editor", sizing_mode="stretch_width"),
             sizing_mode=sizing_mode, **kwargs
         )
 
@@ -15,7 +15,7 @@ import Typography from "@mui/material/Typography"
 import CloseIcon from "@mui/icons-material/Close"
 import AttachFileIcon from "@mui/icons-material/AttachFile"
 import TextareaAutosize from "@mui/material/TextareaAutosize"
-import {isFileAccepted, processFilesChunked, apply_flex, waitForRef} from "./utils"
+import {isFileAccepted, processFilesChunked, apply_flex, waitForMessage} from "./utils"
 
 // Map MIME types to Material Icons
 const mimeTypeIcons = {
@@ -221,7 +221,6 @@ export function render({model, view}) {
   const [progress, setProgress] = React.useState(undefined)
   const [file_data, setFileData] = React.useState([])
   const [pending_uploads, setPendingUploads] = model.useState("pending_uploads")
-  const upload_ref = React.useRef(null)
   const file_data_ref = React.useRef(file_data)
 
   // Keep ref and pending_uploads in sync with state
@@ -232,9 +231,7 @@ export function render({model, view}) {
 
   React.useEffect(() => {
     model.on("msg:custom", (msg) => {
-      if (msg.status === "finished") {
-        upload_ref.current = msg
-      } else if (msg.type === "sync") {
+      if (msg.type === "sync") {
         // Programmatically trigger file sync using ref to get current file_data
         syncFilesFromRef()
       } else if (msg.type === "focus") {
@@ -253,13 +250,6 @@ export function render({model, view}) {
     })
   }, [])
 
-  model.on("remove", () => {
-    // If there is an input event in progress when the
-    // component is removed we clear any waitForRef
-    // handlers that depend on it
-    upload_ref.current = {status: "removed"}
-  })
-
   const isSendEvent = (event) => {
     return (event.key === "Enter") && (
       (enter_sends && (!(event.ctrlKey || event.shiftKey))) ||
@@ -288,8 +278,7 @@ export function render({model, view}) {
         model.max_file_size,
         model.max_total_file_size,
         model.chunk_size || 10 * 1024 * 1024,
-        setProgress,
-        upload_ref
+        setProgress
       )
       setFileData([])
       file_data_ref.current = []
@@ -312,12 +301,14 @@ export function render({model, view}) {
         model.max_file_size,
         model.max_total_file_size,
         model.chunk_size || 10 * 1024 * 1024,
-        setProgress,
-        upload_ref
+        setProgress
       )
     }
+    // Resolves once the server has processed the input (or the
+    // component is removed while the input is in progress)
+    const finished = waitForMessage(model, (msg) => msg.status === "finished" || msg.status === "error")
     model.send_msg({type: "input", value: value_input})
-    await waitForRef(upload_ref)
+    await finished
     setFileData([])
     file_data_ref.current = []
     setValueInput("")
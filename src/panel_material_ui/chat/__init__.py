@@ -1,3 +1,4 @@
+from ._executor import CallbackExecutor  # noqa
 from .feed import ChatFeed  # noqa
 from .input import ChatAreaInput  # noqa
 from .interface import ChatInterface  # noqa
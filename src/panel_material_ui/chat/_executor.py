@@ -0,0 +1,210 @@
+"""
+Concurrency control for ChatFeed callbacks.
+
+A CallbackExecutor may be shared by the ChatFeeds of all sessions to
+cap the number of callbacks running at once, queue the callbacks of
+each session and run synchronous callbacks on a thread or process pool
+instead of the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import typing as t
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+from panel.io.state import state
+
+_DONE = object()
+
+
+def _exhaust(callback: Callable[..., Iterator[t.Any]], *args: t.Any, **kwargs: t.Any) -> t.Any:
+    # Generators cannot be returned from another process, so only the
+    # final value yielded by a generator callback is sent back.
+    last = deque(callback(*args, **kwargs), maxlen=1)
+    return last[0] if last else None
+
+
+def _next(iterator: Iterator[t.Any]) -> t.Any:
+    # StopIteration cannot be raised into a Future
+    try:
+        return next(iterator)
+    except StopIteration:
+        return _DONE
+
+
+class _Slots:
+    """
+    An asynchronous semaphore which may be shared between event loops,
+    granting slots to waiters in the order they were requested.
+    """
+
+    def __init__(self, limit: int | None):
+        self.limit = limit
+        self.active = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self.limit is None or (self.active < self.limit and not self._waiters):
+                self.active += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        future = waiter[1]
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over as the waiter was cancelled
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            # Hand the slot over to the next waiter
+            loop, future = self._waiters.popleft()
+        loop.call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future) -> None:
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class CallbackExecutor:
+    """
+    CallbackExecutor runs ChatFeed callbacks with a concurrency limit
+    shared by all the ChatFeeds it is assigned to.
+
+    Share a single instance between sessions, e.g. by defining it at
+    the module level, to cap the number of concurrent backend calls
+    across all sessions.
+
+    Parameters
+    ----------
+    executor: concurrent.futures.Executor | None
+        The executor synchronous callbacks and the steps of synchronous
+        generator callbacks are run on. If None the default executor of
+        the event loop is used. Callbacks run on a ProcessPoolExecutor
+        must be picklable and are called with None in place of the
+        ChatFeed instance; generator callbacks are run to completion
+        and respond with the final value they yield.
+    max_concurrency: int | None
+        The maximum number of callbacks running at once. Further
+        callbacks are queued until a running callback completes.
+    max_session_concurrency: int | None
+        The maximum number of callbacks of a single session running at
+        once. Further callbacks of the session are queued so a session
+        cannot hold more than its share of max_concurrency.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+        max_session_concurrency: int | None = 1,
+    ):
+        for name, value in (('max_concurrency', max_concurrency), ('max_session_concurrency', max_session_concurrency)):
+            if value is not None and value < 1:
+                raise ValueError(f"CallbackExecutor {name} must be at least 1, got {value}.")
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.max_session_concurrency = max_session_concurrency
+        self._slots = _Slots(max_concurrency)
+        self._session_slots: weakref.WeakKeyDictionary[t.Any, _Slots] = weakref.WeakKeyDictionary()
+        self._unbound_slots = _Slots(max_session_concurrency)
+        self._lock = threading.Lock()
+
+    @property
+    def in_process(self) -> bool:
+        """
+        Whether callbacks run in the same process as the ChatFeed.
+        """
+        return not isinstance(self.executor, ProcessPoolExecutor)
+
+    @property
+    def active(self) -> int:
+        """
+        The number of callbacks currently running.
+        """
+        return self._slots.active
+
+    @property
+    def queued(self) -> int:
+        """
+        The number of callbacks waiting for the concurrency limit.
+        """
+        return self._slots.queued
+
+    def _get_session_slots(self) -> _Slots:
+        doc = state.curdoc
+        if doc is None:
+            return self._unbound_slots
+        with self._lock:
+            if doc not in self._session_slots:
+                self._session_slots[doc] = _Slots(self.max_session_concurrency)
+            return self._session_slots[doc]
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Waits for the session and the global concurrency limit, in that
+        order, and holds a slot of both while the context is entered.
+        """
+        session_slots = self._get_session_slots()
+        await session_slots.acquire()
+        try:
+            await self._slots.acquire()
+            try:
+                yield
+            finally:
+                self._slots.release()
+        finally:
+            session_slots.release()
+
+    async def run(self, callback: Callable[..., t.Any], *args: t.Any, **kwargs: t.Any) -> t.Any:
+        """
+        Runs the synchronous callback on the executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(callback, *args, **kwargs))
+
+    async def iterate(self, callback: Callable[..., Iterator[t.Any]], *args: t.Any, **kwargs: t.Any) -> AsyncIterator[t.Any]:
+        """
+        Iterates over the synchronous generator callback, running each
+        step on the executor.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.in_process:
+            yield await loop.run_in_executor(self.executor, partial(_exhaust, callback, *args, **kwargs))
+            return
+        iterator = callback(*args, **kwargs)
+        try:
+            while (value := await loop.run_in_executor(self.executor, _next, iterator)) is not _DONE:
+                yield value
+        finally:
+            try:
+                iterator.close()
+            except ValueError:
+                # The generator is still running a cancelled step
+                pass
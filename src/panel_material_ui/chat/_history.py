@@ -0,0 +1,103 @@
+"""
+Paged access to the message history of a ChatFeed.
+
+A HistorySource wraps a sequence, a callable `fetch(offset, limit)` or
+a (async) iterator of stored messages and returns the messages preceding
+the most recent `offset` messages one page at a time, so a long
+conversation can be restored without materializing all its messages.
+"""
+from __future__ import annotations
+
+import inspect
+import threading
+import typing as t
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sequence
+
+Fetch = Callable[[int, int], Iterable[t.Any] | Awaitable[Iterable[t.Any]]]
+
+
+class HistorySource:
+    """
+    HistorySource fetches pages of older messages from a history
+    provider, ordered from the oldest to the newest message.
+
+    Parameters
+    ----------
+    source: Sequence | Callable[[int, int], Iterable] | Iterable | AsyncIterable
+        A sequence of messages ordered from the oldest to the newest
+        message, a (async) callable returning up to `limit` messages
+        preceding the `offset` most recent messages, ordered from the
+        oldest to the newest message, or a (async) iterator yielding
+        messages from the newest to the oldest message. Since iterators
+        cannot be rewound the messages read from an iterator are kept.
+    """
+
+    def __init__(self, source: t.Any):
+        self._iterator: t.Any = None
+        self._cache: list[t.Any] = []
+        self._fetch: Fetch
+        if isinstance(source, Sequence) and not isinstance(source, str):
+            self._fetch = self._fetch_sequence
+            self._sequence = source
+        elif callable(source):
+            self._fetch = source
+        elif isinstance(source, AsyncIterable):
+            self._iterator = aiter(source)
+            self._fetch = self._fetch_async_iterator
+        elif isinstance(source, Iterable):
+            self._iterator = iter(source)
+            self._fetch = self._fetch_iterator
+        else:
+            raise TypeError(
+                "ChatFeed.history expects a sequence, a callable fetch(offset, limit) "
+                f"or an iterator, got {type(source).__name__}."
+            )
+        self.total: int | None = None
+        self._lock = threading.RLock()
+
+    def _fetch_sequence(self, offset: int, limit: int) -> Sequence[t.Any]:
+        end = len(self._sequence) - offset
+        return self._sequence[max(end - limit, 0):max(end, 0)]
+
+    def _fetch_iterator(self, offset: int, limit: int) -> list[t.Any]:
+        for message in self._iterator:
+            self._cache.append(message)
+            if len(self._cache) >= offset + limit:
+                break
+        return self._cache[offset:offset+limit][::-1]
+
+    async def _fetch_async_iterator(self, offset: int, limit: int) -> list[t.Any]:
+        async for message in self._iterator:
+            self._cache.append(message)
+            if len(self._cache) >= offset + limit:
+                break
+        return self._cache[offset:offset+limit][::-1]
+
+    def _page(self, messages: Iterable[t.Any], offset: int, limit: int) -> list[t.Any]:
+        messages = list(messages)[-limit:]
+        if len(messages) < limit:
+            # The history ends on this page
+            self.total = offset + len(messages)
+        return messages
+
+    def has_more(self, offset: int) -> bool:
+        """
+        Whether there are messages preceding the `offset` most recent
+        messages, which is only known once the start of the history
+        was fetched.
+        """
+        return self.total is None or offset < self.total
+
+    def fetch(self, offset: int, limit: int) -> list[t.Any] | Awaitable[list[t.Any]]:
+        """
+        Returns up to `limit` messages preceding the `offset` most
+        recent messages, or an awaitable if the provider is async.
+        """
+        with self._lock:
+            messages = self._fetch(offset, limit)
+            if inspect.isawaitable(messages):
+                return self._apage(messages, offset, limit)
+            return self._page(messages, offset, limit)
+
+    async def _apage(self, messages: Awaitable[Iterable[t.Any]], offset: int, limit: int) -> list[t.Any]:
+        return self._page(await messages, offset, limit)
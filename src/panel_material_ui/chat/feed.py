@@ -1,10 +1,20 @@
+from __future__ import annotations
+
+import inspect
+import typing as t
+from concurrent.futures import Executor
+from functools import partial
+
 import param
+from panel.chat.feed import CallbackState
 from panel.chat.feed import ChatFeed as _PnChatFeed
 from panel.config import config
 from panel.layout import Column
 
 from ..layout import Card, Feed
 from ..theme import MaterialDesign
+from ._executor import CallbackExecutor
+from ._history import HistorySource
 from .message import ChatMessage
 from .step import ChatStep
 
@@ -36,12 +46,53 @@ class ChatFeed(_PnChatFeed):
 
     >>> chat_feed = ChatFeed(callback=say_welcome, header="Welcome Feed")
     >>> chat_feed.send("Hello World!", user="New User", avatar="😊")
+
+    A long conversation may be restored lazily from a history provider:
+
+    >>> def fetch(offset, limit):
+    >>>     return db.messages(before=offset, limit=limit)
+    >>> chat_feed = ChatFeed(history=fetch, history_retention=200)
+
+    Callbacks of all sessions may share a concurrency limit:
+
+    >>> executor = CallbackExecutor(ThreadPoolExecutor(8), max_concurrency=8)
+    >>> chat_feed = ChatFeed(callback=ask_llm, executor=executor)
     """
 
     dark_theme = param.Boolean(doc="""
         Whether to use dark theme. If not specified, will default to Panel's
         global theme setting.""")
 
+    executor = param.ClassSelector(class_=(CallbackExecutor, Executor), default=None, doc="""
+        Executes the callbacks. A CallbackExecutor shared between
+        sessions caps the number of concurrent callbacks, queues the
+        callbacks of each session and runs synchronous callbacks on its
+        thread or process pool; a concurrent.futures.Executor runs
+        synchronous callbacks on the pool without further limits. Stopping
+        the callback cancels it while queued; a running synchronous
+        callback is stopped at its next yield. If None synchronous
+        callbacks run on the default thread pool.""")
+
+    history = param.Parameter(default=None, doc="""
+        Provider of the message history, which is loaded one page at a
+        time as the chat log is scrolled towards the top, so that only
+        the most recent messages are materialized initially. Either a
+        sequence of messages ordered from the oldest to the newest
+        message, a (async) callable fetch(offset, limit) returning up to
+        limit messages preceding the offset most recent messages, ordered
+        from the oldest to the newest message, or a (async) iterator
+        yielding messages from the newest to the oldest message. Messages
+        may be ChatMessage objects, dicts of ChatMessage parameters or
+        message objects.""")
+
+    history_page_size = param.Integer(default=20, bounds=(1, None), doc="""
+        The number of messages loaded from the history at a time.""")
+
+    history_retention = param.Integer(default=None, bounds=(1, None), doc="""
+        The maximum number of history messages kept above the visible
+        messages, at least the load_buffer. Messages further away are
+        disposed and loaded from the history again when scrolled back to.""")
+
     theme_config = param.Dict(default=None, nested_refs=True, doc="""
         Options to configure the ThemeProvider.
         See https://mui.com/material-ui/customization/theme-overview/ for more information.""")
@@ -62,12 +113,125 @@ class ChatFeed(_PnChatFeed):
             params['dark_theme'] = config.theme == 'dark'
         if 'design' not in params:
             params['design'] = MaterialDesign
+        # The number of history messages at the start of the chat log
+        self._history_loaded = 0
+        self._history_loading = False
+        self._history_source: HistorySource | None = None
         super().__init__(*objects, **params)
         self._card.param.update(
             dark_theme=self.param.dark_theme,
             sx=self.param.sx.rx.pipe(lambda v: dict(CARD_SX, **v) if v else CARD_SX),
             theme_config=self.param.theme_config,
         )
+        self._chat_log.param.watch(self._update_history_window, 'visible_range')
+        self._init_history()
+
+    @param.depends('history', watch=True)
+    def _init_history(self):
+        loaded = min(self._history_loaded, len(self._chat_log.objects))
+        if loaded:
+            self._chat_log._shift_window(-loaded)
+            self._chat_log.objects = self._chat_log.objects[loaded:]
+        self._history_loaded = 0
+        self._history_source = None if self.history is None else HistorySource(self.history)
+        self._load_history()
+
+    def _load_history(self):
+        source = self._history_source
+        self._history_loaded = min(self._history_loaded, len(self._chat_log.objects))
+        if source is None or self._history_loading or not source.has_more(self._history_loaded):
+            return
+        messages = source.fetch(self._history_loaded, self.history_page_size)
+        if inspect.isawaitable(messages):
+            self._history_loading = True
+            param.parameterized.async_executor(partial(self._await_history, source, messages))
+        else:
+            self._prepend_history(messages)
+
+    async def _await_history(self, source: HistorySource, messages: t.Awaitable[list[t.Any]]):
+        try:
+            messages = await messages
+        finally:
+            self._history_loading = False
+        if source is self._history_source:
+            self._prepend_history(messages)
+
+    def _prepend_history(self, messages: list[t.Any]):
+        if not messages:
+            return
+        built = []
+        for message in messages:
+            if isinstance(message, self._message_type):
+                built.append(message)
+            elif isinstance(message, dict):
+                built.append(self._build_message(dict(message)))
+            else:
+                built.append(self._build_message({"object": message}))
+        self._history_loaded += len(built)
+        # Keep the rendered messages in place as older messages are added
+        self._chat_log._shift_window(len(built))
+        self._chat_log.objects = built + self._chat_log.objects
+
+    def _update_history_window(self, event: param.parameterized.Event):
+        if event.new is None or self._history_source is None:
+            return
+        start = event.new[0]
+        if start <= self._chat_log.load_buffer // 2:
+            self._load_history()
+        elif self.history_retention is not None:
+            retention = max(self.history_retention, self._chat_log.load_buffer)
+            excess = min(start - retention, self._history_loaded)
+            # Dispose of whole pages to avoid reloading on every scroll
+            if excess >= self.history_page_size:
+                self._history_loaded -= excess
+                self._chat_log._shift_window(-excess)
+                self._chat_log.objects = self._chat_log.objects[excess:]
+
+    def undo(self, count: int = 1) -> list[t.Any]:
+        undone = super().undo(count)
+        self._history_loaded = min(self._history_loaded, len(self._chat_log.objects))
+        return undone
+
+    def clear(self) -> list[t.Any]:
+        # The cleared history is not reloaded until history is set again
+        self._history_source = None
+        self._history_loaded = 0
+        return super().clear()
+
+    @param.depends('executor', watch=True, on_init=True)
+    def _update_executor(self):
+        if isinstance(self.executor, Executor):
+            self._callback_executor = CallbackExecutor(
+                self.executor, max_session_concurrency=None
+            )
+        else:
+            self._callback_executor = self.executor
+
+    async def _handle_callback(self, message, loop, callback_id):
+        executor = self._callback_executor
+        if executor is None:
+            return await super()._handle_callback(message, loop, callback_id)
+        async with executor.slot():
+            if not self._is_current_task(callback_id):
+                return None
+            callback_args, callback_kwargs = self._gather_callback_args(message)
+            if not executor.in_process:
+                # The ChatFeed cannot be sent to another process
+                callback_args = tuple(None if arg is self else arg for arg in callback_args)
+                if 'instance' in callback_kwargs:
+                    callback_kwargs['instance'] = None
+            if inspect.iscoroutinefunction(self.callback):
+                response = await self.callback(*callback_args, **callback_kwargs)
+            elif inspect.isasyncgenfunction(self.callback):
+                response = self.callback(*callback_args, **callback_kwargs)
+            elif inspect.isgeneratorfunction(self.callback):
+                response = executor.iterate(self.callback, *callback_args, **callback_kwargs)
+            else:
+                response = await executor.run(self.callback, *callback_args, **callback_kwargs)
+            await self._serialize_response(response, callback_id)
+        self._callback_ids = set()
+        self._callback_state = CallbackState.IDLE
+        return response
 
     def _build_steps_layout(self, step, layout_params, default_layout):
         layout_params = layout_params or {}
@@ -15,15 +15,17 @@ from panel.layout import Panel, Row
 from panel.pane import Placeholder
 from panel.pane import panel as as_panel
 from panel.pane.image import FileBase, Image, ImageBase
-from panel.pane.markup import HTMLBasePane
+from panel.pane.markup import HTMLBasePane, Markdown
 from panel.util import isfile
 from panel.viewable import Child
 from panel.widgets import Widget
 
+from .._markdown import CachedMarkdown
+from .._stylesheets import register_stylesheet
 from ..base import MaterialComponent
 from .input import ChatAreaInput
 
-_MESSAGE_STYLESHEET = (
+_MESSAGE_STYLESHEET = register_stylesheet(
     ":host(.message), .message { background-color: unset !important; box-shadow: unset !important; font-size: 1.1em; padding-inline: 8px; }"
     " .MuiPaper-root:has(.edit-area) { width: 100% !important; }"
     ".edit-area { height: unset; }"
@@ -99,6 +101,7 @@ class ChatMessage(MaterialComponent, ChatMessage):  # type: ignore[no-redef]
 
     def __init__(self, object=None, **params):
         self._exit_stack = ExitStack()
+        self._stylesheets_cache: tuple[list[t.Any], list[t.Any]] | None = None
         if 'placement' not in params and ChatMessage.placement is None:
             user = params.get('user', ChatMessage.user).lower()
             params['placement'] = 'right' if user == 'user' else 'left'
@@ -202,24 +205,47 @@ class ChatMessage(MaterialComponent, ChatMessage):  # type: ignore[no-redef]
         self._edit_area.param.watch(self._submit_edit, "enter_pressed")
         self._composite = Row()
 
+    def _create_panel(self, value, old=None):
+        object_panel = super()._create_panel(value, old=old)
+        if type(object_panel) is Markdown:
+            # Render Markdown through the shared render cache, which also
+            # re-parses only the trailing block while a message is streamed
+            params = {k: v for k, v in object_panel.param.values().items() if k != 'name'}
+            object_panel = CachedMarkdown(**params)
+        return object_panel
+
+    def _message_stylesheets(self) -> list[t.Any]:
+        """
+        The stylesheets applied to the components rendered in the
+        message. Only the static message stylesheet is shared across
+        all components in the document, user supplied CSS is applied
+        as is so the shared registry does not grow with user content.
+        """
+        stylesheets = self.stylesheets
+        cached = self._stylesheets_cache
+        if cached is None or cached[0] is not stylesheets:
+            cached = self._stylesheets_cache = (
+                stylesheets, [*self._stylesheets, *stylesheets, _MESSAGE_STYLESHEET]
+            )
+        return cached[1]
+
     def _include_styles(self, obj):
         obj = as_panel(obj)
-        combined = self._stylesheets + self.stylesheets + [_MESSAGE_STYLESHEET]
+        combined = self._message_stylesheets()
         for o in obj.select():
-            params = {
-                "stylesheets": [
-                    stylesheet for stylesheet in combined
-                    if stylesheet not in o.stylesheets
-                ] + o.stylesheets
-            }
+            params = {}
+            existing = set(o.stylesheets)
+            missing = [stylesheet for stylesheet in combined if stylesheet not in existing]
+            if missing:
+                params["stylesheets"] = missing + o.stylesheets
             is_markup = isinstance(o, HTMLBasePane) and not isinstance(o, FileBase)
             if is_markup:
-                params["sizing_mode"] = None
+                if o.sizing_mode is not None:
+                    params["sizing_mode"] = None
                 if not o.css_classes and len(str(o.object)) > 0:  # only show a background if there is content
-                    params["css_classes"] = [
-                        *(css for css in o.css_classes if css != "message"), "message"
-                    ]
-            o.param.update(**params)
+                    params["css_classes"] = ["message"]
+            if params:
+                o.param.update(**params)
 
     def _process_param_change(self, params):
         params = super()._process_param_change(params)
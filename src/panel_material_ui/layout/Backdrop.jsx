@@ -6,9 +6,10 @@ export function render({model, view}) {
   const [open] = model.useState("open")
   const [sx] = model.useState("sx")
   const objects = model.get_child("objects")
+  const transition = {onExited: () => model.send_msg({type: "exited"})}
 
   return (
-    <Backdrop open={open} sx={sx ? [BACKDROP_BASE_SX, sx] : BACKDROP_BASE_SX}>
+    <Backdrop open={open} slotProps={{transition}} sx={sx ? [BACKDROP_BASE_SX, sx] : BACKDROP_BASE_SX}>
       {objects}
     </Backdrop>
   );
@@ -16,6 +16,7 @@ export function render({model, view}) {
   const [title_variant] = model.useState("title_variant")
   const [width_option] = model.useState("width_option")
   const objects = model.get_child("objects")
+  const transition = {onExited: () => model.send_msg({type: "exited"})}
 
   return (
     <Dialog
@@ -26,6 +27,7 @@ export function render({model, view}) {
       open={open}
       onClose={() => close_on_click && setOpen(false)}
       scroll={scroll}
+      slotProps={{transition}}
       sx={sx}
     >
       {(title || show_close_button) &&
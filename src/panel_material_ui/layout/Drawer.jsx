@@ -96,6 +96,7 @@ export function render({model, view}) {
   const [sx] = model.useState("sx")
   const [variant] = model.useState("variant")
   const objects = model.get_child("objects")
+  const transition = {onExited: () => model.send_msg({type: "exited"})}
 
   const isDocked = variant === "docked"
   const isHorizontal = anchor === "left" || anchor === "right"
@@ -188,7 +189,7 @@ export function render({model, view}) {
               anchor={anchor}
               open={open}
               onClose={() => setOpen(false)}
-              slotProps={{paper: {sx: [dims, {overflow: "visible"}, sx || {}]}}}
+              slotProps={{paper: {sx: [dims, {overflow: "visible"}, sx || {}]}, transition}}
               variant="persistent"
               sx={{"& .MuiDrawer-root": {position: "absolute"}, "& .MuiPaper-root": {position: "absolute"}}}
             >
@@ -233,7 +234,7 @@ export function render({model, view}) {
             anchor={anchor}
             open={open}
             onClose={() => setOpen(false)}
-            slotProps={{paper: {sx: [dims, {overflow: "visible"}, sx || {}]}}}
+            slotProps={{paper: {sx: [dims, {overflow: "visible"}, sx || {}]}, transition}}
             variant="persistent"
           >
             {objects.map((object, index) => {
@@ -253,7 +254,7 @@ export function render({model, view}) {
   // For temporary / persistent / permanent: use MUI Drawer directly.
   // When inline, render inside the parent's flow (position: relative container) so
   // siblings are pushed rather than overlaid.
-  const slotProps = {paper: {sx: [dims, sx || {}]}}
+  const slotProps = {paper: {sx: [dims, sx || {}]}, transition}
   if (inline) {
     return (
       <div style={{position: "relative", overflow: "hidden", [isHorizontal ? "height" : "width"]: "100%"}}>
@@ -4,6 +4,10 @@ import {
   update_scroll_button, use_latest_scroll_settlement
 } from "./utils"
 
+// Delay before measured heights are reported to the server, batching
+// the resizes of children which are still being laid out
+const HEIGHT_REPORT_DELAY = 250
+
 const FEED_BASE_SX = {
   minHeight: "100%",
   display: "flex",
@@ -18,6 +22,7 @@ export function render({model, view, el}) {
   const [scroll_button_threshold] = model.useState("scroll_button_threshold")
   const [scroll_index] = model.useState("scroll_index")
   const [scroll_position, setScrollPosition] = model.useState("scroll_position")
+  const [spacer_heights] = model.useState("spacer_heights")
   const [view_latest] = model.useState("view_latest")
   const [visibleChildren, setVisibleChildren] = model.useState("visible_children")
   const objects = model.get_child("objects")
@@ -34,6 +39,11 @@ export function render({model, view, el}) {
   const layoutUpdatedRef = React.useRef(false)
   const observerRef = React.useRef(null)
   const observedNodesRef = React.useRef(new Map())
+  // Heights of the children keyed by id, kept when they are unloaded
+  const heightsRef = React.useRef(new Map())
+  const pendingHeightsRef = React.useRef({})
+  const heightTimerRef = React.useRef(null)
+  const sizeObserverRef = React.useRef(null)
 
   el.style.width = "100%"
 
@@ -190,12 +200,42 @@ export function render({model, view, el}) {
       initialLatestDoneRef.current = true
       syncLatestVisibleChild()
     }
-    const frameId = requestAnimationFrame(() => {
-      startScrollLatestSettlement(settleInitialLatest)
-    })
-    return () => cancelAnimationFrame(frameId)
+    startScrollLatestSettlement(settleInitialLatest)
   }, [view_latest])
 
+  React.useEffect(() => {
+    const reportHeights = () => {
+      heightTimerRef.current = null
+      const heights = pendingHeightsRef.current
+      pendingHeightsRef.current = {}
+      model.send_msg({type: "heights", heights})
+    }
+    const observer = new ResizeObserver((entries) => {
+      for (const entry of entries) {
+        const id = entry.target.getAttribute("data-feed-child-id")
+        const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.offsetHeight
+        if (!id || !height || Math.abs((heightsRef.current.get(id) ?? 0) - height) < 1) {
+          continue
+        }
+        heightsRef.current.set(id, height)
+        pendingHeightsRef.current[id] = height
+        if (heightTimerRef.current === null) {
+          heightTimerRef.current = setTimeout(reportHeights, HEIGHT_REPORT_DELAY)
+        }
+      }
+    })
+    sizeObserverRef.current = observer
+    for (const node of wrappersRef.current.values()) {
+      observer.observe(node)
+    }
+    return () => {
+      clearTimeout(heightTimerRef.current)
+      heightTimerRef.current = null
+      observer.disconnect()
+      sizeObserverRef.current = null
+    }
+  }, [])
+
   React.useEffect(() => {
     const handler = () => {
       layoutUpdatedRef.current = true
@@ -339,6 +379,7 @@ export function render({model, view, el}) {
 
   return (
     <Box ref={setBoxRef} sx={boxSx}>
+      {spacer_heights?.[0] > 0 && <div aria-hidden="true" style={{height: spacer_heights[0]}} />}
       {objects.map((object, index) => {
         const childModel = model.objects[index]
         const childId = childModel?.id ?? `${index}`
@@ -348,10 +389,13 @@ export function render({model, view, el}) {
             key={childId}
             data-feed-child-id={childId}
             ref={(node) => {
+              const current = wrappersRef.current.get(childId)
               if (node) {
                 wrappersRef.current.set(childId, node)
-              } else {
+                sizeObserverRef.current?.observe(node)
+              } else if (current) {
                 wrappersRef.current.delete(childId)
+                sizeObserverRef.current?.unobserve(current)
               }
             }}
           >
@@ -359,6 +403,7 @@ export function render({model, view, el}) {
           </div>
         )
       })}
+      {spacer_heights?.[1] > 0 && <div aria-hidden="true" style={{height: spacer_heights[1]}} />}
       {scroll_button_threshold > 0 && (
         <div
           role="button"
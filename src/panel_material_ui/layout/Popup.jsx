@@ -12,6 +12,7 @@ export function render({model, view}, ref) {
   const [sx] = model.useState("sx")
   const [transform_origin] = model.useState("transform_origin")
   const objects = model.get_child("objects")
+  const transition = {onExited: () => model.send_msg({type: "exited"})}
 
   const anchorEl = view.parent?.child_views.includes(view) ? view.parent.el : null
 
@@ -38,6 +39,7 @@ export function render({model, view}, ref) {
       hideBackdrop={hide_backdrop}
       onClose={() => close_on_click && setOpen(false)}
       open={open}
+      slotProps={{transition}}
       sx={sx}
       transformOrigin={transform_origin ?? undefined}
     >
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import typing as t
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import accumulate
 
 import param
 from bokeh.models import Spacer as BkSpacer
@@ -26,6 +28,7 @@ if t.TYPE_CHECKING:
     from bokeh.model import Model
     from bokeh.models.ui.ui_element import UIElement
     from pyviz_comms import Comm
+    from typing_extensions import Self
 
 
 class MaterialLayout(MaterialComponent, SizingModeMixin):
@@ -85,12 +88,18 @@ class MaterialListLike(MaterialLayout, ListLike):
         return super()._process_param_change(params)
 
 
+_MUTATORS = {'append', 'clear', 'extend', 'insert', 'pop', 'remove', 'reverse', '__setitem__'}
+
+
 class MaterialNamedListLike(MaterialLayout, NamedListLike):
 
     _names = param.List(default=[])
 
     _headers = Children()
 
+    # Pending objects, headers and names while mutations are batched
+    _batched: tuple[list[Viewable], list[Viewable | None], list[str]] | None = None
+
     __abstract = True
 
     def __init__(self, *items: list[t.Any | tuple[str, t.Any]], **params: t.Any):
@@ -139,13 +148,88 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
             return objs, headers, names
         return objs, names
 
+    def _pending(self) -> tuple[list[Viewable], list[Viewable | None], list[str]]:
+        """
+        Returns the objects, headers and names to mutate, i.e. the
+        pending state of a batch or copies of the current state.
+        """
+        if self._batched is not None:
+            return self._batched
+        return list(self.objects), list(self._headers), list(self._names)
+
+    def _commit(self, objects: list[Viewable], headers: list[Viewable | None], names: list[str]) -> None:
+        """
+        Applies the mutated state, unless mutations are being batched.
+        """
+        if self._batched is not None:
+            return
+        with param.discard_events(self):
+            self._headers = headers
+            self._names = names
+        # Triggers the update of the names and headers once
+        self.objects = objects
+
+    @contextmanager
+    def batch(self) -> Iterator[Self]:
+        """
+        Context manager which applies all mutations made within it in a
+        single update, ensuring the frontend is only updated once. If
+        an exception is raised none of the mutations are applied.
+
+        >>> with accordion.batch():
+        ...     for i in range(100):
+        ...         accordion.append((f'Card {i}', f'Content {i}'))
+        """
+        if self._batched is not None:
+            yield self
+            return
+        self._batched = self._pending()
+        try:
+            yield self
+        except BaseException:
+            self._batched = None
+            raise
+        objects, headers, names = self._batched
+        self._batched = None
+        self._commit(objects, headers, names)
+
+    def apply_changes(self, changes: Iterable[tuple[t.Any, ...]]) -> None:
+        """
+        Applies a list of mutations in a single update.
+
+        Parameters
+        ----------
+        changes (list): List of tuples of the name of a mutating method,
+          i.e. one of 'append', 'clear', 'extend', 'insert', 'pop',
+          'remove', 'reverse' or '__setitem__', and its arguments.
+
+        >>> tabs.apply_changes([('pop', 0), ('append', ('New', 'Content'))])
+        """
+        with self.batch():
+            for method, *args in changes:
+                if method not in _MUTATORS:
+                    raise ValueError(
+                        f'{type(self).__name__}.apply_changes does not support {method!r}, '
+                        f'expected one of {sorted(_MUTATORS)}.'
+                    )
+                getattr(self, method)(*args)
+
+    def __getitem__(self, index) -> Viewable | list[Viewable]:
+        return (self.objects if self._batched is None else self._batched[0])[index]
+
+    def __iter__(self) -> Iterator[Viewable]:
+        yield from (self.objects if self._batched is None else self._batched[0])
+
+    def __len__(self) -> int:
+        return len(self.objects if self._batched is None else self._batched[0])
+
     def __setitem__(self, index, panes):
-        new_objects = list(self)
+        objects, headers, names = self._pending()
         if isinstance(index, slice):
-            new_objects[index], self._headers[index], self._names[index] = self._to_objects_and_names(panes)
+            objects[index], headers[index], names[index] = self._to_objects_and_names(panes)
         else:
-            new_objects[index], self._headers[index], self._names[index] = self._to_object_and_name(panes)
-        self.objects = new_objects
+            objects[index], headers[index], names[index] = self._to_object_and_name(panes)
+        self._commit(objects, headers, names)
 
     def append(self, pane: t.Any) -> None:
         """
@@ -156,19 +240,21 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         obj (object): Panel component to add as a tab.
         """
         new_object, new_header, new_name = self._to_object_and_name(pane)
-        new_objects = list(self)
-        new_objects.append(new_object)
-        self._names.append(new_name)
-        self._headers.append(new_header)
-        self.objects = new_objects
+        objects, headers, names = self._pending()
+        objects.append(new_object)
+        names.append(new_name)
+        headers.append(new_header)
+        self._commit(objects, headers, names)
 
     def clear(self) -> None:
         """
         Clears the tabs.
         """
-        self._names = []
-        self._headers = []
-        self.objects = []
+        objects, headers, names = self._pending()
+        objects.clear()
+        headers.clear()
+        names.clear()
+        self._commit(objects, headers, names)
 
     def extend(self, panes: Iterable[t.Any]) -> None:
         """
@@ -179,11 +265,11 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         objects (list): List of panel components to add as tabs.
         """
         new_objects, new_headers, new_names = self._to_objects_and_names(panes)
-        objects = list(self)
+        objects, headers, names = self._pending()
         objects.extend(new_objects)
-        self._names.extend(new_names)
-        self._headers.extend(new_headers)
-        self.objects = objects
+        names.extend(new_names)
+        headers.extend(new_headers)
+        self._commit(objects, headers, names)
 
     def insert(self, index: int, pane: t.Any) -> None:
         """
@@ -195,11 +281,11 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         object (object): Panel components to insert as tabs.
         """
         new_object, new_header, new_name = self._to_object_and_name(pane)
-        new_objects = list(self.objects)
-        new_objects.insert(index, new_object)
-        self._headers.insert(index, new_header)
-        self._names.insert(index, new_name)
-        self.objects = new_objects
+        objects, headers, names = self._pending()
+        objects.insert(index, new_object)
+        headers.insert(index, new_header)
+        names.insert(index, new_name)
+        self._commit(objects, headers, names)
 
     def pop(self, index: int = -1) -> Viewable:
         """
@@ -209,11 +295,11 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         ----------
         index (int): The index of the item to pop from the tabs.
         """
-        new_objects = list(self)
-        obj = new_objects.pop(index)
-        self._names.pop(index)
-        self._headers.pop(index)
-        self.objects = new_objects
+        objects, headers, names = self._pending()
+        obj = objects.pop(index)
+        names.pop(index)
+        headers.pop(index)
+        self._commit(objects, headers, names)
         return obj
 
     def remove(self, pane: Viewable) -> None:
@@ -224,13 +310,13 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         ----------
         obj (object): The object to remove from the tabs.
         """
-        new_objects = list(self)
-        if pane in new_objects:
-            index = new_objects.index(pane)
-            new_objects.remove(pane)
-            self._names.pop(index)
-            self._headers.pop(index)
-            self.objects = new_objects
+        objects, headers, names = self._pending()
+        if pane in objects:
+            index = objects.index(pane)
+            objects.pop(index)
+            names.pop(index)
+            headers.pop(index)
+            self._commit(objects, headers, names)
         else:
             raise ValueError(f'{pane!r} is not in list')
 
@@ -238,11 +324,11 @@ class MaterialNamedListLike(MaterialLayout, NamedListLike):
         """
         Reverses the tabs.
         """
-        new_objects = list(self)
-        new_objects.reverse()
-        self._names.reverse()
-        self._headers.reverse()
-        self.objects = new_objects
+        objects, headers, names = self._pending()
+        objects.reverse()
+        names.reverse()
+        headers.reverse()
+        self._commit(objects, headers, names)
 
 
 class Column(MaterialListLike):
@@ -312,8 +398,17 @@ class Column(MaterialListLike):
 class Feed(Column):
     """
     The `Feed` layout is a buffered `Column` optimized for long, dynamic lists.
+
+    Only the objects around the visible objects are rendered, the
+    unloaded objects are replaced with spacers sized using the heights
+    measured when the objects were last rendered, so the scroll
+    position remains stable as objects are loaded and unloaded.
     """
 
+    estimated_height = param.Number(default=None, bounds=(0, None), doc="""
+        The height in pixels assumed for objects which have not been
+        rendered yet. Defaults to the mean height of the rendered objects.""")
+
     load_buffer = param.Integer(default=10, bounds=(0, None), doc="""
         The number of objects loaded on each side of the visible objects.
         When scrolled halfway into the buffer, the feed will automatically
@@ -332,6 +427,10 @@ class Feed(Column):
         If True, will only add scrollbars in the direction of the container,
         (e.g. Column: vertical, Row: horizontal).""")  # type: ignore[assignment]
 
+    spacer_heights = param.NumericTuple(default=(0, 0), length=2, doc="""
+        Internal heights in pixels of the spacers standing in for the
+        unloaded objects before and after the rendered objects.""")
+
     visible_children = param.List(default=[], item_type=str, doc="""
         Internal list of currently visible frontend child model ids.""")
 
@@ -341,7 +440,8 @@ class Feed(Column):
 
     _esm_base = "Feed.jsx"
     _rename: t.ClassVar[dict[str, str | None]] = {
-        **Column._rename, "load_buffer": None, "visible_range": None,
+        **Column._rename, "estimated_height": None, "load_buffer": None,
+        "visible_range": None,
     }
 
     def __init__(self, *objects, **params):
@@ -354,7 +454,10 @@ class Feed(Column):
 
         super().__init__(*objects, **params)
         self._last_synced: tuple[int, int] | None = None
+        # Measured heights of the objects keyed by object id
+        self._heights: dict[int, float] = {}
         self.param.watch(self._trigger_view_latest, "objects")
+        self.param.watch(self._prune_heights, "objects")
 
     @param.depends("visible_range", "load_buffer", watch=True)
     def _trigger_get_objects(self):
@@ -376,6 +479,70 @@ class Feed(Column):
         if top_trigger or bottom_trigger or invalid_trigger:
             self.param.trigger("objects")
 
+    @param.depends("scroll_position", watch=True)
+    def _jump_to_scroll_position(self):
+        # Scrolling into a spacer, e.g. by dragging the scrollbar,
+        # shows no loaded objects, so load the objects at the position
+        if self._last_synced is None or not self._heights:
+            return
+        start, end = self._last_synced
+        top = self.spacer_heights[0]
+        bottom = top + sum(self._object_heights(start, end))
+        if top <= self.scroll_position <= bottom:
+            return
+        # The first object ending below the scroll position, else the last
+        offsets = accumulate(self._object_heights(0, len(self.objects)))
+        index = next(
+            (i for i, offset in enumerate(offsets) if offset > self.scroll_position),
+            max(len(self.objects) - 1, 0)
+        )
+        n_visible = self.visible_range[-1] - self.visible_range[0] if self.visible_range else 1
+        with edit_readonly(self):
+            self.visible_range = (index, min(index + max(n_visible, 1), len(self.objects)))
+
+    def _prune_heights(self, event):
+        if event.type == "triggered":
+            return
+        ids = {id(obj) for obj in event.new}
+        self._heights = {k: h for k, h in self._heights.items() if k in ids}
+
+    def _shift_window(self, n: int) -> None:
+        """
+        Shifts the visible and synced range by n objects, keeping the
+        window on the same objects when n objects are prepended (n > 0)
+        or removed from the start (n < 0).
+        """
+        def shift(r):
+            return (max(r[0] + n, 0), max(r[-1] + n, 0))
+        if self.visible_range:
+            with edit_readonly(self), param.discard_events(self):
+                self.visible_range = shift(self.visible_range)
+        if self._last_synced is not None:
+            self._last_synced = shift(self._last_synced)
+
+    def _object_heights(self, start: int, end: int) -> list[float]:
+        """
+        Returns the measured or estimated heights of the objects
+        between the start and end index.
+        """
+        if self.estimated_height is not None:
+            estimate = self.estimated_height
+        elif self._heights:
+            estimate = sum(self._heights.values()) / len(self._heights)
+        else:
+            estimate = 0
+        return [self._heights.get(id(obj), estimate) for obj in self.objects[start:end]]
+
+    def _update_spacers(self) -> tuple[int, int]:
+        start, end = self._synced_range
+        spacers = (
+            round(sum(self._object_heights(0, start))),
+            round(sum(self._object_heights(end, len(self.objects)))),
+        )
+        with param.discard_events(self):
+            self.spacer_heights = spacers
+        return spacers
+
     def _trigger_view_latest(self, event):
         if (
             event.type == "triggered" or not self.view_latest or
@@ -423,6 +590,22 @@ class Feed(Column):
         msg.pop("visible_range", None)
         return super()._process_param_change(msg)
 
+    def _get_model(
+        self, doc: Document, root: Model | None = None,
+        parent: Model | None = None, comm: Comm | None = None
+    ) -> Model:
+        self._update_spacers()
+        return super()._get_model(doc, root, parent, comm)
+
+    def _update_model(
+        self, events: dict[str, param.parameterized.Event], msg: dict[str, t.Any],
+        root: Model, model: Model, doc: Document, comm: Comm | None
+    ) -> None:
+        if "objects" in events:
+            # Resize the spacers in the same update as the objects
+            msg = dict(msg, spacer_heights=self._update_spacers())
+        super()._update_model(events, msg, root, model, doc, comm)
+
     def _get_child_model(  # type: ignore[return-value]
         self, child: Viewable, doc: Document, root: Model, parent: Model,
         comm: Comm | None
@@ -491,6 +674,15 @@ class Feed(Column):
     def _handle_msg(self, msg: dict[str, t.Any]) -> None:
         if msg.get("type") == "request_latest":
             self.scroll_to_latest(scroll_limit=msg.get("scroll_limit"))
+        elif msg.get("type") == "heights" and self._last_synced is not None:
+            loaded = {
+                model.ref["id"]: obj
+                for obj in self.objects[slice(*self._last_synced)]
+                for model, _ in obj._models.values()
+            }
+            for ref, height in msg.get("heights", {}).items():
+                if ref in loaded:
+                    self._heights[id(loaded[ref])] = height
 
     def scroll_to_latest(self, scroll_limit: float | None = None) -> None:
         """
@@ -803,7 +995,9 @@ class Accordion(MaterialNamedListLike, PaperMixin):
 
     `Accordion` has a list-like API that allows
     interactively updating and modifying the cards using the methods `append`,
-    `extend`, `clear`, `insert`, `pop`, `remove` and `__setitem__`.
+    `extend`, `clear`, `insert`, `pop`, `remove` and `__setitem__`. Multiple
+    modifications can be applied in a single update using the `batch` context
+    manager or `apply_changes`.
 
     :References:
 
@@ -862,6 +1056,8 @@ class Tabs(MaterialNamedListLike):
     Like `Accordion`, `Tabs` has a list-like API with methods to
     `append`, `extend`, `clear`, `insert`, `pop`, `remove` and `__setitem__`,
     which make it possible to interactively update and modify the tabs.
+    Multiple modifications can be applied in a single update using the
+    `batch` context manager or `apply_changes`.
 
     :References:
 
@@ -1018,7 +1214,80 @@ class Alert(MaterialListLike):
         return super()._process_param_change(params)
 
 
-class Backdrop(MaterialListLike):
+class MaterialOverlay(MaterialListLike):
+    """
+    Baseclass for overlays, such as dialogs and drawers, whose contents
+    are only displayed while they are open.
+
+    In `lazy` mode the models of the contents are only created once the
+    overlay is first opened, ensuring that overlays which are never
+    opened do not contribute to the size of the initial document or to
+    the memory held by a session.
+    """
+
+    destroy_on_close = param.Boolean(default=False, doc="""
+        Whether to destroy the models of the contents once the overlay
+        has finished closing, they are recreated when it is reopened.
+        Only applies if `lazy` is enabled.""")
+
+    lazy = param.Boolean(default=False, doc="""
+        Whether to defer creating the contents until the overlay is
+        first opened.""")
+
+    open = param.Boolean(default=False, doc="""
+        Whether the overlay is open.""")
+
+    __abstract = True
+
+    _rename: t.ClassVar[dict[str, str | None]] = {
+        **MaterialListLike._rename, "destroy_on_close": None, "lazy": None,
+    }
+
+    # Parameters which determine whether the contents are displayed
+    _shown_params: t.ClassVar[list[str]] = ["open"]
+
+    def __init__(self, *objects, **params):
+        super().__init__(*objects, **params)
+        self._mounted = self._shown or not self.lazy
+        self.param.watch(self._update_mounted, ["lazy", *self._shown_params])
+
+    @property
+    def _shown(self) -> bool:
+        return self.open
+
+    def _update_mounted(self, *events: param.parameterized.Event) -> None:
+        if self._shown or not self.lazy:
+            if not self._mounted:
+                self._mounted = True
+                self.param.trigger("objects")
+        elif not self._models:
+            # Nothing is rendered so there is no closing transition to wait for
+            self._unmount()
+
+    def _unmount(self) -> None:
+        if not self._mounted or self._shown or not (self.lazy and self.destroy_on_close):
+            return
+        self._mounted = False
+        self.param.trigger("objects")
+
+    def _handle_msg(self, msg: dict[str, t.Any]) -> None:
+        if msg.get("type") == "exited":
+            self._unmount()
+
+    def _get_child_model(
+        self, child: Viewable, doc: Document, root: Model, parent: Model,
+        comm: Comm | None
+    ) -> tuple[list[UIElement] | UIElement | None, list[UIElement]]:
+        if child is not self.objects or self._mounted:
+            return super()._get_child_model(child, doc, root, parent, comm)
+        ref = root.ref["id"]
+        for obj in child:
+            if ref in obj._models:
+                obj._cleanup(root)
+        return [], []
+
+
+class Backdrop(MaterialOverlay):
     """
     The `Backdrop` component can be used to create a semi-transparent overlay over the application's UI.
     It is often used to focus attention on a specific part of the interface,
@@ -1042,7 +1311,7 @@ class Backdrop(MaterialListLike):
     _esm_base = "Backdrop.jsx"
 
 
-class Dialog(MaterialListLike):
+class Dialog(MaterialOverlay):
     """
     The `Dialog` can be used to display important content in a modal-like overlay that requires
     user interaction. It is often used for tasks such as confirmations, forms, or displaying
@@ -1087,7 +1356,7 @@ class Dialog(MaterialListLike):
     _esm_base = "Dialog.jsx"
 
 
-class Drawer(MaterialListLike):
+class Drawer(MaterialOverlay):
     """
     The `Drawer` component can be used to display important content in a modal-like overlay that requires
     user interaction. It is often used for tasks such as confirmations, forms, or displaying
@@ -1133,6 +1402,12 @@ class Drawer(MaterialListLike):
 
     _esm_base = "Drawer.jsx"
 
+    _shown_params: t.ClassVar[list[str]] = ["open", "variant"]
+
+    @property
+    def _shown(self) -> bool:
+        return self.open or self.variant == "permanent"
+
     @param.depends("variant", "inline", "anchor", watch=True, on_init=True)
     def _force_zero_dimensions(self):
         if not self.inline:
@@ -1171,7 +1446,7 @@ class Drawer(MaterialListLike):
         return toggle
 
 
-class Popup(MaterialListLike):
+class Popup(MaterialOverlay):
     """
     The `Popup` component displays content in an anchored overlay that
     requires user interaction. It is commonly used for contextual
@@ -8,13 +8,29 @@ function html_decode(input) {
 export function render({model}) {
   const [color] = model.useState("color")
   const [sx] = model.useState("sx")
-  const [text] = model.useState("object")
+  const [object] = model.useState("object")
   const [variant] = model.useState("variant")
+  const [text, setText] = React.useState(object)
+
+  React.useEffect(() => setText(object), [object])
+
+  React.useEffect(() => {
+    // Streamed updates only send the HTML following the unchanged prefix
+    const handler = (msg) => {
+      if (msg.type === "stream") {
+        setText((current) => current.slice(0, msg.start) + msg.patch)
+      }
+    }
+    model.on("msg:custom", handler)
+    return () => model.off("msg:custom", handler)
+  }, [])
+
+  const html = React.useMemo(() => html_decode(text), [text])
 
   return (
     <Typography
       sx={{...sx, "& p": {marginBlockStart: "0.25em", marginBlockEnd: "0.25em"}}}
-      dangerouslySetInnerHTML={{__html: html_decode(text)}}
+      dangerouslySetInnerHTML={{__html: html}}
       variant={variant}
       color={color}
     />
@@ -3,8 +3,11 @@ from __future__ import annotations
 import typing as t
 
 import param
+from panel.io.model import apply_changes_without_dispatch
 from panel.pane import HoloViews, Markdown
+from panel.util import prefix_length
 
+from .._markdown import CachedMarkdownMixin
 from ..base import MaterialComponent
 from ..widgets import DatetimeInput, DiscreteSlider, EditableFloatSlider, EditableIntSlider, FloatSlider, IntSlider, Select
 
@@ -29,10 +32,14 @@ class MaterialPaneBase(MaterialComponent):
         super().__init__(object=object, **params)
 
 
-class Typography(MaterialPaneBase, Markdown):
+class Typography(CachedMarkdownMixin, MaterialPaneBase, Markdown):
     """
     The `Typography` component is used to display text with different styles and weights.
 
+    Rendered Markdown is cached across sessions and, when `enable_streaming`
+    is set, appended text is re-rendered incrementally and only the changed
+    HTML is sent to the frontend.
+
     :References:
 
     - https://mui.com/material-ui/react-typography/
@@ -57,6 +64,36 @@ class Typography(MaterialPaneBase, Markdown):
     _esm_base = "Typography.jsx"
     _rename = {"object": "object"}
 
+    # The last HTML streamed to the frontend
+    _streamed_object: str | None = None
+
+    def _update_model(self, events, msg, root, model, doc, comm):
+        streamed = None
+        if self.enable_streaming and msg.get('object'):
+            text = msg['object']
+            start = prefix_length(text, model.data.object or '')
+            if start:
+                # Send only the HTML following the common prefix, once
+                # for all views, and update the model without dispatching
+                streamed = text
+                msg = {k: v for k, v in msg.items() if k != 'object'}
+                if text != self._streamed_object:
+                    self._streamed_object = text
+                    self._send_msg({'type': 'stream', 'start': start, 'patch': text[start:]})
+        super()._update_model(events, msg, root, model, doc, comm)
+        if streamed is None:
+            return
+        ref = root.ref['id']
+        changing = self._changing.setdefault(ref, [])
+        changing.append('object')
+        try:
+            apply_changes_without_dispatch(doc, model.data, {'object': streamed})
+        finally:
+            if 'object' in changing:
+                changing.remove('object')
+            if not changing:
+                del self._changing[ref]
+
     @classmethod
     def applies(cls, obj: t.Any) -> float | bool | None:
         if hasattr(obj, '_repr_markdown_'):
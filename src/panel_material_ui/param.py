@@ -1,7 +1,17 @@
+from __future__ import annotations
+
+import itertools
+import types
+import typing as t
+from functools import partial
+
 import param
+from panel.layout import Tabs
 from panel.param import Param
-from panel.widgets import WidgetBase
+from panel.widgets import StaticText, WidgetBase
+from param.parameterized import classlist, discard_events
 
+from .layout import Accordion, Column
 from .widgets import (
     Button,
     Checkbox,
@@ -16,12 +26,17 @@ from .widgets import (
     IntSlider,
     ListInput,
     LiteralInput,
+    MultiChoice,
     MultiSelect,
+    Pagination,
     RangeSlider,
     Select,
     TextInput,
     TupleInput,
 )
+from .widgets.select import _SelectDropdownBase
+
+NumberInput = type('NumberInput', (LiteralInput,), {'type': (int, float)})
 
 
 def SingleFileSelector(pobj: param.Parameter) -> type[WidgetBase]:
@@ -38,7 +53,7 @@ def LiteralInputTyped(pobj: param.Parameter) -> type[WidgetBase]:
     if isinstance(pobj, (param.Tuple, param.Range)):
         return TupleInput
     elif isinstance(pobj, param.Number):
-        return type('NumberInput', (LiteralInput,), {'type': (int, float)})
+        return NumberInput
     elif isinstance(pobj, param.Dict):
         return DictInput
     elif isinstance(pobj, param.List):
@@ -74,3 +89,180 @@ Param.input_widgets.update({
     int: IntInput,
     "literal": LiteralInputTyped,
 })
+
+
+class LazyParam(Param):
+    """
+    LazyParam renders the parameters of a Parameterized object as a
+    form of collapsible sections, grouping consecutive parameters with
+    the same precedence, and only builds the widgets of a section once
+    it is expanded. Sections with more than `page_size` parameters are
+    paginated and selectors with more than `option_limit` options are
+    rendered as searchable dropdowns which only display a window of
+    the options, keeping forms for objects with hundreds of parameters
+    responsive.
+
+    Reference: https://panel.holoviz.org/reference/panes/Param.html
+
+    :Example:
+
+    >>> LazyParam(config, active=[0, 1], page_size=20)
+    """
+
+    active = param.List(default=[0], item_type=int, doc="""
+        Indexes of the expanded sections.""")
+
+    on_widget = param.Callable(default=None, doc="""
+        Callback invoked with the parameter name and the widget
+        whenever a widget is built.""")
+
+    option_limit = param.Integer(default=50, bounds=(1, None), allow_None=True, doc="""
+        Selectors with more options than this are rendered as
+        searchable dropdowns displaying this many options at once.""")
+
+    page_size = param.Integer(default=25, bounds=(1, None), doc="""
+        Maximum number of parameters displayed at once in a section,
+        longer sections are paginated.""")
+
+    # Only used when requested explicitly
+    priority: t.ClassVar[float | bool | None] = False
+
+    _accordion: Accordion | None = None
+
+    _sections: list[tuple[str, list[str]]] = []
+
+    # Resolved mapping entries per Parameter type, invalidated when
+    # entries are added to or removed from the mapping
+    _widget_types: t.ClassVar[dict[type[param.Parameter], type[param.Parameter] | None]] = {}
+    _widget_types_size: t.ClassVar[int] = 0
+
+    @classmethod
+    def widget_type(cls, pobj: param.Parameter) -> type[WidgetBase] | None:
+        if '_widget_types' not in cls.__dict__ or cls._widget_types_size != len(cls.mapping):
+            cls._widget_types = {}
+            cls._widget_types_size = len(cls.mapping)
+        ptype = type(pobj)
+        if ptype in cls._widget_types:
+            entry = cls._widget_types[ptype]
+        else:
+            entry = next((wt for wt in classlist(ptype)[::-1] if wt in cls.mapping), None)
+            cls._widget_types[ptype] = entry
+        if entry is None:
+            return None
+        wtype = cls.mapping[entry]
+        if isinstance(wtype, types.FunctionType):
+            return wtype(pobj)
+        return wtype
+
+    def _get_sections(self) -> list[tuple[str, list[str]]]:
+        precedence = lambda p: self.object.param[p].precedence
+        params = [
+            p for p in self._ordered_params
+            if precedence(p) is None or precedence(p) >= self.display_threshold
+        ]
+        key = lambda p: self.default_precedence if precedence(p) is None else precedence(p)
+        sections = []
+        for _, group in itertools.groupby(params, key=key):
+            names = list(group)
+            labels = [self.object.param[p].label or p for p in (names[0], names[-1])]
+            title = labels[0] if len(names) == 1 else ' – '.join(labels)
+            sections.append((title, names))
+        return sections
+
+    def _get_widgets(self) -> dict[str, t.Any]:
+        # Only the title is built eagerly, the widgets of a section
+        # are built when it is expanded
+        if self.show_name and self.expand_layout is not Tabs:
+            return {'_title': StaticText(value=f'<b>{self.name}</b>')}
+        return {}
+
+    def _get_widget(self, p_name: str) -> t.Any:
+        if p_name in self._widgets:
+            return self._widgets[p_name]
+        widget_spec = None
+        pobj = self.object.param[p_name]
+        if (self.option_limit and not (self.widgets and p_name in self.widgets) and
+            hasattr(pobj, 'get_range') and len(pobj.get_range()) > self.option_limit):
+            wtype = self.widget_type(pobj)
+            if wtype is MultiSelect:
+                wtype = MultiChoice
+            if isinstance(wtype, type) and issubclass(wtype, _SelectDropdownBase):
+                widget_spec = {
+                    'type': wtype, 'option_limit': self.option_limit, 'searchable': True
+                }
+        widget = self._widgets[p_name] = self.widget(p_name, widget_spec=widget_spec)
+        if not (self.expand_button == False and not self.expand):
+            # Link the subobjects of the new widget only
+            widgets, self._widgets = self._widgets, {p_name: widget}
+            try:
+                self._link_subobjects()
+            finally:
+                self._widgets = widgets
+        if self.on_widget:
+            self.on_widget(p_name, widget)
+        return widget
+
+    def _fetch_widgets(self, names: list[str], offset: int, limit: int) -> list[t.Any]:
+        return [self._get_widget(p) for p in names[offset:offset+limit]]
+
+    def _render_section(self, index: int) -> None:
+        box = self._accordion[index]  # type: ignore[index]
+        if box.objects:
+            return
+        names = self._sections[index][1]
+        if len(names) <= self.page_size:
+            box.objects = self._fetch_widgets(names, 0, len(names))
+        else:
+            box.objects = [Pagination.paginate(
+                partial(self._fetch_widgets, names), page_size=self.page_size,
+                total=len(names), prefetch=False, sizing_mode='stretch_width'
+            )]
+
+    def _update_widgets(self, *events) -> None:
+        # Param renders all widgets into the widget box, which is
+        # replaced with the sections once they are (re-)computed
+        with discard_events(self._widget_box):
+            super()._update_widgets(*events)
+        self._rerender()
+
+    def _rerender(self) -> None:
+        if self.object is None:
+            self._sections = []
+        else:
+            self._sections = self._get_sections()
+        boxes = [
+            Column(name=title, margin=0, sizing_mode='stretch_width')
+            for title, _ in self._sections
+        ]
+        active = [i for i in self.active if i < len(boxes)]
+        if self._accordion is None:
+            self._accordion = Accordion(
+                objects=boxes, active=active, margin=0, sizing_mode='stretch_width'
+            )
+            self._accordion.param.watch(self._sync_active, 'active')
+        else:
+            self._accordion.param.update(objects=boxes, active=active)
+        for index in active:
+            self._render_section(index)
+        title = [self._widgets['_title']] if '_title' in self._widgets else []
+        self._widget_box.objects = [*title, self._accordion]
+
+    def _sync_active(self, event: param.parameterized.Event) -> None:
+        self.active = event.new
+
+    @param.depends('active', watch=True)
+    def _update_active(self) -> None:
+        if self._accordion is None:
+            return
+        active = [i for i in self.active if i < len(self._sections)]
+        self._accordion.active = active
+        for index in active:
+            self._render_section(index)
+
+    def _rerender_widget(self, p_name: str) -> None:
+        for w in list(self._internal_callbacks):
+            if w.inst is self._widgets.get(p_name):
+                w.inst.param.unwatch(w)
+                self._internal_callbacks.remove(w)
+        self._widgets.pop(p_name, None)
+        self._rerender()
@@ -0,0 +1,281 @@
+"""
+Opt-in instrumentation of the serialization and sync cost of
+MaterialComponents.
+
+When enabled the profiler records the number of calls, the wall time
+and the number of bytes serialized for the following operations on
+every MaterialComponent:
+
+- `get_model`: Creation of the Bokeh model (time includes children,
+  bytes only include the component's own model).
+- `get_properties`: Computation of the initial model properties from
+  the parameter values.
+- `update_properties`: Computation of the model properties changed by
+  parameter updates.
+- `set_on_model`: Application of parameter changes to the model.
+- `handle_msg`: Handling of custom messages sent from the frontend.
+- `send_msg`: Custom messages sent to the frontend.
+
+Statistics are aggregated per class and per instance, per-instance
+statistics are only kept while the instance is alive. They can be
+accessed via the Python API, rendered as a table or exported in the
+Prometheus text exposition format:
+
+>>> from panel_material_ui.profiling import profiler
+>>> with profiler:
+...     app.get_root()
+>>> profiler.stats(by='class')
+
+The profiler may also be enabled globally by setting the
+PANEL_MATERIAL_UI_PROFILE environment variable.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing as t
+from collections import defaultdict
+from weakref import WeakKeyDictionary
+
+from bokeh.core.json_encoder import serialize_json
+from bokeh.core.serialization import Serializer
+from bokeh.models import UIElement
+
+if t.TYPE_CHECKING:
+    from bokeh.model import Model
+    from panel.viewable import Viewable
+
+
+class _ShallowSerializer(Serializer):
+    """
+    Serializer which encodes all UIElements other than the supplied
+    model as references, ensuring that the serialized size of a model
+    does not include the models of its children.
+    """
+
+    def __init__(self, model: Model | None = None):
+        super().__init__()
+        self._model = model
+
+    def _encode(self, obj: t.Any) -> t.Any:
+        if isinstance(obj, UIElement) and obj is not self._model:
+            return obj.ref
+        return super()._encode(obj)
+
+
+def _nbytes(obj: t.Any, model: Model | None = None) -> int:
+    """
+    Computes the number of bytes of the serialized representation of obj.
+    """
+    try:
+        rep = _ShallowSerializer(model).serialize(obj)
+        return len(serialize_json(rep.content)) + sum(len(buf.to_bytes()) for buf in rep.buffers)
+    except Exception:
+        return 0
+
+
+class ComponentProfiler:
+    """
+    ComponentProfiler records per-class and per-instance counts, wall
+    time and serialized bytes for the model creation and sync
+    operations of MaterialComponents.
+
+    The profiler is disabled by default, when disabled the overhead is
+    a single attribute lookup per operation.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __enter__(self) -> ComponentProfiler:
+        self.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        """
+        Enables recording of statistics.
+        """
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Disables recording of statistics.
+        """
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        Clears all recorded statistics.
+        """
+        with self._lock:
+            self._class_stats: dict[tuple[str, str], list[float]] = defaultdict(lambda: [0, 0., 0])
+            # Weakly keyed so stats neither keep components alive nor
+            # are merged with a later component reusing the same id
+            self._instance_stats: WeakKeyDictionary[Viewable, dict[str, list[float]]] = WeakKeyDictionary()
+
+    def start(self) -> float | None:
+        """
+        Returns the start time of an operation if the profiler is enabled.
+        """
+        return time.perf_counter() if self.enabled else None
+
+    def record(
+        self, obj: Viewable, operation: str, start: float, payload: t.Any = None,
+        model: Model | None = None
+    ) -> None:
+        """
+        Records an operation on a component.
+
+        Parameters
+        ----------
+        obj: Viewable
+            The component the operation was performed on.
+        operation: str
+            The name of the operation.
+        start: float
+            The start time of the operation as returned by `start()`.
+        payload: Any
+            The data that was serialized, if any.
+        model: bokeh.model.Model
+            The model that was serialized, if any.
+        """
+        elapsed = time.perf_counter() - start
+        if model is not None:
+            nbytes = _nbytes(model, model)
+        elif payload is not None:
+            nbytes = _nbytes(payload)
+        else:
+            nbytes = 0
+        cls_name = type(obj).__name__
+        with self._lock:
+            instance_stats = self._instance_stats.get(obj)
+            if instance_stats is None:
+                instance_stats = self._instance_stats[obj] = defaultdict(lambda: [0, 0., 0])
+            for stats in (
+                self._class_stats[(cls_name, operation)],
+                instance_stats[operation]
+            ):
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] += nbytes
+
+    def stats(self, by: t.Literal['class', 'instance'] = 'class') -> list[dict[str, t.Any]]:
+        """
+        Returns the recorded statistics sorted by the number of
+        serialized bytes.
+
+        Parameters
+        ----------
+        by: 'class' | 'instance'
+            Whether to aggregate statistics by class or by instance.
+
+        Returns
+        -------
+        A list of records with the component class (and instance name),
+        the operation, the number of calls, the total wall time in
+        seconds and the total number of serialized bytes.
+        """
+        if by not in ('class', 'instance'):
+            raise ValueError(f"Profiler stats can be aggregated by 'class' or 'instance', not {by!r}.")
+        with self._lock:
+            if by == 'class':
+                items = [((cls, None, op), stats) for (cls, op), stats in self._class_stats.items()]
+            else:
+                items = [
+                    ((type(obj).__name__, f'{obj.name or type(obj).__name__}@{id(obj):x}', op), stats)
+                    for obj, instance_stats in list(self._instance_stats.items())
+                    for op, stats in instance_stats.items()
+                ]
+        records = []
+        for (cls, name, op), (count, elapsed, nbytes) in items:
+            record = {'class': cls, 'operation': op, 'count': count, 'time': elapsed, 'bytes': nbytes}
+            if by == 'instance':
+                record['name'] = name
+            records.append(record)
+        return sorted(records, key=lambda r: (r['bytes'], r['time']), reverse=True)
+
+    def to_dataframe(self, by: t.Literal['class', 'instance'] = 'class'):
+        """
+        Returns the recorded statistics as a pandas DataFrame.
+
+        Parameters
+        ----------
+        by: 'class' | 'instance'
+            Whether to aggregate statistics by class or by instance.
+        """
+        import pandas as pd
+        columns = ['class', 'operation', 'count', 'time', 'bytes']
+        if by == 'instance':
+            columns.insert(1, 'name')
+        return pd.DataFrame(self.stats(by), columns=columns)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the per-class statistics in the Prometheus text
+        exposition format.
+        """
+        metrics = (
+            ('calls_total', 'Number of calls', 0),
+            ('seconds_total', 'Total wall time in seconds', 1),
+            ('bytes_total', 'Total number of serialized bytes', 2),
+        )
+        with self._lock:
+            items = sorted(self._class_stats.items())
+        lines = []
+        for metric, description, index in metrics:
+            name = f'panel_material_ui_component_{metric}'
+            lines.append(f'# HELP {name} {description} per component class and operation.')
+            lines.append(f'# TYPE {name} counter')
+            for (cls, op), stats in items:
+                lines.append(f'{name}{{class="{cls}",operation="{op}"}} {stats[index]}')
+        return '\n'.join(lines) + '\n'
+
+    def prometheus_handler(self):
+        """
+        Returns a tornado RequestHandler serving the statistics in the
+        Prometheus text format, e.g. to be added to the server with:
+
+        >>> pn.serve(app, extra_patterns=[('/metrics', profiler.prometheus_handler())])
+        """
+        from tornado.web import RequestHandler
+
+        profiler = self
+
+        class PrometheusHandler(RequestHandler):
+
+            def get(self):
+                self.set_header('Content-Type', 'text/plain; version=0.0.4')
+                self.write(profiler.to_prometheus())
+
+        return PrometheusHandler
+
+    def view(self, by: t.Literal['class', 'instance'] = 'class') -> Viewable:
+        """
+        Returns a table of the recorded statistics which can be
+        refreshed, e.g. to embed in an admin dashboard.
+
+        Parameters
+        ----------
+        by: 'class' | 'instance'
+            Whether to aggregate statistics by class or by instance.
+        """
+        from panel.widgets import Tabulator
+
+        from .layout import Column
+        from .widgets import Button
+
+        table = Tabulator(self.to_dataframe(by), disabled=True, show_index=False, sizing_mode='stretch_width')
+        refresh = Button(label='Refresh', icon='refresh', variant='outlined')
+        refresh.on_click(lambda _: setattr(table, 'value', self.to_dataframe(by)))
+        return Column(refresh, table, sizing_mode='stretch_width')
+
+
+profiler = ComponentProfiler(enabled=bool(os.environ.get('PANEL_MATERIAL_UI_PROFILE')))
+
+__all__ = ['ComponentProfiler', 'profiler']
@@ -14,12 +14,16 @@ export function render({model}) {
     model.send_msg({type: "switch", current: isLarge ? "large" : "small"})
   }, [isLarge])
 
+  // In lazy mode a branch may not be rendered yet, keep displaying
+  // the other branch until the server has sent it.
+  const showLarge = isLarge ? (large != null || small == null) : (small == null && large != null)
+
   return (
     <Box sx={{width: "100%", height: "100%"}}>
-      <div style={{display: isLarge ? "block" : "none"}}>
+      <div style={{display: showLarge ? "block" : "none"}}>
         {large}
       </div>
-      <div style={{display: isLarge ? "none" : "block"}}>
+      <div style={{display: showLarge ? "none" : "block"}}>
         {small}
       </div>
     </Box>
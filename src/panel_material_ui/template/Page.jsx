@@ -119,12 +119,14 @@ export function render({model, view}) {
   const [contextbar_width, setContextbarWidth] = model.useState("contextbar_width")
   const [main_width] = model.useState("main_width")
   const [app_bar_width] = model.useState("app_bar_width")
-  const [dark_theme, setDarkTheme] = model.useState("dark_theme")
+  const [, setDarkTheme] = model.useState("dark_theme")
   const [logo] = model.useState("logo")
   const [open, setOpen] = model.useState("sidebar_open")
   const [sidebar_resizable] = model.useState("sidebar_resizable")
   const [sidebar_width, setSidebarWidth] = model.useState("sidebar_width")
+  const [sync_theme] = model.useState("sync_theme")
   const [theme_toggle] = model.useState("theme_toggle")
+  const dark_theme = theme.palette.mode === "dark"
 
   // Draggable sidebar state
   const [isDragging, setIsDragging] = React.useState(false)
@@ -241,12 +243,16 @@ export function render({model, view}) {
   }, [busy])
   React.useEffect(() => () => clearTimeout(timerRef.current), [])
 
+  // The theme is switched on the client, the server is only notified
+  // once (if at all) rather than every component syncing its dark_theme
   const toggleTheme = () => {
-    setDarkTheme(!dark_theme)
+    dark_mode.set_value(!dark_theme)
+    if (sync_theme) {
+      setDarkTheme(!dark_theme)
+    }
   }
 
   setup_global_styles(view, theme, view.model.data._custom_theme)
-  React.useEffect(() => dark_mode.set_value(dark_theme), [dark_theme])
 
   const [highlight, setHighlight] = React.useState(false)
 
@@ -9,37 +9,39 @@ import {dark_mode, setup_global_styles} from "./utils"
 
 export function render({model, view}) {
   const theme = useTheme()
-  const [dark_theme, setDarkTheme] = model.useState("dark_theme")
   const [value, setValue] = model.useState("value")
+  const [sync_theme] = model.useState("sync_theme")
   const [variant] = model.useState("variant")
+  const dark = theme.palette.mode === "dark"
 
   setup_global_styles(view, theme)
 
-  React.useEffect(() => {
-    dark_mode.set_value(value)
-    setDarkTheme(value)
-  }, [value])
+  // Pick up changes to the value made on the server
+  React.useEffect(() => dark_mode.set_value(value), [value])
 
-  React.useEffect(() => {
-    setValue(dark_theme)
-  }, [dark_theme])
+  const toggle = () => {
+    dark_mode.set_value(!dark)
+    if (sync_theme) {
+      setValue(!dark)
+    }
+  }
 
   return (
     <Tooltip enterDelay={500} title="Toggle theme">
       {variant === "switch" ? (
         <FormControlLabel
           control={
-            <Switch checked={value} onChange={(e) => setValue(!value)} />
+            <Switch checked={dark} onChange={toggle} />
           }
-          label={value ? "Dark Theme" : "Light Theme"}
+          label={dark ? "Dark Theme" : "Light Theme"}
         />
       ) : (
         <IconButton
           aria-label="Toggle theme"
           color="inherit" align="right"
-          onClick={() => setValue(!value)}
+          onClick={toggle}
         >
-          {value ? <DarkMode /> : <LightMode />}
+          {dark ? <DarkMode /> : <LightMode />}
         </IconButton>
       )}
     </Tooltip>
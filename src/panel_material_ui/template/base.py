@@ -7,8 +7,9 @@ import typing as t
 
 import param
 from jinja2 import Template
+from markupsafe import Markup, escape
 from panel.config import _base_config, config
-from panel.io.resources import ResourceComponent, Resources
+from panel.io.resources import ResourceComponent, Resources, get_dist_path, use_cdn
 from panel.io.state import state
 from panel.util import edit_readonly
 from panel.viewable import Child, Children
@@ -21,12 +22,53 @@ from ..widgets.base import MaterialWidget
 if t.TYPE_CHECKING:
     from bokeh.document import Document
     from bokeh.model import Model
+    from bokeh.models.ui.ui_element import UIElement
     from panel.io.location import LocationAreaBase
     from panel.io.resources import ResourcesType
+    from panel.viewable import Viewable
     from pyviz_comms import Comm
 
 SIDEBAR_VARIANTS = ["persistent", "temporary", "permanent", "auto"]
 
+# Material UI breakpoints (in px) used to translate responsive widths
+# into media queries for the static page skeleton.
+_BREAKPOINTS = {"xs": 0, "sm": 600, "md": 900, "lg": 1200, "xl": 1536}
+
+_SKELETON_CSS = """
+#page-skeleton {
+  position: fixed; inset: 0; z-index: 9998; display: flex; flex-direction: column;
+  background-color: %(background)s; overflow: hidden;
+}
+#page-skeleton .skeleton-header {
+  flex: 0 0 auto; display: flex; justify-content: center; height: 64px;
+  background-color: %(header)s; color: #fff; box-shadow: 0 2px 4px -1px rgba(0,0,0,0.2);
+}
+#page-skeleton .skeleton-toolbar {
+  display: flex; align-items: center; gap: 16px; box-sizing: border-box;
+  width: 100%%; padding: 0 24px; font: 500 1.25rem/1.6 Roboto, Helvetica, Arial, sans-serif;
+}
+#page-skeleton .skeleton-body { flex: 1 1 auto; display: flex; min-height: 0; }
+#page-skeleton .skeleton-sidebar {
+  flex: 0 0 %(sidebar_width)spx; box-sizing: border-box; padding: 16px;
+  border-right: 1px solid %(divider)s; display: flex; flex-direction: column; gap: 12px;
+}
+#page-skeleton .skeleton-main { flex: 1 1 auto; display: flex; flex-direction: column; min-width: 0; }
+#page-skeleton .skeleton-content {
+  display: flex; flex-direction: column; gap: 16px; box-sizing: border-box;
+  width: 100%%; padding: 24px; align-self: center;
+}
+#page-skeleton .skeleton-block {
+  border-radius: 4px; background-color: %(placeholder)s;
+  animation: skeleton-pulse 2s ease-in-out 0.5s infinite;
+}
+#page-skeleton .skeleton-line { height: 20px; }
+@keyframes skeleton-pulse { 0%% { opacity: 1 } 50%% { opacity: 0.4 } 100%% { opacity: 1 } }
+@media (max-width: 599.95px) {
+  #page-skeleton .skeleton-header { height: 56px; }
+  #page-skeleton .skeleton-sidebar { display: none; }
+}
+"""
+
 @functools.cache
 def parse_template(tmpl, *args, **kwargs):
     if os.path.isfile(tmpl):
@@ -34,6 +76,48 @@ def parse_template(tmpl, *args, **kwargs):
     return _env.from_string(tmpl, *args, **kwargs)
 
 
+def _hashable(value):
+    """
+    Converts (nested) parameter values into a hashable representation.
+    """
+    if isinstance(value, dict):
+        return tuple((k, _hashable(v)) for k, v in sorted(value.items(), key=lambda kv: str(kv[0])))
+    elif isinstance(value, (list, tuple, set)):
+        return tuple(_hashable(v) for v in value)
+    elif isinstance(value, param.Parameterized):
+        values = {k: v for k, v in value.param.values().items() if k != 'name'}
+        return (type(value), _hashable(values))
+    elif isinstance(value, pathlib.PurePath):
+        return str(value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _css_width(value) -> str:
+    return f"{value}px" if isinstance(value, (int, float)) else str(value)
+
+
+def _max_width_css(selector: str, width) -> str:
+    """
+    Translates a (responsive) width specification into CSS rules
+    clamping the maximum width of the elements matching the selector.
+    """
+    if width is None:
+        return ""
+    elif not isinstance(width, dict):
+        return f"{selector} {{ max-width: {_css_width(width)}; }}\n"
+    rules = []
+    for bp, w in sorted(width.items(), key=lambda item: _BREAKPOINTS.get(item[0], 0)):
+        rule = f"{selector} {{ max-width: {_css_width(w)}; }}"
+        if _BREAKPOINTS.get(bp, 0):
+            rule = f"@media (min-width: {_BREAKPOINTS[bp]}px) {{ {rule} }}"
+        rules.append(rule)
+    return "\n".join(rules) + "\n"
+
+
 class Meta(param.Parameterized):
     """
     Meta allows controlling meta tags and other HTML head elements.
@@ -141,6 +225,17 @@ class Page(MaterialComponent, ResourceComponent):
     site_url = param.String(default="/", doc="""
         URL of the site and logo. Default is '/'.""")
 
+    skeleton = param.Boolean(default=True, doc="""
+        Whether to render a static skeleton of the page layout (app bar,
+        sidebar and placeholders for the main content) as part of the
+        initial HTML, which is displayed until the application has
+        rendered.""")
+
+    sync_theme = param.Boolean(default=True, doc="""
+        Whether to notify the server when the theme is toggled. The
+        theme is always switched in the browser, the notification only
+        updates dark_theme and the global config.theme on the server.""")
+
     template = param.ClassSelector(default=None, class_=(str, pathlib.Path, Template), doc="""
         Overrides the default jinja2 template. Template can be provided as a string,
         Path or jinja2.Template instance.""")
@@ -151,8 +246,18 @@ class Page(MaterialComponent, ResourceComponent):
 
     _custom_theme = param.List(default=[])
 
+    # Cache of the session independent template variables and the
+    # pre-rendered static parts of the template, shared by all Page
+    # instances with the same configuration.
+    _template_cache: t.ClassVar[dict[tuple[t.Any, ...], dict[str, t.Any]]] = {}
+    _template_cache_size: t.ClassVar[int] = 32
+
+    _constants = {"follow_dark_mode": True, "loading_inset": 0}
     _esm_base = "Page.jsx"
-    _rename = {"config": None, "meta": None, "favicon": None, "apple_touch_icon": None, "template": None}
+    _rename = {
+        "config": None, "meta": None, "favicon": None, "apple_touch_icon": None,
+        "skeleton": None, "template": None
+    }
     _source_transforms = {
         "header": None,
         "contextbar": None,
@@ -220,14 +325,96 @@ class Page(MaterialComponent, ResourceComponent):
             params['logo'] = logo
         return params
 
-    def _populate_template_variables(self, template_variables):
-        template_variables['meta'] = self.meta
+    def _template_cache_key(self) -> tuple[t.Any, ...]:
+        cdn = use_cdn()
+        return (
+            type(self), self._template, type(self._design), type(self._design.theme),
+            self.dark_theme, self.favicon, _hashable(self.config), self.meta.name, _hashable(self.meta),
+            cdn, get_dist_path(cdn=cdn), config.inline
+        )
+
+    def _resolve_template_variables(self) -> dict[str, t.Any]:
+        variables: dict[str, t.Any] = {}
         if favicon := self.favicon or self.meta.icon:
-            template_variables['favicon'] = _read_icon(favicon)
+            variables['favicon'] = _read_icon(favicon)
         if apple_touch_icon := self.meta.apple_touch_icon:
-            template_variables['apple_touch_icon'] = _read_icon(apple_touch_icon)
-        template_variables['resources'] = self.resolve_resources()
+            variables['apple_touch_icon'] = _read_icon(apple_touch_icon)
+        variables['resources'] = resources = self.resolve_resources()
+        if self._template is BASE_TEMPLATE:
+            # Pre-render the resource block of the document head since
+            # it only depends on the resolved resources
+            block = BASE_TEMPLATE.blocks['postamble']
+            context = BASE_TEMPLATE.new_context({'resources': resources})
+            variables['static_postamble'] = Markup(''.join(block(context)))
+        return variables
+
+    def _render_skeleton(self) -> Markup:
+        """
+        Renders a static HTML approximation of the page layout, which
+        is displayed in place of a blank page while the application
+        loads and is removed once the application has rendered.
+        """
+        theme_config = self.theme_config or {}
+        scheme = 'dark' if self.dark_theme else 'light'
+        palette = theme_config.get('palette') or theme_config.get(scheme, {}).get('palette') or {}
+        primary = palette.get('primary')
+        header = (primary.get('main') if isinstance(primary, dict) else primary) or '#0072b5'
+        css = _SKELETON_CSS % dict(
+            background='#121212' if self.dark_theme else '#fff',
+            divider='rgba(255, 255, 255, 0.12)' if self.dark_theme else 'rgba(0, 0, 0, 0.12)',
+            header=header,
+            placeholder='rgba(255, 255, 255, 0.13)' if self.dark_theme else 'rgba(0, 0, 0, 0.11)',
+            sidebar_width=self.sidebar_width,
+        )
+        css += _max_width_css('#page-skeleton .skeleton-content', self.main_width)
+        app_bar_width = self.main_width if self.app_bar_width is None else self.app_bar_width
+        css += _max_width_css('#page-skeleton .skeleton-toolbar', app_bar_width)
+
+        title = escape(self.title or '')
+        sidebar = ''
+        if self.sidebar and self.sidebar_open and self.sidebar_variant != 'temporary':
+            lines = '<div class="skeleton-block skeleton-line"></div>' * min(len(self.sidebar), 8)
+            sidebar = f'<div class="skeleton-sidebar">{lines}</div>'
+        blocks = []
+        for obj in self.main[:10]:
+            if not getattr(obj, 'visible', True):
+                continue
+            height = getattr(obj, 'height', None) or getattr(obj, 'min_height', None) or 120
+            blocks.append(f'<div class="skeleton-block" style="height: {int(height)}px"></div>')
+        return Markup(
+            f'<style id="page-skeleton-css">{css}</style>'
+            '<div id="page-skeleton" aria-hidden="true">'
+            f'<div class="skeleton-header"><div class="skeleton-toolbar">{title}</div></div>'
+            f'<div class="skeleton-body">{sidebar}'
+            f'<div class="skeleton-main"><div class="skeleton-content">{"".join(blocks)}</div></div>'
+            '</div></div>'
+        )
+
+    @classmethod
+    def clear_template_cache(cls):
+        """
+        Clears the cache of resolved resources and pre-rendered
+        template sections shared across sessions.
+        """
+        cls._template_cache.clear()
+
+    def _populate_template_variables(self, template_variables):
+        template_variables['meta'] = self.meta
+        if config.autoreload:
+            variables = self._resolve_template_variables()
+        else:
+            key = self._template_cache_key()
+            cache = Page._template_cache
+            if key in cache:
+                variables = cache[key]
+            else:
+                variables = cache[key] = self._resolve_template_variables()
+                while len(cache) > self._template_cache_size:
+                    del cache[next(iter(cache))]
+        template_variables.update(variables)
         template_variables['is_page'] = True
+        if self.skeleton:
+            template_variables['skeleton'] = self._render_skeleton()
 
     def get_root(
         self, doc: Document | None = None, comm: Comm | None = None,
@@ -301,6 +488,11 @@ class ThemeToggle(MaterialWidget):
         default='primary', objects=['primary', 'secondary'],
         doc="The color of the theme toggle.")  # type: ignore[assignment]
 
+    sync_theme = param.Boolean(default=True, doc="""
+        Whether to notify the server when the theme is toggled. The
+        theme is always switched in the browser, the notification only
+        updates the value and the global config.theme on the server.""")
+
     theme: t.Literal['dark', 'default'] | None = param.Selector(
         default=None, objects=['dark', 'default'], constant=True,
         doc="The current theme.")  # type: ignore[assignment]
@@ -313,6 +505,7 @@ class ThemeToggle(MaterialWidget):
 
     width = param.Integer(default=None, doc="The width of the theme toggle.")
 
+    _constants = {"follow_dark_mode": True}
     _esm_base = "ThemeToggle.jsx"
     _esm_transforms = [ThemedTransform]
     _rename = {"theme_toggle": None}
@@ -399,6 +592,10 @@ class BreakpointSwitcher(MaterialComponent):
     The `BreakpointSwitcher` component allows switching between two component implementations
     based on the declared breakpoint or media_query.
 
+    In `lazy` mode only the branch expected to match the client's media
+    query is rendered initially, the other branch is only rendered once
+    the client switches to it.
+
     :References:
 
     - https://panel-material-ui.holoviz.org/reference/page/BreakpointSwitcher.html
@@ -414,6 +611,16 @@ class BreakpointSwitcher(MaterialComponent):
     breakpoint: t.Literal["xs", "sm", "md", "lg", "xl"] = param.Selector(default='md', objects=["xs", "sm", "md", "lg", "xl"], doc="""
         Breakpoint at which switcher toggles between.""")  # type: ignore[assignment]
 
+    destroy_inactive = param.Boolean(default=False, doc="""
+        Whether to destroy the rendered branch when the client switches
+        away from it. Only applies if `lazy` is enabled.""")
+
+    lazy = param.Boolean(default=False, doc="""
+        Whether to render only the branch matching the client's media
+        query, deferring the other branch until the client switches to
+        it. The initial branch is inferred from the request headers,
+        falling back to the large branch.""")
+
     media_query = param.String(default=None, doc="""
         Media query to use for the breakpoint (takes precedence over breakpoint).""")
 
@@ -422,12 +629,52 @@ class BreakpointSwitcher(MaterialComponent):
     large = Child(doc="Items rendered in the large breakpoint.")
 
     _esm_base = "BreakpointSwitcher.jsx"
-    _rename = {"current": None}
+    _rename = {"current": None, "destroy_inactive": None, "lazy": None}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._rendered: set[str] = set()
+
+    @staticmethod
+    def _initial_branch() -> str:
+        headers = state.headers
+        if headers.get('Sec-CH-UA-Mobile') == '?1' or 'Mobi' in str(headers.get('User-Agent', '')):
+            return 'small'
+        return 'large'
+
+    def _get_model(
+        self, doc: Document, root: Model | None = None,
+        parent: Model | None = None, comm: Comm | None = None
+    ) -> Model:
+        if not self._rendered:
+            self._rendered.add(self._initial_branch())
+        return super()._get_model(doc, root, parent, comm)
+
+    def _get_child_model(
+        self, child: Viewable, doc: Document, root: Model, parent: Model,
+        comm: Comm | None
+    ) -> tuple[list[UIElement] | UIElement | None, list[UIElement]]:
+        if (
+            child is None or not self.lazy or
+            any(getattr(self, branch) is child for branch in self._rendered)
+        ):
+            return super()._get_child_model(child, doc, root, parent, comm)
+        if root.ref['id'] in child._models:
+            child._cleanup(root)
+        return None, []
 
     def _handle_msg(self, msg):
-        if msg['type'] == 'switch':
-            with edit_readonly(self):
-                self.current = getattr(self, msg['current'])
+        if msg['type'] != 'switch':
+            return
+        branch = msg['current']
+        with edit_readonly(self):
+            self.current = getattr(self, branch)
+        if not self.lazy:
+            return
+        rendered = {branch} if self.destroy_inactive else self._rendered | {branch}
+        if rendered != self._rendered:
+            self._rendered = rendered
+            self.param.trigger('small', 'large')
 
 
 __all__ = [
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import colorsys
+import functools
 import pathlib
 
 import numpy as np
@@ -48,37 +48,131 @@ MATERIAL_THEME = {
     }
 }
 
-def rgb2hex(rgb: tuple[int, int, int]) -> str:
+def _as_rgb_array(rgb) -> np.ndarray:
+    arr = np.asarray(rgb, dtype=float)
+    return arr.reshape(-1, arr.shape[-1])[:, :3]
+
+def rgb2hex(rgb):
     """
-    Convert RGB tuple to hex.
+    Convert RGB tuple(s) to hex.
+
+    Channels are rounded to the nearest integer, matching the
+    conversion performed on the frontend.
 
     Parameters
     ----------
-    rgb : tuple
-        The RGB(A) tuple to convert.
+    rgb : tuple | array-like
+        The RGB(A) tuple with channels in the range [0, 1] to convert,
+        or an array of shape (n, 3) or (n, 4) of such colors.
 
     Returns
     -------
-    str
-        The hex color.
+    str | list[str]
+        The hex color, or a list of hex colors if an array was provided.
     """
-    return "#{:02x}{:02x}{:02x}".format(*(int(v*255) for v in rgb))
+    values = np.floor(_as_rgb_array(rgb) * 255 + 0.5).astype(int).clip(0, 255)
+    hexes = _ints2hex(values)
+    return hexes if np.ndim(rgb) > 1 else hexes[0]
+
+def _ints2hex(values: np.ndarray) -> list[str]:
+    digits = np.ascontiguousarray(values, dtype=np.uint8).tobytes().hex()
+    return ['#' + digits[i:i+6] for i in range(0, len(digits), 6)]
+
+def hex2rgb(hex):
+    """
+    Convert hex color(s) to RGB tuple(s).
+
+    Parameters
+    ----------
+    hex : str | list[str]
+        The hex color, or a list of hex colors, to convert.
+
+    Returns
+    -------
+    tuple[int, int, int] | np.ndarray
+        The RGB tuple, or an integer array of shape (n, 3) if a list
+        of colors was provided.
+    """
+    if isinstance(hex, str):
+        return tuple(int(v) for v in _hex2ints([hex])[0])  # type: ignore[return-value]
+    return _hex2ints(hex)
+
+def _hex2ints(colors) -> np.ndarray:
+    digits = []
+    for color in colors:
+        color = color.lstrip('#')
+        if len(color) == 3:
+            color = ''.join(c*2 for c in color)
+        digits.append(color[:6])
+    return np.frombuffer(bytes.fromhex(''.join(digits)), dtype=np.uint8).reshape(-1, 3).astype(int)
 
-def hex2rgb(hex: str) -> tuple[int, int, int]:
+def rgb2hls(rgb: np.ndarray) -> np.ndarray:
     """
-    Convert hex color to RGB tuple.
+    Convert an array of RGB colors to HLS.
 
     Parameters
     ----------
-    hex : str
-        The hex color to convert.
+    rgb : array-like
+        Array of shape (n, 3) with channels in the range [0, 1].
 
     Returns
     -------
-    tuple[int, int, int]
-        The RGB tuple.
+    np.ndarray
+        Array of shape (n, 3) of hue, lightness and saturation values
+        in the range [0, 1].
     """
-    return tuple(int(hex[i : i + 2], 16) for i in range(1, 6, 2))  # type: ignore[return-value]
+    rgb = _as_rgb_array(rgb)
+    r, g, b = rgb.T
+    maxc, minc = rgb.max(axis=1), rgb.min(axis=1)
+    l = (maxc + minc) / 2  # noqa
+    d = maxc - minc
+    chromatic = d != 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l > 0.5, d / (2 - maxc - minc), d / (maxc + minc))
+        h = np.where(
+            maxc == r, (g - b) / d + np.where(g < b, 6, 0),
+            np.where(maxc == g, (b - r) / d + 2, (r - g) / d + 4)
+        ) / 6
+    return np.stack([np.where(chromatic, h, 0), l, np.where(chromatic, s, 0)], axis=1)
+
+def _hue2rgb(p: np.ndarray, q: np.ndarray, t: np.ndarray) -> np.ndarray:
+    t = np.where(t < 0, t + 1, t)
+    t = np.where(t > 1, t - 1, t)
+    return np.select(
+        [t < 1/6, t < 1/2, t < 2/3],
+        [p + (q - p) * 6 * t, q, p + (q - p) * (2/3 - t) * 6],
+        p
+    )
+
+def hls2rgb(hls: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of HLS colors to RGB.
+
+    Parameters
+    ----------
+    hls : array-like
+        Array of shape (n, 3) of hue, lightness and saturation values
+        in the range [0, 1].
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n, 3) with channels in the range [0, 1].
+    """
+    h, l, s = _as_rgb_array(hls).T  # noqa
+    q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+    p = 2 * l - q
+    rgb = np.stack([_hue2rgb(p, q, h + 1/3), _hue2rgb(p, q, h), _hue2rgb(p, q, h - 1/3)], axis=1)
+    return np.where((s == 0)[:, None], l[:, None], rgb)
+
+@functools.lru_cache(maxsize=256)
+def _linear_gradient(start_hex: str, finish_hex: str, n: int) -> tuple[str, ...]:
+    if n <= 1:
+        return (rgb2hex(np.asarray(hex2rgb(start_hex)) / 255),)
+    s, f = _hex2ints([start_hex, finish_hex])
+    t = np.arange(n) / (n - 1)
+    gradient = np.trunc(s + t[:, None] * (f - s)).astype(int)
+    return tuple(_ints2hex(gradient))
 
 def linear_gradient(start_hex: str, finish_hex: str, n: int = 10) -> list[str]:
     """
@@ -98,17 +192,20 @@ def linear_gradient(start_hex: str, finish_hex: str, n: int = 10) -> list[str]:
     list[str]
         A list of colors in hex format.
     """
-    s = hex2rgb(start_hex)
-    f = hex2rgb(finish_hex)
-    gradient = [s]
-    for t in range(1, n):
-        curr_vector = tuple(int(s[j] + (float(t)/(n-1))*(f[j]-s[j])) for j in range(3))
-        gradient.append(curr_vector)  # type: ignore[arg-type]
-    return [rgb2hex([c/255. for c in rgb]) for rgb in gradient]  # type: ignore[arg-type]
+    return list(_linear_gradient(start_hex, finish_hex, int(n)))
+
+@functools.lru_cache(maxsize=256)
+def _generate_palette(color: str, n_colors: int) -> tuple[str, ...]:
+    rgb = _hex2ints([color]) / 255
+    h, l, s = rgb2hls(rgb)[0]  # noqa
+    hues = (h + np.arange(n_colors) / n_colors) % 1
+    hls = np.stack([hues, np.full(n_colors, l), np.full(n_colors, s)], axis=1)
+    return tuple(rgb2hex(hls2rgb(hls))) if n_colors else ()
 
 def generate_palette(color: str, n_colors: int = 3) -> list[str]:
     """
-    Generate a palette of colors from a base color.
+    Generate a palette of colors from a base color by rotating its
+    hue, producing the same colors as the frontend.
 
     Parameters
     ----------
@@ -122,20 +219,7 @@ def generate_palette(color: str, n_colors: int = 3) -> list[str]:
     list[str]
         A list of colors in hex format.
     """
-    hex_color = color.lstrip("#")
-    r, g, b = tuple(int(hex_color[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
-    h, l, s = colorsys.rgb_to_hls(r, g, b)  # noqa
-
-    hues = np.linspace(0, 1, int(n_colors) + 1)[:-1]
-    hues += h
-    hues %= 1
-    hues -= hues.astype(int)
-    rgb_palette = [colorsys.hls_to_rgb(h_i, l, s) for h_i in hues]
-    hex_palette = [
-        f"#{int(r_i * 255):02x}{int(g_i * 255):02x}{int(b_i * 255):02x}"
-        for r_i, g_i, b_i in rgb_palette
-    ]
-    return hex_palette
+    return list(_generate_palette(color, int(n_colors)))
 
 
 class MuiDefaultTheme(MaterialDefaultTheme):
@@ -17,7 +17,7 @@ export class SessionStore {
     const old = this.shared_var
     this.shared_var = value
     if (value !== old) {
-      for (const cb of this._callbacks) {
+      for (const cb of [...this._callbacks]) {
         cb(value)
       }
     }
@@ -29,11 +29,14 @@ export class SessionStore {
 
   subscribe(callback) {
     this._callbacks.push(callback)
-    return () => this._callbacks.splice(this._callbacks.indexOf(callback), 1)
+    return () => this.unsubscribe(callback)
   }
 
   unsubscribe(callback) {
-    this._callbacks.splice(this._callbacks.indexOf(callback), 1)
+    const index = this._callbacks.indexOf(callback)
+    if (index > -1) {
+      this._callbacks.splice(index, 1)
+    }
   }
 }
 
@@ -93,18 +96,6 @@ export function render_theme_css(theme) {
   `
 }
 
-function find_on_parent(view, prop) {
-  let current = view
-  const elevations = []
-  while (current != null) {
-    if (current.model?.data?.[prop] != null) {
-      return current.model.data[prop]
-    }
-    current = current.parent
-  }
-  return null
-}
-
 const _hexToRgbCache = new Map()
 
 function hexToRgb(hex, asString = false) {
@@ -179,7 +170,19 @@ function hslToRgb(h, s, l) {
   ];
 }
 
+const _palettes = new Map()
+
 function generatePalette(color, nColors = 3) {
+  const key = `${color}|${nColors}`
+  let palette = _palettes.get(key)
+  if (palette === undefined) {
+    palette = _generatePalette(color, nColors)
+    _palettes.set(key, palette)
+  }
+  return [...palette]
+}
+
+function _generatePalette(color, nColors) {
   // Remove the leading "#" if present
   const hex = color.replace(/^#/, "");
 
@@ -256,15 +259,43 @@ function getMuiElevatedColor(backgroundHex, elevation, isDarkMode = false) {
   return `rgb(${result.r}, ${result.g}, ${result.b})`;
 }
 
+const _elevation_colors = new Map()
+
 function elevation_color(elevation, theme, dark, force = false) {
-  return (elevation && (dark || force)) ? getMuiElevatedColor(theme.palette.background.paper, elevation, dark) : theme.palette.background.paper
+  const paper = theme.palette.background.paper
+  if (!(elevation && (dark || force))) {
+    return paper
+  }
+  const key = `${paper}|${elevation}|${dark}`
+  let color = _elevation_colors.get(key)
+  if (color === undefined) {
+    color = getMuiElevatedColor(paper, elevation, dark)
+    _elevation_colors.set(key, color)
+  }
+  return color
 }
 
-function apply_plotly_theme(model, theme, dark, font_family) {
+const _plotly_themes = new Map()
+
+function apply_plotly_theme(model, theme, dark, font_family, elevations = null) {
   const view = Bokeh.index.find_one_by_id(model.id)
-  const elevation = view ? find_on_parent(view, "elevation") : 0
+  const elevation = view ? find_elevation(view, elevations) : 0
   let paper_color = elevation_color(elevation, theme, dark)
   paper_color = paper_color.startsWith("#") ? hexToRgb(paper_color, true) : paper_color
+  if (model.layout.colorway == null && !model.tags.includes("auto-palette")) {
+    model.tags.push("auto-palette")
+  }
+  const colorway = model.tags.includes("auto-palette") ? generatePalette(theme.palette.primary.main, 10) : model.layout.colorway
+  const key = `${theme_signature(theme)}|${dark}|${font_family}|${paper_color}|${colorway ?? ""}`
+  const {layout, data} = cached(_plotly_themes, key, () => plotly_theme(theme, dark, font_family, paper_color, colorway))
+
+  model.setv({
+    layout: deepmerge(model.layout, layout),
+    data: model.data.map((d) => data[d.type] ? deepmerge(d, data[d.type]) : d),
+  })
+}
+
+function plotly_theme(theme, dark, font_family, paper_color, colorway) {
   const paper_bgcolor = paper_color
   const plot_bgcolor = paper_color
   const font_color_primary = theme.palette.text.primary
@@ -272,10 +303,6 @@ function apply_plotly_theme(model, theme, dark, font_family) {
   const grid_color = theme.palette.divider
   const axis_line_color = theme.palette.divider
   const zero_line_color = theme.palette.divider
-  if (model.layout.colorway == null && !model.tags.includes("auto-palette")) {
-    model.tags.push("auto-palette")
-  }
-  const colorway = model.tags.includes("auto-palette") ? generatePalette(theme.palette.primary.main, 10) : model.layout.colorway
 
   const layout = {
     colorway,
@@ -658,10 +685,7 @@ function apply_plotly_theme(model, theme, dark, font_family) {
     ],
   }
 
-  model.setv({
-    layout: deepmerge(model.layout, layout),
-    data: model.data.map((d) => data[d.type] ? deepmerge(d, data[d.type]) : d),
-  })
+  return {layout, data}
 }
 
 function has_custom_theme(custom_theme, ...names) {
@@ -671,7 +695,10 @@ function has_custom_theme(custom_theme, ...names) {
 function themed_stylesheets(model, key, stylesheet) {
   const marker = `/* ${key} */`
   const next = `${marker}\n${stylesheet}`
-  return [...model.stylesheets.filter(s => !s.includes(marker)), next]
+  if (model.stylesheets.includes(next)) {
+    return model.stylesheets
+  }
+  return [...model.stylesheets.filter(s => typeof s !== "string" || !s.includes(marker)), next]
 }
 
 function alpha(theme, channel, value) {
@@ -679,9 +706,64 @@ function alpha(theme, channel, value) {
   return `rgba(${normalizedChannel}, ${value})`
 }
 
-function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
+// Theme properties only depend on the model type and the theme, so
+// they are computed once per combination and shared by all models.
+const THEME_CACHE_SIZE = 256
+const _theme_signatures = new WeakMap()
+const _theme_props = new Map()
+const _model_categories = new Map()
+
+const BOKEH_CATEGORIES = [
+  "Axis", "Legend", "ColorBar", "Title", "Grid", "Figure", "Toolbar", "Tooltip",
+  "AcePlot", "DataTabulator", "VizzuChart", "ReactFlow", "VegaPlot", "PlotlyPlot",
+  "Split", "HoverTool"
+]
+
+const CUSTOM_THEME_NAMES = {
+  Axis: ["Axis"],
+  Legend: ["Legend"],
+  ColorBar: ["BaseColorBar", "ColorBar"],
+  Title: ["Title"],
+  Grid: ["Grid"],
+  Figure: ["Plot", "Figure"],
+}
+
+function theme_signature(theme) {
+  let signature = _theme_signatures.get(theme)
+  if (signature === undefined) {
+    const palette = theme.palette
+    signature = [
+      palette.mode, palette.text.primary, palette.text.secondary, palette.common.onBackgroundChannel,
+      palette.background.paper, palette.primary.main, palette.divider, theme.chart_style
+    ].join("|")
+    _theme_signatures.set(theme, signature)
+  }
+  return signature
+}
+
+function model_category(model_type) {
+  let category = _model_categories.get(model_type)
+  if (category === undefined) {
+    category = model_type === "Rect" ? "Rect" : (BOKEH_CATEGORIES.find(name => model_type.endsWith(name)) ?? null)
+    _model_categories.set(model_type, category)
+  }
+  return category
+}
+
+function cached(cache, key, compute) {
+  let value = cache.get(key)
+  if (value === undefined) {
+    if (cache.size >= THEME_CACHE_SIZE) {
+      cache.clear()
+    }
+    value = compute()
+    cache.set(key, value)
+  }
+  return value
+}
+
+function bokeh_theme_props(category, theme, dark, font_family) {
   const model_props = {}
-  const model_type = model.type.endsWith("ReactiveESM") ? model.class_name : model.type
   const minimal = theme.chart_style !== "classic"
 
   const text = theme.palette.text.primary
@@ -690,7 +772,7 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
   const axis = alpha(theme, theme.palette.common.onBackgroundChannel, dark ? 0.28 : 0.22)
   const surface = theme.palette.background.paper
 
-  if (model_type.endsWith("Axis") && !has_custom_theme(custom_theme, "Axis")) {
+  if (category === "Axis") {
     model_props.axis_line_color = axis
     model_props.major_tick_line_color = axis
     model_props.minor_tick_line_color = axis
@@ -715,9 +797,7 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
     model_props.axis_label_text_font_size = "1em"
     model_props.axis_label_text_font_style = "normal"
     model_props.axis_label_standoff = 12
-  } else if (model_type == "Rect") {
-    model_props.dilate = dark || model.dilate
-  } else if (model_type.endsWith("Legend") && !has_custom_theme(custom_theme, "Legend")) {
+  } else if (category === "Legend") {
     model_props.background_fill_color = surface
 
     if (minimal) {
@@ -742,7 +822,7 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
     model_props.label_standoff = 8
     model_props.glyph_width = 14
     model_props.glyph_height = 14
-  } else if (model_type.endsWith("ColorBar") && !has_custom_theme(custom_theme, "BaseColorBar", "ColorBar")) {
+  } else if (category === "ColorBar") {
     model_props.background_fill_color = surface
 
     if (minimal) {
@@ -766,58 +846,124 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
     model_props.major_label_text_font = font_family
     model_props.major_label_text_font_size = "0.9em"
     model_props.major_label_text_font_style = "normal"
-  } else if (model_type.endsWith("Title") && !has_custom_theme(custom_theme, "Title")) {
+  } else if (category === "Title") {
     model_props.text_color = text
     model_props.text_font = font_family
     model_props.text_font_size = "1.05em"
     model_props.text_font_style = "normal"
-  } else if (model_type.endsWith("Grid") && !has_custom_theme(custom_theme, "Grid")) {
-    if (model.grid_line_color != null) {
-      model_props.grid_line_color = grid
-      model_props.grid_line_alpha = 1
-    }
-  } else if ((model_type.endsWith("Figure") | model_type.endsWith("Figure")) && !custom_theme.includes("Plot") && !custom_theme.includes("Figure")) {
-    const view = Bokeh.index.find_one_by_id(model.id)
-    const elevation = view ? find_on_parent(view, "elevation") : 0
+  } else if (category === "Grid") {
+    model_props.grid_line_color = grid
+    model_props.grid_line_alpha = 1
+  } else if (category === "Figure") {
     model_props.background_fill_color = theme.palette.background.paper
-    model_props.border_fill_color = elevation_color(elevation, theme, dark)
     model_props.outline_line_color = text
     model_props.outline_line_alpha = minimal ? (dark ? 0.25 : 0) : 1
+  } else if (category === "AcePlot") {
+    model_props.theme = dark ? "github_dark" : "github_light_default"
+  } else if (category === "VegaPlot") {
+    model_props.theme = dark ? "dark" : null
+  }
+  return model_props
+}
+
+function find_elevation(view, elevations = null) {
+  // Walks up the view tree to find the elevation of the closest
+  // parent, caching the result for all views visited on the way
+  const visited = []
+  let current = view
+  let elevation = null
+  while (current != null) {
+    if (elevations?.has(current)) {
+      elevation = elevations.get(current)
+      break
+    }
+    visited.push(current)
+    if (current.model?.data?.elevation != null) {
+      elevation = current.model.data.elevation
+      break
+    }
+    current = current.parent
+  }
+  if (elevations) {
+    for (const v of visited) {
+      elevations.set(v, elevation)
+    }
+  }
+  return elevation
+}
+
+function set_changed(model, props) {
+  // Only apply properties which actually change, avoiding change
+  // events and re-renders when a model is already themed
+  const changed = {}
+  let n = 0
+  for (const [key, value] of Object.entries(props)) {
+    if (model[key] !== value) {
+      changed[key] = value
+      n++
+    }
+  }
+  if (n > 0) {
+    model.setv(changed)
+  }
+}
+
+function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[], elevations=null) {
+  const model_type = model.type.endsWith("ReactiveESM") ? model.class_name : model.type
+  const category = model_category(model_type)
+  if (category === null) {
+    return
+  }
+  const custom = CUSTOM_THEME_NAMES[category]
+  if (custom && has_custom_theme(custom_theme, ...custom)) {
+    return
+  }
+  const key = `${category}|${theme_signature(theme)}|${dark}|${font_family}`
+  const model_props = {...cached(_theme_props, key, () => bokeh_theme_props(category, theme, dark, font_family))}
+
+  if (category === "Rect") {
+    model_props.dilate = dark || model.dilate
+  } else if (category === "Grid") {
+    if (model.grid_line_color == null) {
+      return
+    }
+  } else if (category === "Figure") {
+    const view = Bokeh.index.find_one_by_id(model.id)
+    const elevation = view ? find_elevation(view, elevations) : 0
+    model_props.border_fill_color = elevation_color(elevation, theme, dark)
     if (view) {
-      apply_bokeh_theme(view.canvas_view.model, theme, dark, font_family, custom_theme)
+      apply_bokeh_theme(view.canvas_view.model, theme, dark, font_family, custom_theme, elevations)
     }
-  } else if (model_type.endsWith("Toolbar")) {
-    const stylesheet = `.bk-right.bk-active, .bk-above.bk-active {
+  } else if (category === "Toolbar") {
+    model_props.stylesheets = themed_stylesheets(model, "panel-mui-toolbar", `.bk-right.bk-active, .bk-above.bk-active {
       --highlight-color: ${theme.palette.primary.main} !important;
-    }`
-    model_props.stylesheets = [...model.stylesheets, stylesheet]
-  } else if (model_type.endsWith("Tooltip")) {
-    model.stylesheets = [...model.stylesheets, `
+    }`)
+  } else if (category === "Tooltip") {
+    model_props.stylesheets = themed_stylesheets(model, "panel-mui-tooltip", `
       .bk-tooltip-row-label {
         color: ${theme.palette.primary.main} !important;
-      `
-    ]
-  } else if (model_type.endsWith("AcePlot")) {
-    const view = Bokeh.index.find_one_by_id(model.id)
-    model_props.theme = dark ? "github_dark" : "github_light_default"
-    model.stylesheets = [...model.stylesheets, `
+      `)
+  } else if (category === "AcePlot") {
+    model_props.stylesheets = themed_stylesheets(model, "panel-mui-ace", `
       :host {
         --border-color: rgba(${theme.palette.common.onBackgroundChannel} / 0.23);
       }
-    `]
-  } else if (model_type.endsWith("DataTabulator")) {
+    `)
+  } else if (category === "DataTabulator") {
     const view = Bokeh.index.find_one_by_id(model.id)
-    const elevation = view ? find_on_parent(view, "elevation") : 0
-    model.stylesheets = [...model.stylesheets, `
+    const elevation = view ? find_elevation(view, elevations) : 0
+    model_props.stylesheets = themed_stylesheets(model, "panel-mui-tabulator", `
       :host {
         --mdc-theme-background: ${elevation_color(elevation, theme, dark)};
         --mdc-theme-surface: ${elevation_color(elevation+1, theme, dark, true)};
       }
-    `]
-  } else if (model_type.endsWith("VizzuChart")) {
+    `)
+  } else if (category === "VizzuChart") {
     const view = Bokeh.index.find_one_by_id(model.id)
-    const elevation = view ? find_on_parent(view, "elevation") : 0
+    const elevation = view ? find_elevation(view, elevations) : 0
     const background = elevation_color(elevation, theme, dark, true)
+    const text = theme.palette.text.primary
+    const muted = theme.palette.text.secondary
     model_props.style = deepmerge(model.style ?? {}, {
       backgroundColor: background,
       plot: {
@@ -826,7 +972,7 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
         xAxis: {
           color: muted,
           label: {color: muted},
-          interlacing: {color: surface}
+          interlacing: {color: theme.palette.background.paper}
         },
         yAxis: {
           color: muted,
@@ -840,32 +986,28 @@ function apply_bokeh_theme(model, theme, dark, font_family, custom_theme=[]) {
       title: {color: text},
       legend: {label: {color: text}},
     })
-  } else if (model_type.endsWith("ReactFlow")) {
+  } else if (category === "ReactFlow") {
     model.data.color_mode = dark ? "dark" : "light"
-  } else if (model_type.endsWith("VegaPlot")) {
-    model_props.theme = dark ? "dark" : null
-  } else if (model_type.endsWith("PlotlyPlot")) {
-    apply_plotly_theme(model, theme, dark, font_family)
-  } else if (model_type.endsWith("Split")) {
+  } else if (category === "PlotlyPlot") {
+    apply_plotly_theme(model, theme, dark, font_family, elevations)
+  } else if (category === "Split") {
     const view = Bokeh.index.find_one_by_id(model.id)
-    const elevation = find_on_parent(view, "elevation")
-    model.stylesheets = [...model.stylesheets, `
+    const elevation = find_elevation(view, elevations)
+    model_props.stylesheets = themed_stylesheets(model, "panel-mui-split", `
       :host {
         --border-color: rgba(${theme.palette.common.onBackgroundChannel} / 0.23);
         --panel-background-color: ${elevation_color(elevation, theme, dark)};
       }
-    `]
-  } else if (model_type.endsWith("HoverTool")) {
+    `)
+  } else if (category === "HoverTool") {
     const view = Bokeh.index.find_one_by_id(model.id)
     if (view) {
       view.ttmodels.forEach(ttmodel => {
-        apply_bokeh_theme(ttmodel, theme, dark, font_family, custom_theme)
+        apply_bokeh_theme(ttmodel, theme, dark, font_family, custom_theme, elevations)
       })
     }
   }
-  if (Object.keys(model_props).length > 0) {
-    model.setv(model_props)
-  }
+  set_changed(model, model_props)
 }
 
 const headingStyle = (fontSize, lineHeight) => ({
@@ -912,17 +1054,17 @@ export function render_theme_config(props, theme_config, dark_theme) {
     components: {
       MuiPopover: {
         defaultProps: {
-          container: props.view.container,
+          container: props?.view.container,
         },
       },
       MuiPopper: {
         defaultProps: {
-          container: props.view.container,
+          container: props?.view.container,
         },
       },
       MuiModal: {
         defaultProps: {
-          container: props.view.container,
+          container: props?.view.container,
         },
       },
       MuiIconButton: {
@@ -1113,6 +1255,8 @@ export const apply_global_css = (model, view, theme) => {
   }, [theme])
 }
 
+const _themed_documents = new WeakMap()
+
 export const setup_global_styles = (view, theme, custom_theme=[]) => {
   const doc = view.model.document
   let global_style_el = document.querySelector("#global-styles-panel-mui")
@@ -1166,11 +1310,12 @@ export const setup_global_styles = (view, theme, custom_theme=[]) => {
       ) : (
         theme.typography.fontFamily
       )
+      const elevations = new Map()
       models.forEach(model => {
         model.references().forEach((ref) => {
-          apply_bokeh_theme(ref, theme, dark, font_family, custom_theme)
+          apply_bokeh_theme(ref, theme, dark, font_family, custom_theme, elevations)
         })
-        apply_bokeh_theme(model, theme, dark, font_family, custom_theme)
+        apply_bokeh_theme(model, theme, dark, font_family, custom_theme, elevations)
       })
     }
     doc.on_change(cb)
@@ -1185,14 +1330,112 @@ export const setup_global_styles = (view, theme, custom_theme=[]) => {
     ) : (
       theme.typography.fontFamily
     )
-    doc.all_models.forEach(model => apply_bokeh_theme(model, theme, dark, font_family, custom_theme))
+    // Multiple components may set up the global styles, the document
+    // only has to be re-themed once for each theme
+    const key = `${theme_signature(theme)}|${font_family}|${custom_theme.join(",")}`
+    if (_themed_documents.get(doc) !== key) {
+      _themed_documents.set(doc, key)
+      const elevations = new Map()
+      doc.all_models.forEach(model => apply_bokeh_theme(model, theme, dark, font_family, custom_theme, elevations))
+    }
     global_style_el.textContent = render_theme_css(theme)
     page_style_el.textContent = render_page_css(theme)
   }, [theme])
 }
 
+// Compiled themes shared by all components with the same theme
+// configuration and dark mode, ordered by least recent use.
+const COMPILED_THEME_CACHE_SIZE = 16
+const _compiled_themes = new Map()
+
+/**
+ * Compiles the theme for the supplied configuration and dark mode
+ * once per session, since createTheme is expensive and most components
+ * share the same configuration.
+ */
+export function compile_theme(theme_config, dark_theme) {
+  const key = `${dark_theme ? 1 : 0}${JSON.stringify(theme_config ?? null)}`
+  let theme = _compiled_themes.get(key)
+  if (theme === undefined) {
+    theme = createTheme(render_theme_config(null, theme_config, dark_theme))
+    if (_compiled_themes.size >= COMPILED_THEME_CACHE_SIZE) {
+      _compiled_themes.delete(_compiled_themes.keys().next().value)
+    }
+  } else {
+    _compiled_themes.delete(key)
+  }
+  _compiled_themes.set(key, theme)
+  return theme
+}
+
+// Components rendering popups into the container of the view
+const CONTAINER_COMPONENTS = ["MuiPopover", "MuiPopper", "MuiModal"]
+
+/**
+ * Derives a theme rendering popups into the supplied container from a
+ * shared theme without compiling a new theme.
+ */
+export function with_container(theme, container) {
+  const components = {...theme.components}
+  for (const name of CONTAINER_COMPONENTS) {
+    const component = components[name] || {}
+    components[name] = {...component, defaultProps: {...component.defaultProps, container}}
+  }
+  return {...theme, components}
+}
+
+// Theme CSS shared across shadow roots as constructed stylesheets
+const _theme_sheets = new WeakMap()
+const _adopted_sheets = new WeakMap()
+
+/**
+ * Applies the CSS variables and styles of the theme to the shadow root
+ * of the view. Where supported a single constructed stylesheet per
+ * theme is adopted by all shadow roots, otherwise a style element is
+ * inserted into each shadow root.
+ */
+export function adopt_theme_css(view, theme) {
+  const root = view.shadow_el
+  if (root == null) {
+    return
+  }
+  if (typeof CSSStyleSheet === "undefined" || !("adoptedStyleSheets" in root) || !("replaceSync" in CSSStyleSheet.prototype)) {
+    let style_el = root.querySelector("#styles-panel-mui")
+    if (style_el == null) {
+      style_el = document.createElement("style")
+      style_el.id = "styles-panel-mui"
+      root.insertBefore(style_el, view.container)
+    }
+    style_el.textContent = render_theme_css(theme)
+    return
+  }
+  let sheet = _theme_sheets.get(theme)
+  if (sheet === undefined) {
+    sheet = new CSSStyleSheet()
+    sheet.replaceSync(render_theme_css(theme))
+    _theme_sheets.set(theme, sheet)
+  }
+  const previous = _adopted_sheets.get(root)
+  if (previous === sheet) {
+    return
+  }
+  root.adoptedStyleSheets = [...root.adoptedStyleSheets.filter((s) => s !== previous), sheet]
+  _adopted_sheets.set(root, sheet)
+}
+
 export const install_theme_hooks = (props) => {
-  const [dark_theme, setDarkTheme] = props.model.useState("dark_theme")
+  // The dark mode is switched entirely on the client via the shared
+  // dark_mode store, the dark_theme parameter is only read to pick up
+  // changes made on the server and is never synced back.
+  const [dark_theme_param] = props.model.useState("dark_theme")
+  const [dark_theme, setDarkTheme] = React.useState(() => dark_mode.get_value() ?? dark_theme_param)
+  const param_ref = React.useRef(dark_theme_param)
+  React.useEffect(() => {
+    if (param_ref.current !== dark_theme_param) {
+      param_ref.current = dark_theme_param
+      setDarkTheme(dark_theme_param)
+    }
+  }, [dark_theme_param])
 
   // ALERT: Unclear why this is needed, the dark_theme state variable
   // on it's own does not seem stable
@@ -1266,21 +1509,11 @@ export const install_theme_hooks = (props) => {
     }
   }, [])
   React.useEffect(() => update_views(), [dark_theme])
-  const theme = React.useMemo(() => {
-    const config = render_theme_config(props, theme_config, dark_theme)
-    return createTheme(config)
-  }, [dark_theme, theme_config])
+  const shared_theme = React.useMemo(() => compile_theme(theme_config, dark_theme), [dark_theme, theme_config])
+  const theme = React.useMemo(() => with_container(shared_theme, props.view.container), [shared_theme])
 
-  // Sync local dark_mode with global dark mode
-  const isFirstRender = React.useRef(true)
-  React.useEffect(() => {
-    if (isFirstRender.current && dark_mode.get_value() != null) {
-      isFirstRender.current = false
-      setDarkTheme(dark_mode.get_value())
-      return
-    }
-    dark_mode.set_value(dark_theme)
-  }, [dark_theme])
+  // Sync local dark mode with global dark mode
+  React.useEffect(() => dark_mode.set_value(dark_theme), [dark_theme])
 
   React.useEffect(() => {
     // If the page has a data-theme attribute (e.g. from pydata-sphinx-theme), use it to set the dark theme
@@ -1291,23 +1524,19 @@ export const install_theme_hooks = (props) => {
     }
 
     const cb = (val) => setDarkTheme(val)
-    if (document.documentElement.dataset.themeManaged === "true") {
+    const managed = document.documentElement.dataset.themeManaged === "true"
+    if (managed || props.model.esm_constants?.follow_dark_mode) {
       dark_mode.subscribe(cb)
-    } else {
-      const style_el = document.createElement("style")
-      style_el.id = "styles-panel-mui"
-      props.view.shadow_el.insertBefore(style_el, props.view.container)
-      style_el.textContent = render_theme_css(theme)
     }
     return () => dark_mode.unsubscribe(cb)
   }, [])
 
   React.useEffect(() => {
-    const style_el = props.view.shadow_el.querySelector("#styles-panel-mui")
-    if (style_el) {
-      style_el.textContent = render_theme_css(theme)
+    const managed = document.documentElement.dataset.themeManaged === "true"
+    if (!managed && props.view.use_shadow_dom !== false) {
+      adopt_theme_css(props.view, shared_theme)
     }
-  }, [theme])
+  }, [shared_theme])
   return theme
 }
 
@@ -1401,6 +1630,11 @@ export function child_at_latest(el, child) {
   return bottom <= el.scrollTop + el.clientHeight + 1 && distance_from_latest(el) <= 1
 }
 
+// Time without resizes after which the scroll to the latest child
+// is considered settled, and the maximum time to wait for it
+const SETTLE_QUIET_MS = 100
+const SETTLE_TIMEOUT_MS = 4000
+
 export function use_latest_scroll_settlement({
   boxRef,
   pendingScrollLatestRef,
@@ -1410,9 +1644,10 @@ export function use_latest_scroll_settlement({
   onDefaultSettled = null,
   layoutUpdatedRef = null,
 }) {
-  const scrollFrameRef = React.useRef(null)
-  const scrollStableFramesRef = React.useRef(0)
-  const scrollHeightRef = React.useRef(null)
+  const resizeObserverRef = React.useRef(null)
+  const quietTimerRef = React.useRef(null)
+  const timeoutRef = React.useRef(null)
+  const requireLayoutUpdateRef = React.useRef(false)
   const scrollSettledCallbackRef = React.useRef(null)
   const scrollToLatestRef = React.useRef(scrollToLatest)
   const latestChildAtBottomRef = React.useRef(latestChildAtBottom)
@@ -1422,18 +1657,16 @@ export function use_latest_scroll_settlement({
   onDefaultSettledRef.current = onDefaultSettled
 
   const stopScrollLatestSettlement = React.useCallback(() => {
-    if (scrollFrameRef.current !== null) {
-      cancelAnimationFrame(scrollFrameRef.current)
-      scrollFrameRef.current = null
-    }
-    scrollStableFramesRef.current = 0
-    scrollHeightRef.current = null
+    resizeObserverRef.current?.disconnect()
+    resizeObserverRef.current = null
+    clearTimeout(quietTimerRef.current)
+    clearTimeout(timeoutRef.current)
+    quietTimerRef.current = timeoutRef.current = null
   }, [])
 
   const finishScrollLatestSettlement = React.useCallback(() => {
+    stopScrollLatestSettlement()
     pendingScrollLatestRef.current = false
-    scrollStableFramesRef.current = 0
-    scrollHeightRef.current = null
     const callback = scrollSettledCallbackRef.current
     scrollSettledCallbackRef.current = null
     if (callback) {
@@ -1449,41 +1682,154 @@ export function use_latest_scroll_settlement({
       topAnchorRef.current = null
     }
     scrollSettledCallbackRef.current = onSettled
+    requireLayoutUpdateRef.current = requireLayoutUpdate
     stopScrollLatestSettlement()
 
-    const tick = (remainingFrames) => {
-      scrollFrameRef.current = null
+    const el = boxRef.current
+    if (!el) {
+      finishScrollLatestSettlement()
+      return
+    }
+
+    // Follow the latest child whenever the content resizes, e.g. as
+    // children are laid out, and settle once it stops resizing
+    const check = () => {
       const el = boxRef.current
-      if (!el) {
+      const layoutReady = !requireLayoutUpdateRef.current || layoutUpdatedRef?.current
+      if (!el || (layoutReady && latestChildAtBottomRef.current(el))) {
         finishScrollLatestSettlement()
         return
       }
-
       scrollToLatestRef.current()
-      const heightStable = (
-        scrollHeightRef.current !== null &&
-        Math.abs(el.scrollHeight - scrollHeightRef.current) <= 1
-      )
-      const layoutReady = !requireLayoutUpdate || layoutUpdatedRef?.current
-      scrollHeightRef.current = el.scrollHeight
-      if (latestChildAtBottomRef.current(el) && heightStable && layoutReady) {
-        scrollStableFramesRef.current += 1
-      } else {
-        scrollStableFramesRef.current = 0
-      }
-
-      if (scrollStableFramesRef.current >= 30 || remainingFrames <= -600 || (remainingFrames <= 0 && !requireLayoutUpdate)) {
+      quietTimerRef.current = setTimeout(check, SETTLE_QUIET_MS)
+    }
+    const onResize = () => {
+      if (!boxRef.current) {
         finishScrollLatestSettlement()
         return
       }
+      scrollToLatestRef.current()
+      clearTimeout(quietTimerRef.current)
+      quietTimerRef.current = setTimeout(check, SETTLE_QUIET_MS)
+    }
+    const observer = new ResizeObserver(onResize)
+    observer.observe(el)
+    for (const child of el.children) {
+      observer.observe(child)
+    }
+    resizeObserverRef.current = observer
+    timeoutRef.current = setTimeout(finishScrollLatestSettlement, SETTLE_TIMEOUT_MS)
+  }, [])
+
+  return {startScrollLatestSettlement, stopScrollLatestSettlement, scrollSettledCallbackRef}
+}
 
-      scrollFrameRef.current = requestAnimationFrame(() => tick(remainingFrames - 1))
+const NO_PENDING = Symbol("no_pending")
+
+export function use_update_policy(model, prop) {
+  // Wraps model.useState applying the widget's update_policy before
+  // changes are synced. Returns the local value, a setter which is
+  // throttled, debounced or deferred according to the policy and a
+  // flush callback which immediately syncs the pending (or a new) value.
+  const [value, setValue] = model.useState(prop)
+  const [update_policy] = model.useState("update_policy")
+  const [update_delay] = model.useState("update_delay")
+  const [local, setLocal] = React.useState(value)
+  const pendingRef = React.useRef(NO_PENDING)
+  const timerRef = React.useRef(null)
+  const lastSentRef = React.useRef(0)
+  const setValueRef = React.useRef(setValue)
+  setValueRef.current = setValue
+
+  React.useEffect(() => {
+    if (pendingRef.current === NO_PENDING) {
+      setLocal(value)
     }
+  }, [value])
 
-    scrollFrameRef.current = requestAnimationFrame(() => tick(240))
+  const flush = React.useCallback((new_value = NO_PENDING) => {
+    if (timerRef.current !== null) {
+      clearTimeout(timerRef.current)
+      timerRef.current = null
+    }
+    if (new_value !== NO_PENDING) {
+      setLocal(new_value)
+      pendingRef.current = new_value
+    }
+    if (pendingRef.current === NO_PENDING) {
+      return
+    }
+    const pending = pendingRef.current
+    pendingRef.current = NO_PENDING
+    lastSentRef.current = Date.now()
+    setValueRef.current(pending)
   }, [])
 
-  return {startScrollLatestSettlement, stopScrollLatestSettlement, scrollSettledCallbackRef}
+  React.useEffect(() => () => flush(), [])
+
+  const update = React.useCallback((new_value) => {
+    setLocal(new_value)
+    pendingRef.current = new_value
+    if (update_policy === "commit") {
+      return
+    } else if (update_policy === "debounce") {
+      if (timerRef.current !== null) {
+        clearTimeout(timerRef.current)
+      }
+      timerRef.current = setTimeout(flush, update_delay)
+      return
+    }
+    const elapsed = Date.now() - lastSentRef.current
+    if (elapsed >= update_delay) {
+      flush()
+    } else if (timerRef.current === null) {
+      timerRef.current = setTimeout(flush, update_delay - elapsed)
+    }
+  }, [update_policy, update_delay])
+
+  if (update_policy === "immediate") {
+    return [value, setValue, (new_value = NO_PENDING) => (new_value === NO_PENDING ? null : setValue(new_value))]
+  }
+  return [local, update, flush]
+}
+
+// Updates further apart than this are not considered part of a
+// continuous stream of progress updates.
+const MAX_PROGRESS_INTERVAL = 2000
+
+export function use_progress_rate(value) {
+  // Tracks the interval between updates of a progress value and the
+  // rate of progress (smoothed with an exponential moving average)
+  // returning the interval, to animate between updates, and the
+  // estimated time remaining in milliseconds.
+  const stats = React.useRef({time: null, value: null, interval: null, rate: null})
+  const current = stats.current
+  if (typeof value === "number" && value !== current.value) {
+    const now = performance.now()
+    const elapsed = current.time === null ? null : now - current.time
+    if (elapsed === null || value < current.value || elapsed > MAX_PROGRESS_INTERVAL) {
+      current.interval = null
+      current.rate = null
+    } else {
+      const rate = (value - current.value) / elapsed
+      current.interval = current.interval === null ? elapsed : 0.7 * current.interval + 0.3 * elapsed
+      current.rate = current.rate === null ? rate : 0.7 * current.rate + 0.3 * rate
+    }
+    current.time = now
+    current.value = value
+  }
+  const eta = (current.rate && value < 100) ? (100 - value) / current.rate : null
+  return {interval: current.interval, eta}
+}
+
+export function format_duration(ms) {
+  const seconds = Math.max(Math.round(ms / 1000), 0)
+  if (seconds < 60) {
+    return `${seconds}s`
+  } else if (seconds < 3600) {
+    return `${Math.floor(seconds / 60)}m ${seconds % 60}s`
+  }
+  return `${Math.floor(seconds / 3600)}h ${Math.floor((seconds % 3600) / 60)}m`
 }
 
 // Size parsing function matching FileDropper
@@ -1537,58 +1883,170 @@ export function formatBytes(bytes) {
   return `${parseFloat((bytes / k**i).toFixed(2))} ${sizes[i]}`
 }
 
-// Chunked upload function using FileDropper's protocol
-export async function uploadFileChunked(file, model, chunkSize = 10 * 1024 * 1024, setProgress = null, combined_chunks = null) {
-  const total_chunks = Math.ceil(file.size / chunkSize);
-
-  for (let chunkIndex = 0; chunkIndex < total_chunks; chunkIndex++) {
-    const start = chunkIndex * chunkSize;
-    const end = Math.min(start + chunkSize, file.size)
-    const chunk = file.slice(start, end)
-
-    // Read chunk as ArrayBuffer
-    const arrayBuffer = await new Promise((resolve, reject) => {
-      const reader = new FileReader()
-      reader.onload = () => resolve(reader.result)
-      reader.onerror = reject
-      reader.readAsArrayBuffer(chunk)
-    });
-
-    // Send chunk using FileDropper's protocol
-    model.send_msg({
+const DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+const MAX_CHUNK_RETRIES = 3
+
+// Ids of files whose upload was interrupted and may be resumed
+const INCOMPLETE_UPLOADS = new Set()
+
+function upload_file_id(file) {
+  return `${file.name}:${file.size}:${file.lastModified}`
+}
+
+async function chunk_checksum(buffer) {
+  // SubtleCrypto is only available in secure contexts
+  if (!globalThis.crypto?.subtle) { return null }
+  const digest = await globalThis.crypto.subtle.digest("SHA-256", buffer)
+  return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, "0")).join("")
+}
+
+// Dispatches the acknowledgements sent by the server during an upload
+// to the requests awaiting them.
+class UploadChannel {
+  constructor(model, timeout = 60000) {
+    this.model = model
+    this.timeout = timeout
+    this.pending = new Map()
+    this.handler = (msg) => {
+      let key
+      if (msg.status === "ack" || msg.status === "nack") {
+        key = `${msg.file_id}:${msg.chunk}`
+      } else if (msg.status === "resume") {
+        key = `resume:${msg.file_id}`
+      } else {
+        return
+      }
+      const entry = this.pending.get(key)
+      if (entry) {
+        this.pending.delete(key)
+        clearTimeout(entry.timer)
+        entry.resolve(msg)
+      }
+    }
+    model.on("msg:custom", this.handler)
+  }
+
+  request(key, msg) {
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(key)
+        reject(new Error("Timeout waiting for upload acknowledgement."))
+      }, this.timeout)
+      this.pending.set(key, {resolve, timer})
+      this.model.send_msg(msg)
+    })
+  }
+
+  close() {
+    this.model.off("msg:custom", this.handler)
+    for (const {timer} of this.pending.values()) {
+      clearTimeout(timer)
+    }
+    this.pending.clear()
+  }
+}
+
+// Resolves with the first custom message sent by the server matching
+// the predicate (or a "removed" status if the component is removed).
+export function waitForMessage(model, predicate, timeout = 60000) {
+  return new Promise((resolve, reject) => {
+    let timer = null
+    const onMsg = (msg) => {
+      if (predicate(msg)) {
+        cleanup()
+        resolve(msg)
+      }
+    }
+    const onRemove = () => {
+      cleanup()
+      resolve({status: "removed"})
+    }
+    const cleanup = () => {
+      clearTimeout(timer)
+      model.off("msg:custom", onMsg)
+      model.off("remove", onRemove)
+    }
+    timer = setTimeout(() => {
+      cleanup()
+      reject(new Error("Timeout waiting for upload."))
+    }, timeout)
+    model.on("msg:custom", onMsg)
+    model.on("remove", onRemove)
+  })
+}
+
+// Chunked upload using FileDropper's protocol extended with per-chunk
+// acknowledgements. Up to `window` chunks are in flight at once, the
+// next chunk is read while earlier chunks are awaiting acknowledgement
+// and interrupted uploads resume from the chunks the server received.
+export async function uploadFileChunked(file, model, {
+  chunkSize = DEFAULT_CHUNK_SIZE, window = 4, checksum = false, channel = null, onChunk = null
+} = {}) {
+  const owned = channel == null
+  channel = channel ?? new UploadChannel(model)
+  const file_id = upload_file_id(file)
+  const total_chunks = Math.ceil(file.size / chunkSize)
+
+  const send_chunk = async (chunk, data, attempt = 0) => {
+    const msg = {
       type: "status",
       status: "upload_event",
-      chunk: chunkIndex + 1, // 1-indexed
-      data: arrayBuffer,
+      chunk, // 1-indexed
+      data,
       name: file.name,
+      file_id,
       total_chunks,
       mime_type: file.type
-    })
-    if (setProgress) {
-      setProgress(((chunkIndex+1) / (combined_chunks ?? total_chunks)) * 100)
+    }
+    if (checksum) {
+      const digest = await chunk_checksum(data)
+      if (digest) { msg.checksum = digest }
+    }
+    const reply = await channel.request(`${file_id}:${chunk}`, msg)
+    if (reply.status === "nack") {
+      if (attempt >= MAX_CHUNK_RETRIES) {
+        throw new Error(reply.error ?? `Chunk ${chunk} of "${file.name}" was rejected.`)
+      }
+      await send_chunk(chunk, data, attempt + 1)
     }
   }
-}
 
-export function waitForRef(ref, interval = 100, timeout = 60000) {
-  return new Promise((resolve, reject) => {
-    const start = Date.now();
-    const id = setInterval(() => {
-      if (ref.current !== null && ref.current !== undefined) {
-        clearInterval(id)
-        ref.current = null
-        resolve(ref.current)
-      } else if (Date.now() - start > timeout) {
-        ref.current = null
-        clearInterval(id)
-        reject(new Error("Timeout waiting for upload."));
+  try {
+    let received = new Set()
+    if (INCOMPLETE_UPLOADS.has(file_id)) {
+      const state = await channel.request(`resume:${file_id}`, {type: "status", status: "resume", file_id})
+      received = new Set(state.chunks)
+    }
+    INCOMPLETE_UPLOADS.add(file_id)
+
+    const inflight = new Set()
+    for (let chunk = 1; chunk <= total_chunks; chunk++) {
+      if (received.has(chunk)) {
+        if (onChunk) { onChunk() }
+        continue
       }
-    }, interval);
-  });
+      while (inflight.size >= window) {
+        await Promise.race(inflight)
+      }
+      const start = (chunk - 1) * chunkSize
+      const data = await file.slice(start, Math.min(start + chunkSize, file.size)).arrayBuffer()
+      const task = send_chunk(chunk, data).then(() => {
+        inflight.delete(task)
+        if (onChunk) { onChunk() }
+      })
+      // Failures are surfaced through Promise.race/Promise.all
+      task.catch(() => {})
+      inflight.add(task)
+    }
+    await Promise.all(inflight)
+    INCOMPLETE_UPLOADS.delete(file_id)
+  } finally {
+    if (owned) { channel.close() }
+  }
 }
 
-// New chunked file processing function
-export async function processFilesChunked(files, model, maxFileSize, maxTotalFileSize, chunkSize = 10 * 1024 * 1024, setProgress = null, final_ref = null) {
+export async function processFilesChunked(files, model, maxFileSize, maxTotalFileSize, chunkSize = DEFAULT_CHUNK_SIZE, setProgress = null) {
+  const channel = new UploadChannel(model)
   try {
     const fileArray = Array.from(files);
 
@@ -1602,24 +2060,38 @@ export async function processFilesChunked(files, model, maxFileSize, maxTotalFil
       combined_chunks += Math.ceil(file.size / chunkSize);
     }
 
-    model.send_msg({status: "initializing", type: "status"})
+    // Partially received files not part of this upload are dropped
+    model.send_msg({status: "initializing", type: "status", file_ids: fileArray.map(upload_file_id)})
 
     // Upload all files using chunked protocol
+    let uploaded = 0
+    const options = {
+      chunkSize,
+      window: model.upload_window ?? 4,
+      checksum: model.upload_checksum ?? false,
+      channel,
+      onChunk: setProgress ? () => setProgress((++uploaded / combined_chunks) * 100) : null
+    }
     for (const file of fileArray) {
-      await uploadFileChunked(file, model, chunkSize, setProgress, combined_chunks)
+      await uploadFileChunked(file, model, options)
     }
 
+    // Wait for the server to signal that the files were processed
+    const finished = waitForMessage(model, (msg) => msg.status === "finished" || msg.status === "error")
     model.send_msg({status: "finished", type: "status"})
     if (setProgress) {
       setProgress(null)
     }
-    if (final_ref) {
-      await waitForRef(final_ref)
+    const result = await finished
+    if (result.status === "error") {
+      throw new Error(result.error)
     }
     return fileArray.length
   } catch (error) {
     model.send_msg({status: "error", error: error.message, type: "status"})
     throw error
+  } finally {
+    channel.close()
   }
 }
 
@@ -1652,6 +2124,131 @@ export function isFileAccepted(file, accept) {
   })
 }
 
+// Boolean item fields packed into the flags of columnar items, must
+// match FLAGS in widgets/_items.py.
+const ITEM_FLAGS = ["open", "disabled", "selectable"]
+
+/**
+ * Decodes menu items sent in the columnar format of MenuItems to a
+ * nested list of items. Lists of items are returned unchanged.
+ *
+ * Parents always precede their children, so the tree is built in a
+ * single pass over the rows.
+ *
+ * @param {Array|Object} items - List of items or columnar items.
+ * @returns {Array} - Nested list of items.
+ */
+export function decode_items(items) {
+  if (items == null || Array.isArray(items) || !items.columnar) {
+    return items
+  }
+  const {label, parent, id, flags} = items
+  const fields = Object.entries(items.fields || {})
+  const nodes = new Array(label.length)
+  const roots = []
+  for (let i = 0; i < label.length; i++) {
+    let node = null
+    if (label[i] != null) {
+      node = {label: label[i]}
+      if (id && id[i] != null) {
+        node.id = id[i]
+      }
+      for (const [name, values] of fields) {
+        if (values[i] != null) {
+          node[name] = values[i]
+        }
+      }
+      if (flags && flags[i]) {
+        ITEM_FLAGS.forEach((flag, k) => {
+          if (flags[i] & (1 << (2*k))) {
+            node[flag] = Boolean(flags[i] & (1 << (2*k+1)))
+          }
+        })
+      }
+    }
+    nodes[i] = node
+    if (parent[i] < 0) {
+      roots.push(node)
+    } else if (nodes[parent[i]] != null) {
+      const parent_node = nodes[parent[i]]
+      if (parent_node.items === undefined) {
+        parent_node.items = []
+      }
+      parent_node.items.push(node)
+    }
+  }
+  return roots
+}
+
+const pad = (value, width = 2) => String(value).padStart(width, "0")
+
+/**
+ * Formats the value of an encoded option as its label, must match the
+ * formatting in widgets/_options.py.
+ *
+ * @param {number} value - Number or milliseconds since the epoch.
+ * @param {Object} format - The format of the encoded options.
+ * @returns {string} - The option label.
+ */
+export function format_option(value, format) {
+  if (format.datetime) {
+    const date = new Date(value)
+    const parts = {
+      Y: pad(date.getUTCFullYear(), 4),
+      m: pad(date.getUTCMonth() + 1),
+      d: pad(date.getUTCDate()),
+      H: pad(date.getUTCHours()),
+      M: pad(date.getUTCMinutes()),
+      S: pad(date.getUTCSeconds()),
+    }
+    return format.datetime.replace(/%([YmdHMS])/g, (_, directive) => parts[directive])
+  } else if (format.precision != null) {
+    return value.toFixed(format.precision)
+  }
+  const label = String(value)
+  return (format.float && Number.isInteger(value)) ? `${label}.0` : label
+}
+
+/**
+ * Decodes the options of a discrete slider, which are either a list
+ * of labels or encoded as a range or a packed array of values.
+ * Encoded labels are formatted on demand and cached.
+ *
+ * @param {Array|Object} options - List of labels or encoded options.
+ * @returns {{length: number, at: function(number): string}} - The labels.
+ */
+export function decode_options(options) {
+  if (options == null) {
+    return []
+  } else if (Array.isArray(options)) {
+    return options
+  }
+  const {size, format, start, step, offsets, values} = options
+  const cache = new Map()
+  const value_at = (i) => {
+    if (values != null) {
+      return values[i]
+    } else if (offsets != null) {
+      return start + offsets[i]
+    }
+    return start + i * step
+  }
+  return {
+    length: size,
+    at(i) {
+      if (i == null || i < 0 || i >= size) {
+        return undefined
+      }
+      let label = cache.get(i)
+      if (label === undefined) {
+        label = format_option(value_at(i), format)
+        cache.set(i, label)
+      }
+      return label
+    }
+  }
+}
+
 /**
  * Parses an icon name with optional variant suffix and returns the baseClassName and clean icon name.
  *
@@ -15,6 +15,7 @@ export function render({model, el, view}) {
   const [sx] = model.useState("sx")
   const [value, setValue] = model.useState("value")
   const exclusive = model.esm_constants.exclusive
+  const value_set = React.useMemo(() => new Set(exclusive ? [] : value), [value])
 
   return (
     <FormControl component="fieldset" disabled={disabled} fullWidth>
@@ -43,7 +44,7 @@ export function render({model, el, view}) {
                 let newValue
                 if (exclusive) {
                   newValue = option
-                } else if (value.includes(option)) {
+                } else if (value_set.has(option)) {
                   newValue = value.filter((v) => v !== option)
                 } else {
                   newValue = [...value]
@@ -51,7 +52,7 @@ export function render({model, el, view}) {
                 }
                 setValue(newValue)
               }}
-              selected={exclusive ? (value==option) : value.includes(option)}
+              selected={exclusive ? (value==option) : value_set.has(option)}
               size={size}
               value={option}
             >
@@ -2,7 +2,7 @@ import Box from "@mui/material/Box"
 import CircularProgress from "@mui/material/CircularProgress"
 import Typography from "@mui/material/Typography"
 import {useTheme} from "@mui/material/styles"
-import {render_icon_text} from "./utils"
+import {format_duration, render_icon_text, use_progress_rate} from "./utils"
 
 const CIRCULAR_PROGRESS_ROOT_SX = {display: "flex", alignItems: "center", flexDirection: "row"}
 const CIRCULAR_PROGRESS_CONTAINER_SX = {position: "relative", overflow: "hidden"}
@@ -11,7 +11,9 @@ const CIRCULAR_PROGRESS_BASE_SX = {position: "absolute", left: 0}
 export function render({model, el}) {
   const [bgcolor] = model.useState("bgcolor")
   const [color] = model.useState("color")
+  const [interpolate] = model.useState("interpolate")
   const [label] = model.useState("label")
+  const [show_eta] = model.useState("show_eta")
   const [size] = model.useState("size")
   const [sx] = model.useState("sx")
   const [thickness] = model.useState("thickness")
@@ -21,10 +23,15 @@ export function render({model, el}) {
 
   //el.style.overflow = "hidden"
   const theme = useTheme()
-  const progressSx = React.useMemo(
-    () => (sx ? [CIRCULAR_PROGRESS_BASE_SX, sx] : CIRCULAR_PROGRESS_BASE_SX),
-    [sx]
-  )
+  const {interval, eta} = use_progress_rate(value)
+  const progressSx = React.useMemo(() => {
+    if (!interpolate || interval === null) {
+      return sx ? [CIRCULAR_PROGRESS_BASE_SX, sx] : CIRCULAR_PROGRESS_BASE_SX
+    }
+    // Move the arc continuously until the next expected update
+    const transition = {"& .MuiCircularProgress-circle": {transition: `stroke-dashoffset ${Math.round(interval)}ms linear`}}
+    return sx ? [CIRCULAR_PROGRESS_BASE_SX, transition, sx] : [CIRCULAR_PROGRESS_BASE_SX, transition]
+  }, [interpolate, interval, sx])
 
   const idle = (variant == "indeterminate" && !value)
   return (
@@ -42,7 +49,7 @@ export function render({model, el}) {
           />
         )}
         <CircularProgress
-          color={idle ? (model.dark_theme ? "dark" : "light") : color}
+          color={idle ? (theme.palette.mode === "dark" ? "dark" : "light") : color}
           size={size}
           sx={progressSx}
           thickness={thickness}
@@ -77,6 +84,11 @@ export function render({model, el}) {
           {render_icon_text(label)}
         </Typography>
       )}
+      {show_eta && eta !== null && (
+        <Typography variant="caption" sx={{color: "text.secondary", ml: 1}}>
+          {format_duration(eta)}
+        </Typography>
+      )}
     </Box>
   )
 }
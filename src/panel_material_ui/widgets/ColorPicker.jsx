@@ -1,6 +1,6 @@
 import {MuiColorInput} from "mui-color-input"
 import {render_description} from "./description"
-import {render_icon_text} from "./utils"
+import {render_icon_text, use_update_policy} from "./utils"
 
 export function render({model, el, view}) {
   const [alpha] = model.useState("alpha")
@@ -13,7 +13,7 @@ export function render({model, el, view}) {
   const [size] = model.useState("size")
   const [sx] = model.useState("sx")
   const [variant] = model.useState("variant")
-  const [value, setValue] = model.useState("value")
+  const [value, setValue, flushValue] = use_update_policy(model, "value")
 
   return (
     <MuiColorInput
@@ -25,6 +25,7 @@ export function render({model, el, view}) {
       helperText={helper_text || undefined}
       isAlphaHidden={!alpha}
       label={model.description ? <>{render_icon_text(label)}{render_description({model, el, view})}</> : render_icon_text(label)}
+      onBlur={() => flushValue()}
       onChange={setValue}
       size={size}
       sx={sx}
@@ -32,6 +33,7 @@ export function render({model, el, view}) {
       variant={variant}
       PopoverProps={{
         container: el,
+        TransitionProps: {onExited: () => flushValue()},
       }}
     />
   )
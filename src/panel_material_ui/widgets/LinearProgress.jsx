@@ -1,13 +1,43 @@
+import Box from "@mui/material/Box"
 import LinearProgress from "@mui/material/LinearProgress";
+import Typography from "@mui/material/Typography"
+import {format_duration, use_progress_rate} from "./utils"
+
+const ETA_ROOT_SX = {display: "flex", alignItems: "center", gap: 1}
+const ETA_BAR_SX = {flexGrow: 1}
+const ETA_LABEL_SX = {color: "text.secondary", minWidth: "4em", textAlign: "right"}
 
 export function render({model}) {
   const [color] = model.useState("color")
+  const [interpolate] = model.useState("interpolate")
+  const [show_eta] = model.useState("show_eta")
   const [sx] = model.useState("sx")
   const [value] = model.useState("value")
   const [variant] = model.useState("variant")
   const [valueBuffer] = model.useState("value_buffer")
 
+  const {interval, eta} = use_progress_rate(value)
+  const progressSx = React.useMemo(() => {
+    if (!interpolate || interval === null) {
+      return sx
+    }
+    // Move the bar continuously until the next expected update
+    const transition = {"& .MuiLinearProgress-bar": {transition: `transform ${Math.round(interval)}ms linear`}}
+    return sx ? [transition, sx] : transition
+  }, [interpolate, interval, sx])
+
+  const progress = (
+    <LinearProgress color={color} variant={variant} value={value} valueBuffer={valueBuffer} sx={progressSx} />
+  )
+  if (!show_eta) {
+    return progress
+  }
   return (
-    <LinearProgress color={color} variant={variant} value={value} valueBuffer={valueBuffer} sx={sx} />
+    <Box sx={ETA_ROOT_SX}>
+      <Box sx={ETA_BAR_SX}>{progress}</Box>
+      <Typography variant="caption" sx={ETA_LABEL_SX}>
+        {eta === null ? "" : format_duration(eta)}
+      </Typography>
+    </Box>
   )
 }
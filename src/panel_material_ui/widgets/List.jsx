@@ -17,7 +17,7 @@ import MenuItem from "@mui/material/MenuItem"
 import MoreVert from "@mui/icons-material/MoreVert"
 import Checkbox from "@mui/material/Checkbox"
 import Tooltip from "@mui/material/Tooltip"
-import {render_icon, render_icon_text} from "./utils"
+import {decode_items, render_icon, render_icon_text} from "./utils"
 
 const LIST_SX = {p: 0}
 
@@ -71,7 +71,8 @@ export function render({model}) {
   const [expanded, setExpanded] = model.useState("expanded")
   const [highlight] = model.useState("highlight")
   const [label] = model.useState("label")
-  const [items] = model.useState("items")
+  const [raw_items] = model.useState("items")
+  const items = React.useMemo(() => decode_items(raw_items), [raw_items])
   const [level_indent] = model.useState("level_indent")
   const [show_children] = model.useState("show_children")
   const [sx] = model.useState("sx")
@@ -4,7 +4,7 @@ import TextField from "@mui/material/TextField"
 import Visibility from "@mui/icons-material/Visibility"
 import VisibilityOff from "@mui/icons-material/VisibilityOff"
 import {render_description} from "./description"
-import {render_icon_text} from "./utils"
+import {render_icon_text, use_update_policy} from "./utils"
 
 export function render({model, el, view}) {
   const [color] = model.useState("color")
@@ -17,7 +17,7 @@ export function render({model, el, view}) {
   const [size] = model.useState("size")
   const [sx] = model.useState("sx")
   const [value, setValue] = model.useState("value")
-  const [value_input, setValueInput] = model.useState("value_input")
+  const [value_input, setValueInput, flushValueInput] = use_update_policy(model, "value_input")
   const [variant] = model.useState("variant")
   const [showPassword, setShowPassword] = React.useState(false)
 
@@ -37,11 +37,12 @@ export function render({model, el, view}) {
       helperText={helper_text || undefined}
       inputRef={ref}
       label={model.description ? <>{render_icon_text(label)}{render_description({model, el, view})}</> : render_icon_text(label)}
-      onBlur={() => setValue(value_input)}
+      onBlur={() => { flushValueInput(); setValue(value_input) }}
       onChange={(event) => setValueInput(event.target.value)}
       onKeyDown={(event) => {
         if (event.key === "Enter") {
           model.send_event("enter", event)
+          flushValueInput()
           setValue(value_input)
         }
       }}
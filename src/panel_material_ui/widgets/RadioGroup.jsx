@@ -17,6 +17,7 @@ export function render({model, el, view}) {
   const [sx] = model.useState("sx")
   const [value, setValue] = model.useState("value")
   const exclusive = model.esm_constants.exclusive
+  const value_set = React.useMemo(() => new Set(exclusive ? [] : value), [value])
 
   const ref = React.useRef(null)
   React.useEffect(() => {
@@ -52,13 +53,13 @@ export function render({model, el, view}) {
               labelPlacement={label_placement}
               control={
                 <RadioButton
-                  checked={exclusive ? (value==option) : value.includes(option)}
+                  checked={exclusive ? (value==option) : value_set.has(option)}
                   color={color}
                   onClick={(e) => {
                     let newValue
                     if (exclusive) {
                       newValue = option
-                    } else if (value.includes(option)) {
+                    } else if (value_set.has(option)) {
                       newValue = value.filter((v) => v !== option)
                     } else {
                       newValue = [...value]
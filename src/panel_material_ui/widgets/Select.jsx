@@ -50,6 +50,8 @@ export function render({model, el, view}) {
   const [filterStr, setFilterStr] = model.useState("filter_str")
   const [filter_on_search] = model.useState("filter_on_search")
   const [open, setOpen] = model.useState("dropdown_open")
+  const [option_limit] = model.useState("option_limit")
+  const [search_option_limit] = model.useState("search_option_limit")
   const [searchable] = model.useState("searchable")
   const [value_label] = model.useState("value_label")
 
@@ -82,12 +84,9 @@ export function render({model, el, view}) {
 
   const processOptions = () => {
     if (Array.isArray(options)) {
-      return options.map((opt) => {
-        const option = options.find((o) => (Array.isArray(o) ? o[0] === opt : o === opt))
-        const value = Array.isArray(option) ? option[1] : option
-        const label = Array.isArray(option) ? option[0] : option
-        return {value, label}
-      })
+      return options.map((opt) => (
+        Array.isArray(opt) ? {value: opt[1], label: opt[0]} : {value: opt, label: opt}
+      ))
     }
     return []
   }
@@ -107,6 +106,10 @@ export function render({model, el, view}) {
 
   const matched_count = matchedOptions.length
 
+  // Only render a window of the options, long lists are narrowed down by searching
+  const limit = (filterStr && search_option_limit) || option_limit
+  const hidden_count = limit ? Math.max(bookmarkedOptions.length + filteredOptions.length - limit, 0) : 0
+
   // Checkbox logic for multi-select
   const isChecked = () => filteredOptions.length > 0 &&
     (filterStr ? (
@@ -420,7 +423,7 @@ export function render({model, el, view}) {
               ? [...bookmarkedOptions.map(item => ({...item, isBookmarked: true})), {isDivider: true}]
               : []),
             ...filteredOptions.map(item => ({...item, isBookmarked: false}))
-          ].map((item, index) => {
+          ].slice(0, hidden_count ? limit + (bookmarkedOptions.length > 0 ? 1 : 0) : undefined).map((item, index) => {
             if (item.isDivider) {
               return <MenuItem key={`divider-${index}`} disabled divider />;
             }
@@ -467,7 +470,11 @@ export function render({model, el, view}) {
                 <ListItemText primary={render_icon_text(label)} sx={{margin: 2}} />
               </MenuItem>
             );
-          })
+          }).concat(hidden_count ? [
+            <MenuItem key="hidden-options" disabled>
+              <ListItemText secondary={`${hidden_count} more options${searchable ? ", refine the search to show them" : ""}`} />
+            </MenuItem>
+          ] : [])
         )}
       </>
     )
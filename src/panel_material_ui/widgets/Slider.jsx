@@ -13,7 +13,7 @@ import TextField from "@mui/material/TextField"
 import Typography from "@mui/material/Typography"
 import dayjs from "dayjs"
 import {render_description} from "./description"
-import {int_regex, float_regex, render_icon_text} from "./utils"
+import {decode_options, int_regex, float_regex, render_icon_text, use_update_policy} from "./utils"
 
 const SLIDER_BASE_SX = {
   "& .MuiSlider-track": {
@@ -61,7 +61,7 @@ export function render({model, el, view}) {
   const [sx] = model.useState("sx")
   const [tooltips] = model.useState("tooltips")
   const [track] = model.useState("track")
-  const [value, setValue] = model.useState("value")
+  const [value, setValue, flushValue] = use_update_policy(model, "value")
   const [valueLabel] = model.useState("value_label")
   const [_, setValueThrottled] = model.useState("value_throttled")
   const [inline_layout] = model.useState("inline_layout")
@@ -93,7 +93,7 @@ export function render({model, el, view}) {
   let labels = null
   if (discrete) {
     const [labels_state] = model.useState("options")
-    labels = labels_state === undefined ? [] : labels_state
+    labels = React.useMemo(() => decode_options(labels_state), [labels_state])
     start = 0
     end = labels.length - 1
   }
@@ -182,12 +182,12 @@ export function render({model, el, view}) {
       let new_value
       if (Array.isArray(value)) {
         const full_new_value = index === 0 ? [validate(edited_value, 0), value[1]] : [value[0], validate(edited_value, 1)]
-        setValue(full_new_value)
+        flushValue(full_new_value)
         setValueThrottled(full_new_value)
         new_value = full_new_value[index]
       } else {
         new_value = validate(edited_value, 0)
-        setValue(new_value)
+        flushValue(new_value)
         setValueThrottled(new_value)
       }
       if (new_value < start) {
@@ -207,16 +207,16 @@ export function render({model, el, view}) {
           val = Math.round((val + (step * multiplier)) * 100000000000) / 100000000000
         }
         const new_value = index === 0 ? [val, value[1]] : [value[0], val]
-        setValue(new_value)
+        flushValue(new_value)
         setValueThrottled(new_value)
       } else if (value === null) {
         const new_value = fixed_start != null ? fixed_start : 0
-        setValue(new_value)
+        flushValue(new_value)
         setValueThrottled(new_value)
       } else {
         const incremented = Math.round((value + (step * multiplier)) * 100000000000) / 100000000000
         const new_value = fixed_end != null ? Math.min(fixed_end, incremented) : incremented
-        setValue(new_value)
+        flushValue(new_value)
         setValueThrottled(new_value)
       }
     }
@@ -226,7 +226,7 @@ export function render({model, el, view}) {
     if (valueLabel && useLabel) {
       return valueLabel
     } else if (discrete) {
-      return labels[d]
+      return labels.at(d)
     } else if (datetime) {
       return dayjs.unix(d / 1000).format(format || "YYYY-MM-DD HH:mm:ss")
     } else if (date) {
@@ -247,7 +247,7 @@ export function render({model, el, view}) {
     if (valueLabel) {
       setValueLabel(valueLabel)
     } else if (discrete) {
-      setValueLabel(labels[value])
+      setValueLabel(labels.at(value))
     } else if (Array.isArray(value)) {
       let [v1, v2] = value;
       [v1, v2] = [format_value(v1), format_value(v2)];
@@ -389,7 +389,7 @@ export function render({model, el, view}) {
           min={start}
           orientation={orientation}
           onChange={(_, newValue) => setValue(newValue)}
-          onChangeCommitted={(_, newValue) => setValueThrottled(newValue)}
+          onChangeCommitted={(_, newValue) => { flushValue(newValue); setValueThrottled(newValue) }}
           ref={ref}
           size={size}
           step={date ? step*86400000 : (datetime ? step*1000 : step)}
@@ -1,6 +1,6 @@
 import TextField from "@mui/material/TextField"
 import {render_description} from "./description"
-import {render_icon_text} from "./utils"
+import {render_icon_text, use_update_policy} from "./utils"
 
 export function render({model, el}) {
   const [autogrow] = model.useState("auto_grow")
@@ -14,7 +14,7 @@ export function render({model, el}) {
   const [placeholder] = model.useState("placeholder")
   const [resizable] = model.useState("resizable")
   const [rows] = model.useState("rows")
-  const [value_input, setValueInput] = model.useState("value_input")
+  const [value_input, setValueInput, flushValueInput] = use_update_policy(model, "value_input")
   const [_, setValue] = model.useState("value")
   const [variant] = model.useState("variant")
   const [sx] = model.useState("sx")
@@ -71,10 +71,11 @@ export function render({model, el}) {
         if (e.key === "Enter" && e.shiftKey) {
           e.preventDefault()
           model.send_event("enter", e)
+          flushValueInput()
           setValue(value_input)
         }
       }}
-      onBlur={() => setValue(value_input)}
+      onBlur={() => { flushValueInput(); setValue(value_input) }}
       onChange={(event) => setValueInput(event.target.value)}
       placeholder={placeholder}
       sx={textAreaSx}
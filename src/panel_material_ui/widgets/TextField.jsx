@@ -1,6 +1,6 @@
 import TextField from "@mui/material/TextField"
 import {render_description} from "./description"
-import {render_icon_text} from "./utils"
+import {render_icon_text, use_update_policy} from "./utils"
 
 export function render({model, el, view}) {
   const [color] = model.useState("color")
@@ -13,7 +13,7 @@ export function render({model, el, view}) {
   const [size] = model.useState("size")
   const [sx] = model.useState("sx")
   const [value, setValue] = model.useState("value")
-  const [value_input, setValueInput] = model.useState("value_input")
+  const [value_input, setValueInput, flushValueInput] = use_update_policy(model, "value_input")
   const [variant] = model.useState("variant")
 
   const ref = React.useRef(null)
@@ -35,11 +35,12 @@ export function render({model, el, view}) {
       label={model.description ? <>{render_icon_text(label)}{render_description({model, el, view})}</> : render_icon_text(label)}
       multiline={model.esm_constants.multiline}
       placeholder={placeholder}
-      onBlur={() => setValue(value_input)}
+      onBlur={() => { flushValueInput(); setValue(value_input) }}
       onChange={(event) => setValueInput(event.target.value)}
       onKeyDown={(event) => {
         if (event.key === "Enter") {
           model.send_event("enter", event)
+          flushValueInput()
           setValue(value_input)
         }
       }}
@@ -10,7 +10,7 @@ import IconButton from "@mui/material/IconButton"
 import MenuItem from "@mui/material/MenuItem"
 import Tooltip from "@mui/material/Tooltip"
 import Typography from "@mui/material/Typography"
-import {parseIconName, render_icon, render_icon_text} from "./utils"
+import {decode_items, parseIconName, render_icon, render_icon_text} from "./utils"
 
 import ArticleIcon from "@mui/icons-material/Article"
 import DeleteIcon from "@mui/icons-material/Delete"
@@ -664,7 +664,7 @@ export function render({model, view}) {
   const toggle_ref = React.useRef(toggleValues)
 
   const treeItems = React.useMemo(
-    () => normalizeItems(items || [], show_children),
+    () => normalizeItems(decode_items(items) || [], show_children),
     [items, show_children]
   )
 
@@ -0,0 +1,382 @@
+"""
+Compact, columnar storage for large (nested) lists of menu items.
+
+Menu items are usually declared as nested dictionaries, which is
+convenient but expensive for large navigation trees, since every item
+is a separate dictionary which is copied when it is filtered and
+serialized. MenuItems instead stores the items in flat parallel arrays
+of labels, parent indices, ids, packed boolean flags and optional
+columns of additional fields. Dictionaries are only materialized on
+demand, e.g. when an item is passed to a callback, and the items are
+sent to the frontend in a compact columnar format.
+"""
+from __future__ import annotations
+
+import typing as t
+from collections.abc import Iterator, Mapping, Sequence
+
+import numpy as np
+
+# Boolean item fields packed into a single flags array, each flag
+# occupies two bits, one indicating whether the field was set and
+# one holding the value.
+FLAGS = ('open', 'disabled', 'selectable')
+
+Path = tuple[int, ...]
+
+
+def _pack_flags(columns: dict[str, t.Any], n: int) -> np.ndarray | None:
+    flags = None
+    for i, name in enumerate(FLAGS):
+        if name not in columns:
+            continue
+        values = columns.pop(name)
+        if len(values) != n:
+            raise ValueError(
+                f"MenuItems {name!r} column has {len(values)} entries, expected {n}."
+            )
+        if isinstance(values, np.ndarray) and values.dtype == bool:
+            present = np.ones(n, dtype=bool)
+            value = values
+        else:
+            present = np.array([v is not None for v in values], dtype=bool)
+            value = np.array([bool(v) for v in values], dtype=bool)
+        if flags is None:
+            flags = np.zeros(n, dtype=np.uint8)
+        flags |= (present.astype(np.uint8) << (2*i)) | ((present & value).astype(np.uint8) << (2*i+1))
+    return flags
+
+
+class MenuItems:
+    """
+    MenuItems is a compact, columnar representation of a (nested) list
+    of menu items which may be supplied as the `items` of the menu
+    components instead of a list of dictionaries.
+
+    Items are stored in flat arrays, where the parent of each item is
+    identified by its row index, or -1 for top-level items. Parents
+    must precede their children and siblings are ordered by row, i.e.
+    rows are in the order of a depth-first traversal of the tree.
+
+    :Example:
+
+    >>> items = pmui.MenuItems(
+    ...     labels=['Documents', 'Invoice.pdf', 'Notes.docx', 'Trash'],
+    ...     parents=[-1, 0, 0, -1],
+    ...     icon=['folder', None, None, 'delete'],
+    ... )
+    >>> pmui.MenuList(items=items)
+
+    Parameters
+    ----------
+    labels: Sequence[str | None]
+        The label of each item, a label of None declares a divider.
+    parents: Sequence[int] | None
+        The row index of the parent of each item or -1 for top-level
+        items. If None all items are top-level items.
+    ids: Sequence | None
+        Optional unique id of each item.
+    **columns: Sequence
+        Additional fields of each item, e.g. `icon` or `secondary`,
+        where None indicates the field is not set on an item.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str | None],
+        parents: Sequence[int] | np.ndarray | None = None,
+        ids: Sequence[t.Any] | None = None,
+        **columns: Sequence[t.Any]
+    ):
+        n = len(labels)
+        if parents is None:
+            parents = np.full(n, -1, dtype=np.int32)
+        parents = np.asarray(parents, dtype=np.int32)
+        if parents.shape != (n,):
+            raise ValueError(f"MenuItems parents must have {n} entries, got {parents.shape[0]}.")
+        if n and (np.any(parents >= np.arange(n)) or parents.min() < -1):
+            raise ValueError(
+                "MenuItems parents must refer to a preceding row or be -1 "
+                "for top-level items."
+            )
+        if ids is not None and len(ids) != n:
+            raise ValueError(f"MenuItems ids must have {n} entries, got {len(ids)}.")
+        if 'items' in columns:
+            raise ValueError("MenuItems declares nested items via the parents array.")
+        flags = _pack_flags(columns, n)
+        for name, values in columns.items():
+            if len(values) != n:
+                raise ValueError(
+                    f"MenuItems {name!r} column has {len(values)} entries, expected {n}."
+                )
+        parents.flags.writeable = False
+        self._labels = list(labels)
+        self._parents = parents
+        self._ids = None if ids is None else list(ids)
+        self._flags = flags
+        self._columns = {name: list(values) for name, values in columns.items()}
+        self._index: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._id_rows: dict[t.Any, int] | None = None
+        self._payloads: dict[tuple[str, ...], dict[str, t.Any]] = {}
+
+    @classmethod
+    def from_items(cls, items: Sequence[t.Any]) -> MenuItems:
+        """
+        Converts a nested list of items to the columnar representation.
+
+        Parameters
+        ----------
+        items: list
+            List of items, each item may be a string, a (label, value)
+            tuple, a dictionary or None to declare a divider.
+        """
+        labels, parents, ids = [], [], []
+        columns: dict[str, dict[int, t.Any]] = {}
+        stack = [(-1, iter(items))]
+        while stack:
+            parent, children = stack[-1]
+            item = next(children, StopIteration)
+            if item is StopIteration:
+                stack.pop()
+                continue
+            row = len(labels)
+            parents.append(parent)
+            if isinstance(item, tuple):
+                item = {'label': item[0], 'value': item[1]}
+            elif not isinstance(item, dict):
+                item = {'label': item}
+            labels.append(item.get('label'))
+            ids.append(item.get('id'))
+            for key, value in item.items():
+                if key not in ('label', 'id', 'items'):
+                    columns.setdefault(key, {})[row] = value
+            if item.get('items'):
+                stack.append((row, iter(item['items'])))
+        n = len(labels)
+        dense = {
+            key: [values.get(i) for i in range(n)] for key, values in columns.items()
+        }
+        has_ids = any(i is not None for i in ids)
+        return cls(labels, parents, ids=ids if has_ids else None, **dense)
+
+    def to_items(self) -> list[t.Any]:
+        """
+        Materializes the nested list of item dictionaries.
+        """
+        return [self._materialize(int(row)) for row in self._children(-1)]
+
+    def __len__(self) -> int:
+        return len(self._children(-1))
+
+    def __getitem__(self, index: int) -> dict[str, t.Any] | None:
+        return self._materialize(int(self._children(-1)[index]))
+
+    def __iter__(self) -> Iterator[dict[str, t.Any] | None]:
+        for row in self._children(-1):
+            yield self._materialize(int(row))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(<{len(self._labels)} items>)'
+
+    @property
+    def size(self) -> int:
+        """
+        The total number of items, including nested items.
+        """
+        return len(self._labels)
+
+    def _build_index(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._index is None:
+            n = len(self._labels)
+            keys = self._parents.astype(np.int64) + 1
+            order = np.argsort(keys, kind='stable')
+            starts = np.zeros(n + 2, dtype=np.int64)
+            np.cumsum(np.bincount(keys, minlength=n + 1), out=starts[1:])
+            positions = np.empty(n, dtype=np.int64)
+            positions[order] = np.arange(n) - starts[keys[order]]
+            self._index = (order, starts, positions)
+        return self._index
+
+    def _children(self, row: int) -> np.ndarray:
+        order, starts, _ = self._build_index()
+        return order[starts[row + 1]:starts[row + 2]]
+
+    def _flag(self, row: int, index: int) -> bool | None:
+        if self._flags is None or not (self._flags[row] >> (2*index)) & 1:
+            return None
+        return bool((self._flags[row] >> (2*index+1)) & 1)
+
+    def _materialize(self, row: int, children: bool = True) -> dict[str, t.Any] | None:
+        label = self._labels[row]
+        if label is None:
+            return None
+        item: dict[str, t.Any] = {'label': label}
+        if self._ids is not None and self._ids[row] is not None:
+            item['id'] = self._ids[row]
+        for name, values in self._columns.items():
+            if values[row] is not None:
+                item[name] = values[row]
+        for i, name in enumerate(FLAGS):
+            flag = self._flag(row, i)
+            if flag is not None:
+                item[name] = flag
+        if children:
+            rows = self._children(row)
+            if len(rows):
+                item['items'] = [self._materialize(int(r)) for r in rows]
+        return item
+
+    def row(self, path: int | Path) -> int | None:
+        """
+        Returns the row index of the item at the supplied path.
+        """
+        row = -1
+        for index in ((path,) if isinstance(path, int) else path):
+            children = self._children(row)
+            if not 0 <= index < len(children):
+                return None
+            row = int(children[index])
+        return None if row < 0 else row
+
+    def path(self, row: int) -> Path:
+        """
+        Returns the path of the item at the supplied row index.
+        """
+        _, _, positions = self._build_index()
+        path = []
+        while row >= 0:
+            path.append(int(positions[row]))
+            row = int(self._parents[row])
+        return tuple(reversed(path))
+
+    def lookup(self, path: int | Path, children: bool = True) -> dict[str, t.Any] | None:
+        """
+        Materializes the item at the supplied path.
+        """
+        row = self.row(path)
+        return None if row is None else self._materialize(row, children)
+
+    def find(self, item: t.Any, keys: Sequence[str] | None = None) -> Path | None:
+        """
+        Returns the path of an item, matched by id if the item declares
+        one, and otherwise by comparing the supplied keys.
+        """
+        if not isinstance(item, dict):
+            return None
+        if item.get('id') is not None and self._ids is not None:
+            if self._id_rows is None:
+                self._id_rows = {
+                    id_: row for row, id_ in enumerate(self._ids) if id_ is not None
+                }
+            row = self._id_rows.get(item['id'])
+            return None if row is None else self.path(row)
+        keys = [k for k in (keys or item) if k != 'items']
+        expected = {k: v for k, v in item.items() if k in keys}
+        label = item.get('label')
+        for row, current in enumerate(self._labels):
+            if current is None or current != label:
+                continue
+            candidate = self._materialize(row, children=False)
+            if {k: v for k, v in candidate.items() if k in keys} == expected:  # type: ignore[union-attr]
+                return self.path(row)
+        return None
+
+    def expanded(self) -> list[Path]:
+        """
+        Returns the paths of all items declared as open.
+        """
+        if self._flags is None:
+            return []
+        rows = np.nonzero(self._flags & 0b10 == 0b10)[0]
+        return [self.path(int(row)) for row in rows]
+
+    def replace(self, updates: Mapping[Path, Mapping[str, t.Any]]) -> MenuItems:
+        """
+        Returns a copy of the items with the fields of the items at the
+        supplied paths updated. Columns which are not updated are shared
+        with the original.
+
+        Parameters
+        ----------
+        updates: dict
+            Mapping from item path to the fields to update.
+        """
+        rows = {}
+        for path, fields in updates.items():
+            row = self.row(path)
+            if row is None:
+                raise IndexError(f"No item found at path {path!r}.")
+            if 'items' in fields:
+                raise ValueError("MenuItems does not support replacing nested items.")
+            rows[row] = fields
+        n = len(self._labels)
+        labels = self._labels
+        ids = self._ids
+        flags = self._flags
+        columns = dict(self._columns)
+        for row, fields in rows.items():
+            for key, value in fields.items():
+                if key == 'label':
+                    if labels is self._labels:
+                        labels = list(labels)
+                    labels[row] = value
+                elif key == 'id':
+                    if ids is self._ids:
+                        ids = [None]*n if ids is None else list(ids)
+                    ids[row] = value  # type: ignore[index]
+                elif key in FLAGS:
+                    if flags is self._flags:
+                        flags = np.zeros(n, dtype=np.uint8) if flags is None else flags.copy()
+                    i = FLAGS.index(key)
+                    flags[row] &= ~np.uint8(0b11 << (2*i))  # type: ignore[index]
+                    if value is not None:
+                        flags[row] |= np.uint8((1 | bool(value) << 1) << (2*i))  # type: ignore[index]
+                else:
+                    if key not in columns:
+                        columns[key] = [None]*n
+                    elif columns[key] is self._columns.get(key):
+                        columns[key] = list(columns[key])
+                    columns[key][row] = value
+        new = object.__new__(type(self))
+        new._labels = labels
+        new._parents = self._parents
+        new._ids = ids
+        new._flags = flags
+        new._columns = columns
+        new._index = self._index
+        new._id_rows = self._id_rows if ids is self._ids else None
+        new._payloads = {}
+        return new
+
+    def to_columns(self, keys: Sequence[str]) -> dict[str, t.Any]:
+        """
+        Returns the columnar wire format of the items, only including
+        the supplied item keys.
+
+        Parameters
+        ----------
+        keys: list[str]
+            The item keys to include.
+        """
+        cache_key = tuple(keys)
+        if cache_key in self._payloads:
+            return self._payloads[cache_key]
+        payload: dict[str, t.Any] = {
+            'columnar': True,
+            'label': self._labels,
+            'parent': self._parents,
+        }
+        if self._ids is not None and 'id' in keys:
+            payload['id'] = self._ids
+        if self._flags is not None:
+            mask = sum(0b11 << (2*i) for i, name in enumerate(FLAGS) if name in keys)
+            if mask:
+                payload['flags'] = self._flags & np.uint8(mask)
+        fields = {name: values for name, values in self._columns.items() if name in keys}
+        if fields:
+            payload['fields'] = fields
+        self._payloads[cache_key] = payload
+        return payload
+
+
+__all__ = ['MenuItems']
@@ -0,0 +1,170 @@
+"""
+Compact encoding of the options of discrete sliders.
+
+A DiscreteSlider exchanges the index of the selected option with the
+frontend, which only requires the option labels for display. Sending
+the labels is expensive for long numeric or temporal axes, e.g. a
+HoloMap over thousands of timestamps, so when the labels are the
+default formatting of the option values the options are instead
+encoded as a range (start, step and size) or as a packed array of
+values, and the labels are formatted on the frontend as they are
+displayed. The encoding is only used if formatting the encoded values
+reproduces every label exactly, otherwise the labels are sent as is.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+from collections.abc import Sequence
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+
+# Datetime formats which may be formatted on the frontend, must only
+# use the directives supported by format_option in utils.js
+DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M', '%Y-%m-%d %H:%M', '%H:%M:%S', '%H:%M',
+)
+
+_EPOCH = dt.datetime(1970, 1, 1)
+
+_MAX_PRECISION = 6
+
+
+def _as_numbers(values: Sequence[t.Any]) -> tuple[np.ndarray, str] | None:
+    """
+    Converts the values to float64 (milliseconds since the epoch for
+    datetimes) returning the array and the kind of values.
+    """
+    first = values[0]
+    if isinstance(first, (dt.datetime, dt.date, np.datetime64)):
+        if any(getattr(v, 'tzinfo', None) is not None for v in values):
+            return None
+        try:
+            array = np.asarray(values, dtype='datetime64[ms]')
+        except (TypeError, ValueError):
+            return None
+        return array.astype('int64').astype('float64'), 'datetime'
+    if any(isinstance(v, (bool, np.bool_)) for v in values):
+        return None
+    try:
+        array = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 1:
+        return None
+    if array.dtype.kind in 'iu':
+        if len(array) and np.abs(array).max() > 2**53:
+            return None
+        return array.astype('float64'), 'int'
+    if array.dtype.kind == 'f':
+        return array.astype('float64'), 'float'
+    return None
+
+
+def _format_number(value: float, kind: str, precision: int | None) -> str | None:
+    """
+    Formats a number the way format_option does on the frontend,
+    returning None if the frontend formatting may differ.
+    """
+    if precision is not None:
+        if abs(value) >= 1e21:
+            return None
+        if value == 0:
+            value = 0.0
+        quantum = Decimal(1).scaleb(-precision)
+        return str(Decimal(value).quantize(quantum, rounding=ROUND_HALF_UP))
+    elif kind == 'int':
+        return str(int(value))
+    elif value == 0:
+        return '0.0'
+    elif not 1e-4 <= abs(value) < 1e16:
+        # Python and JS only agree on fixed-point notation in this range
+        return None
+    return repr(value)
+
+
+def _format_datetime(value: float, fmt: str) -> str | None:
+    date = _EPOCH + dt.timedelta(milliseconds=value)
+    if date.year < 1000:
+        return None
+    return date.strftime(fmt)
+
+
+def _find_format(
+    sample: float, label: str, kind: str
+) -> dict[str, t.Any] | None:
+    """
+    Finds a frontend format which formats the sample value as the label.
+    """
+    if kind == 'datetime':
+        for fmt in DATETIME_FORMATS:
+            if _format_datetime(sample, fmt) == label:
+                return {'datetime': fmt}
+        return None
+    if _format_number(sample, kind, None) == label:
+        return {'float': kind == 'float'}
+    for precision in range(_MAX_PRECISION + 1):
+        if _format_number(sample, kind, precision) == label:
+            return {'precision': precision}
+    return None
+
+
+def _matches(values: np.ndarray, labels: Sequence[str], kind: str, fmt: dict[str, t.Any]) -> bool:
+    if 'datetime' in fmt:
+        return all(
+            _format_datetime(v, fmt['datetime']) == label
+            for v, label in zip(values.tolist(), labels, strict=True)
+        )
+    precision = fmt.get('precision')
+    return all(
+        _format_number(v, kind, precision) == label
+        for v, label in zip(values.tolist(), labels, strict=True)
+    )
+
+
+def encode_options(values: Sequence[t.Any], labels: Sequence[str]) -> dict[str, t.Any] | None:
+    """
+    Encodes the options as a range or a packed array of values along
+    with the format used to render their labels on the frontend.
+
+    Parameters
+    ----------
+    values: Sequence
+        The option values, numbers or datetimes.
+    labels: Sequence[str]
+        The option labels.
+
+    Returns
+    -------
+    The encoded options or None if the labels cannot be reproduced
+    from the values on the frontend.
+    """
+    if len(values) < 2 or len(values) != len(labels):
+        return None
+    converted = _as_numbers(values)
+    if converted is None:
+        return None
+    array, kind = converted
+    if not np.isfinite(array).all():
+        return None
+    fmt = _find_format(float(array[0]), str(labels[0]), kind)
+    if fmt is None:
+        return None
+    encoded: dict[str, t.Any] = {'size': len(array), 'format': fmt}
+    start, step = float(array[0]), float(array[1] - array[0])
+    # The frontend computes start + i * step in double precision,
+    # which numpy reproduces exactly
+    regular = start + step * np.arange(len(array), dtype='float64')
+    if _matches(regular, labels, kind, fmt):
+        encoded.update(start=start, step=step)
+        return encoded
+    if not _matches(array, labels, kind, fmt):
+        return None
+    offsets = array - start
+    if (np.abs(offsets) < 2**31).all() and (offsets == np.round(offsets)).all():
+        encoded.update(start=start, offsets=offsets.astype('int32'))
+    else:
+        encoded['values'] = array
+    return encoded
@@ -0,0 +1,190 @@
+"""
+Windowed access to lazy data sources used by Pagination.paginate.
+
+A PagedSource wraps a sized sequence, a callable `fetch(offset, limit)`
+or an iterator and materializes the objects one page at a time, keeping
+only a bounded number of recently used pages in memory. The fetch
+callable may be a coroutine function, in which case pages must be
+requested with the asynchronous `apage` and `aprefetch` methods.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import typing as t
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+Fetch = Callable[[int, int], Iterable[t.Any]]
+
+
+class PagedSource:
+    """
+    PagedSource materializes pages of objects from a lazy data source
+    on demand and caches the most recently used pages.
+
+    Parameters
+    ----------
+    source: Sequence | Callable[[int, int], Iterable] | Iterable
+        A sized sequence which is sliced, a (sync or async) callable
+        returning the objects given an offset and a limit, or an
+        iterator which is
+        consumed as pages are requested. Since iterators cannot be
+        rewound, pages read from an iterator are never evicted.
+    page_size: int
+        The number of objects per page.
+    cache_size: int
+        The maximum number of pages to keep in memory.
+    total: int | None
+        The total number of objects. Determined from the length of
+        a sequence, otherwise the number of pages is discovered as
+        pages are fetched.
+    """
+
+    def __init__(
+        self,
+        source: t.Any,
+        page_size: int = 10,
+        cache_size: int = 8,
+        total: int | None = None
+    ):
+        if page_size < 1:
+            raise ValueError(f"PagedSource page_size must be positive, got {page_size}.")
+        if cache_size < 1:
+            raise ValueError(f"PagedSource cache_size must be positive, got {cache_size}.")
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self._iterator: t.Iterator[t.Any] | None = None
+        self._fetch: Fetch
+        self.asynchronous = False
+        if hasattr(source, '__len__') and hasattr(source, '__getitem__'):
+            self._fetch = lambda offset, limit: source[offset:offset+limit]
+            if total is None:
+                total = len(source)
+        elif callable(source):
+            self._fetch = source
+            self.asynchronous = inspect.iscoroutinefunction(source)
+        elif isinstance(source, Iterable):
+            self._iterator = iter(source)
+            self._fetch = self._fetch_iterator
+            self.cache_size = 0
+        else:
+            raise TypeError(
+                "PagedSource expects a sequence, a callable fetch(offset, limit) "
+                f"or an iterator, got {type(source).__name__}."
+            )
+        self.total = total
+        self._pages: OrderedDict[int, list[t.Any]] = OrderedDict()
+        self._last_page = -1
+        self._exhausted = False
+        self._lock = threading.RLock()
+
+    def _fetch_iterator(self, offset: int, limit: int) -> list[t.Any]:
+        # Pages are fetched in order, so the iterator is always
+        # positioned at the offset of the requested page
+        objects = []
+        for obj in self._iterator:  # type: ignore[union-attr]
+            objects.append(obj)
+            if len(objects) == limit:
+                break
+        return objects
+
+    @property
+    def num_pages(self) -> int:
+        """
+        The number of pages, if the total is not known this includes
+        the page following the last page that was fetched unless the
+        source is exhausted.
+        """
+        if self.total is not None:
+            return -(-self.total // self.page_size)
+        return self._last_page + 2
+
+    def _lookup(self, page: int) -> list[t.Any] | None:
+        if page in self._pages:
+            self._pages.move_to_end(page)
+            return self._pages[page]
+        if self.total is not None and page >= self.num_pages:
+            return []
+        return None
+
+    def _skip_prefetch(self, page: int) -> bool:
+        return page in self._pages or page < 0 or (self.total is not None and page >= self.num_pages)
+
+    def page(self, page: int) -> list[t.Any]:
+        """
+        Returns the objects on the supplied (zero-indexed) page.
+        """
+        if self.asynchronous:
+            raise RuntimeError(
+                "PagedSource with an async fetch callable must be paged "
+                "with the apage method."
+            )
+        with self._lock:
+            objects = self._lookup(page)
+            if objects is not None:
+                return objects
+            if self._iterator is not None:
+                # Consume all preceding pages, which are retained
+                while self._last_page < page and not self._exhausted:
+                    self._load(self._last_page + 1)
+                return self._pages.get(page, [])
+            return self._load(page)
+
+    async def apage(self, page: int) -> list[t.Any]:
+        """
+        Returns the objects on the supplied (zero-indexed) page, awaiting
+        an async fetch callable or otherwise fetching on a thread.
+        """
+        if not self.asynchronous:
+            return await asyncio.to_thread(self.page, page)
+        with self._lock:
+            objects = self._lookup(page)
+        if objects is not None:
+            return objects
+        objects = list(await self._fetch(page * self.page_size, self.page_size))  # type: ignore[misc]
+        with self._lock:
+            return self._store(page, objects)
+
+    def _load(self, page: int) -> list[t.Any]:
+        return self._store(page, list(self._fetch(page * self.page_size, self.page_size)))
+
+    def _store(self, page: int, objects: list[t.Any]) -> list[t.Any]:
+        if not objects and page > 0:
+            # The source ends on an earlier page
+            if page == self._last_page + 1:
+                self._exhausted = True
+                if self.total is None:
+                    self.total = page * self.page_size
+            return objects
+        self._last_page = max(self._last_page, page)
+        if len(objects) < self.page_size:
+            self._exhausted = True
+            if self.total is None:
+                self.total = page * self.page_size + len(objects)
+        self._pages[page] = objects
+        while self.cache_size and len(self._pages) > self.cache_size:
+            self._pages.popitem(last=False)
+        return objects
+
+    def prefetch(self, page: int) -> None:
+        """
+        Loads the supplied page into the cache, if it exists.
+        """
+        with self._lock:
+            if not self._skip_prefetch(page):
+                self.page(page)
+
+    async def aprefetch(self, page: int) -> None:
+        """
+        Loads the supplied page into the cache, if it exists, without
+        blocking the event loop.
+        """
+        if not self.asynchronous:
+            await asyncio.to_thread(self.prefetch, page)
+            return
+        with self._lock:
+            if self._skip_prefetch(page):
+                return
+        await self.apage(page)
@@ -29,6 +29,18 @@ class MaterialWidget(MaterialComponent, WidgetBase):
     disabled = param.Boolean(default=False, doc="Whether the widget is disabled.")
     label = param.String(default="", doc="The label for the widget.")
     margin = Margin(default=10, doc="Margin around the widget.")
+    update_delay = param.Integer(default=200, bounds=(0, None), doc="""
+        Delay in milliseconds applied by the 'throttle' and 'debounce'
+        update policies.""")
+    update_policy: t.Literal["immediate", "throttle", "debounce", "commit"] = param.Selector(
+        default="immediate", objects=["immediate", "throttle", "debounce", "commit"], doc="""
+        Policy determining how high-frequency value changes (e.g. typing
+        or dragging) are synced from the frontend:
+        - `immediate`: Sync every change.
+        - `throttle`: Sync at most once every `update_delay` milliseconds.
+        - `debounce`: Sync once changes pause for `update_delay` milliseconds.
+        - `commit`: Sync only when the change is committed (e.g. on blur,
+          enter or release of the slider handle).""")  # type: ignore[assignment]
     width = param.Integer(default=300, bounds=(0, None), allow_None=True, doc="Width of the widget.")
 
     _rename = {"label": "label"}
@@ -1,12 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
 import typing as t
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import param
 
 from ..base import COLORS, ColorType, ThemedTransform
 from .base import MaterialWidget
 
+if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class ProgressMixin(param.Parameterized):
+    """
+    Mixin for progress indicators adding a rate-limited progress
+    reporting API, e.g. for reporting the progress of a loop running
+    in a worker thread.
+
+    Progress reported with `advance` is accumulated on the server and
+    the `value` is updated at most once every `flush_interval`
+    milliseconds. The frontend interpolates between updates and may
+    display the estimated time remaining based on the observed rate.
+    """
 
-class CircularProgress(MaterialWidget):
+    flush_interval = param.Integer(default=100, bounds=(0, None), doc="""
+        The minimum interval in milliseconds between updates of the
+        value when reporting progress with advance.""")
+
+    interpolate = param.Boolean(default=True, doc="""
+        Whether to animate the progress smoothly between frequent
+        updates, based on the observed interval between updates.""")
+
+    show_eta = param.Boolean(default=False, doc="""
+        Whether to display the estimated time remaining, based on the
+        observed rate of progress.""")
+
+    _progress_done: float = 0
+    _progress_total: float | None = None
+    _progress_flushed: float = 0
+    _progress_timer: threading.Timer | None = None
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._progress_lock = threading.RLock()
+
+    def _progress_value(self) -> float:
+        done = self._progress_done
+        if self._progress_total:
+            done = 100 * done / self._progress_total
+        return min(max(done, 0), 100)
+
+    def _flush_progress(self) -> None:
+        with self._progress_lock:
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            self._progress_flushed = time.monotonic()
+            value = self._progress_value()
+            # The update is applied while holding the lock so a timer
+            # flush cannot overwrite the value of a later flush
+            updates: dict[str, t.Any] = {}
+            if value != self.value:
+                updates['value'] = value
+            if self.variant == "indeterminate":  # type: ignore[attr-defined]
+                # Other variants, e.g. buffer, already display the value
+                updates['variant'] = "determinate"
+            if updates:
+                self.param.update(updates)
+
+    def advance(self, n: float = 1) -> None:
+        """
+        Advances the progress by n steps of the total declared with
+        `track` or, if no total was declared, by n percentage points.
+
+        Safe to call from any thread, updates are accumulated and the
+        value is updated at most once every `flush_interval` ms.
+
+        Parameters
+        ----------
+        n: float
+            The number of steps completed.
+        """
+        with self._progress_lock:
+            self._progress_done += n
+            remaining = self.flush_interval / 1000 - (time.monotonic() - self._progress_flushed)
+            if remaining > 0:
+                if self._progress_timer is None:
+                    self._progress_timer = timer = threading.Timer(remaining, self._flush_progress)
+                    timer.daemon = True
+                    timer.start()
+                return
+        self._flush_progress()
+
+    @contextmanager
+    def track(self, total: float | None = None) -> Iterator[Self]:
+        """
+        Context manager resetting the progress and ensuring the final
+        progress is displayed on exit.
+
+        Parameters
+        ----------
+        total: float | None
+            The total number of steps, if not provided each step
+            corresponds to one percentage point.
+
+        :Example:
+
+        >>> with progress.track(total=len(items)):
+        ...     for item in items:
+        ...         process(item)
+        ...         progress.advance()
+        """
+        with self._progress_lock:
+            self._progress_done = 0
+            self._progress_total = total
+            self._progress_flushed = 0
+        self._flush_progress()
+        try:
+            yield self
+        finally:
+            self._flush_progress()
+
+
+class CircularProgress(MaterialWidget, ProgressMixin):
     """
     The `CircularProgress` provides a visual representation as a spinner of the loading status.
 
@@ -46,9 +166,10 @@ class CircularProgress(MaterialWidget):
 
     _esm_base = "CircularProgress.jsx"
     _esm_transforms = [ThemedTransform]
+    _rename = {**MaterialWidget._rename, "flush_interval": None}
 
 
-class LinearProgress(MaterialWidget):
+class LinearProgress(MaterialWidget, ProgressMixin):
     """
     The `LinearProgress` widget displays the progress towards some target
     based on the current `value` and the `max` value.
@@ -82,6 +203,7 @@ class LinearProgress(MaterialWidget):
 
     _esm_base = "LinearProgress.jsx"
     _esm_transforms = [ThemedTransform]
+    _rename = {**MaterialWidget._rename, "flush_interval": None}
 
     @param.depends("value", watch=True, on_init=True)
     def _update_value(self, *_, **__):
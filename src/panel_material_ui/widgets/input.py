@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 import typing as t
 from collections.abc import Iterable
@@ -222,6 +223,16 @@ class _FileUploadArea(param.Parameterized):
         Maximum total size (in bytes) for all files combined. If specified,
         uploads will be rejected if the total size exceeds this limit.""")
 
+    upload_checksum = param.Boolean(default=False, doc="""
+        Whether to send a SHA-256 checksum with each chunk, which is
+        verified on the server. Chunks that fail verification are
+        retransmitted.""")
+
+    upload_window = param.Integer(default=4, bounds=(1, None), doc="""
+        Maximum number of chunks in flight, i.e. sent to the server but
+        not yet acknowledged. Larger windows improve throughput on high
+        latency connections at the cost of memory on the server.""")
+
     uploaded_label = param.String(default=None, doc="""
         Label to display on the button after a file has been uploaded. Supports
         {filename} and {n} as placeholders, e.g. 'Done ({n} files)' or
@@ -317,8 +328,17 @@ class _FileUploadArea(param.Parameterized):
         if status == "upload_event":
             self._process_chunk(msg)
             return
+        elif status == "resume":
+            self._send_resume_state(msg["file_id"])
         elif status == "initializing":
-            return
+            # Files completed by an aborted upload are sent again,
+            # only partially received files of this upload may be
+            # resumed, all other partially received files are dropped.
+            self._buffer.clear()
+            file_ids = set(msg.get("file_ids") or ())
+            for key in list(self._file_buffer):
+                if key not in file_ids:
+                    del self._file_buffer[key]
         elif status == "finished":
             try:
                 self._flush_buffer()
@@ -326,35 +346,60 @@ class _FileUploadArea(param.Parameterized):
             except Exception as e:
                 logger.exception(str(e))
                 self._send_msg({"status": "error", "error": str(e)})
+        elif status == "error":
+            # The upload was aborted on the frontend, partially received
+            # files are retained until the next upload so they may be resumed.
+            logger.warning("File upload failed: %s", msg.get("error"))
+            self._buffer.clear()
         else:
             raise ValueError(f"Unknown status: {status}")
 
+    def _send_resume_state(self, file_id: str) -> None:
+        """
+        Informs the frontend which chunks of a file have already been
+        received so an interrupted upload can be resumed.
+        """
+        pending = self._file_buffer.get(file_id)
+        chunks = sorted(pending["chunks"]) if pending else []
+        self._send_msg({"status": "resume", "file_id": file_id, "chunks": chunks})
+
     def _process_chunk(self, msg: dict) -> None:
         """Process a single chunk of a chunked file upload."""
         name = msg["name"]
         chunk = msg["chunk"]
         total_chunks = msg["total_chunks"]
         mime_type = msg["mime_type"]
+        # Clients supporting acknowledgements identify each file by id
+        file_id = msg.get("file_id")
+        key = file_id or name
 
         data = msg["data"]
         data = bytes(data)
 
-        if name not in self._file_buffer:
-            self._file_buffer[name] = {
+        checksum = msg.get("checksum")
+        if checksum and hashlib.sha256(data).hexdigest() != checksum:
+            if file_id:
+                self._send_msg({
+                    "status": "nack", "file_id": file_id, "chunk": chunk,
+                    "error": f"Checksum mismatch for chunk {chunk} of {name!r}."
+                })
+            return
+
+        if key not in self._file_buffer:
+            self._file_buffer[key] = {
                 "chunks": {},
                 "total_chunks": total_chunks,
                 "mime_type": mime_type,
                 "filename": name
             }
 
-        self._file_buffer[name]["chunks"][chunk] = data
+        self._file_buffer[key]["chunks"][chunk] = data
 
         # Check if all chunks are received for this file
-        if len(self._file_buffer[name]["chunks"]) == total_chunks:
-            # Reassemble the file
-            file_data = b""
-            for i in range(1, total_chunks + 1):  # Chunks are 1-indexed
-                file_data += self._file_buffer[name]["chunks"][i]
+        if len(self._file_buffer[key]["chunks"]) == total_chunks:
+            # Reassemble the file (chunks are 1-indexed)
+            chunks = self._file_buffer[key]["chunks"]
+            file_data = b"".join(chunks[i] for i in range(1, total_chunks + 1))
 
             self._buffer.append({
                 "value": file_data,
@@ -362,7 +407,10 @@ class _FileUploadArea(param.Parameterized):
                 "mime_type": mime_type
             })
 
-            del self._file_buffer[name]
+            del self._file_buffer[key]
+
+        if file_id:
+            self._send_msg({"status": "ack", "file_id": file_id, "chunk": chunk})
 
     def _flush_buffer(self):
         value, mime_type, filename = [], [], []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 from collections import defaultdict
 from collections.abc import Callable
@@ -14,6 +15,8 @@ from panel.models.reactive_html import DOMEvent
 from param.parameterized import _syncing
 
 from ..base import COLORS, ColorType, ThemedTransform, TooltipTransform
+from ._items import MenuItems
+from ._paging import PagedSource
 from .base import MaterialWidget
 from .button import _ButtonBase
 
@@ -23,9 +26,10 @@ class MenuBase(MaterialWidget):
     active = param.Integer(default=None, doc="""
         The index of the currently selected menu item.""")
 
-    items = param.ClassSelector(default=[], class_=list, doc="""
+    items = param.ClassSelector(default=[], class_=(list, MenuItems), doc="""
         List of items to display. Each item may be a string, a tuple mapping from a label to a value,
-        or an object with a few common properties and a few widget specific properties.""")
+        or an object with a few common properties and a few widget specific properties.
+        Large lists of items may be declared as compact MenuItems.""")
 
     margin = Margin(default=0)
 
@@ -37,6 +41,9 @@ class MenuBase(MaterialWidget):
 
     _item_keys = ['label', 'items', 'tooltip']
     _descend_children = True
+
+    # Whether the frontend accepts MenuItems in the columnar wire format
+    _columnar_items = False
     _rename = {'value': None}
     _source_transforms = {"value": None, "items": None, "attached": None}
 
@@ -57,19 +64,24 @@ class MenuBase(MaterialWidget):
     def _process_param_change(self, params):
         params = super()._process_param_change(params)
         if 'items' in params:
-            if isinstance(params['items'], list) and any(isinstance(item, tuple) for item in params['items']):
+            items = params['items']
+            if isinstance(items, MenuItems):
+                if self._columnar_items:
+                    params['items'] = items.to_columns(self._item_keys)
+                    return params
+                items = items.to_items()
+            elif isinstance(items, list) and any(isinstance(item, tuple) for item in items):
                 # Legacy format from Panel
-                items = []
-                for item in params['items']:
-                    if isinstance(item, tuple):
-                        items.append({"label": item[0], "value": item[1]})
-                    else:
-                        items.append(item)
-            else:
-                items = params['items']
-            params['items'] = [self._filter_item(item, self._item_keys) for item in items]
+                items = [
+                    {"label": item[0], "value": item[1]} if isinstance(item, tuple) else item
+                    for item in items
+                ]
+            params['items'] = self._prepare_items(items)
         return params
 
+    def _prepare_items(self, items):
+        return [self._filter_item(item, self._item_keys) for item in items]
+
     def _process_property_change(self, props):
         props = super()._process_property_change(props)
         if 'active' in props and isinstance(props['active'], list):
@@ -121,6 +133,8 @@ class MenuBase(MaterialWidget):
 
     def _lookup_path(self, item, items=None):
         items = self.items if items is None else items
+        if isinstance(items, MenuItems):
+            return items.find(item, self._item_keys)
         if not items:
             return None
         queue = [([], 0, items)]
@@ -139,6 +153,8 @@ class MenuBase(MaterialWidget):
             return
         indexes = index if isinstance(index, (tuple, list)) else [index]
         value = self.items if items is None else items
+        if isinstance(value, MenuItems):
+            return value.lookup(tuple(indexes))
         for i, idx in enumerate(indexes):
             if idx >= len(value):
                 return None
@@ -195,6 +211,9 @@ class MenuBase(MaterialWidget):
             The updates to apply to the item.
         """
         path= self._lookup_path(item)
+        if isinstance(self.items, MenuItems):
+            self.items = self.items.replace({path: updates})
+            return
         new_item = dict(item, **updates)
         *path, index = path
         root_items = items = list(self.items)
@@ -569,6 +588,8 @@ class TreeLikeBase(NestedMenuBase):
 
     show_children = param.Boolean(default=True, doc="Whether to render children.")
 
+    _columnar_items = True
+
     __abstract = True
 
     def __init__(self, **params):
@@ -632,6 +653,23 @@ class TreeLikeBase(NestedMenuBase):
         old_items = event.old or []
         new_items = event.new or []
 
+        if isinstance(new_items, MenuItems):
+            expanded = []
+            for path in self.expanded:
+                if isinstance(old_items, MenuItems):
+                    item = old_items.lookup(path, children=False)
+                else:
+                    item = self._lookup_item(path, old_items)
+                new_path = None if item is None else self._lookup_path(item, new_items)
+                if new_path is not None:
+                    expanded.append(new_path)
+            expanded += [
+                path for path in new_items.expanded()
+                if (self.show_children or len(path) == 1) and path not in expanded
+            ]
+            self.expanded = expanded
+            return
+
         expanded_items = []
         for path in self.expanded:
             item = self._lookup_item(path, old_items)
@@ -1106,18 +1144,38 @@ class Pagination(MaterialWidget):
             self.value = 0
 
     @classmethod
-    def paginate(cls, objects: list, layout: type[ListLike] = Column, page_size: int = 10, **params):
+    def paginate(
+        cls, objects: t.Any, layout: type[ListLike] = Column, page_size: int = 10,
+        cache_size: int = 8, prefetch: bool = True, total: int | None = None, **params
+    ):
         """
         Paginate the items based on the current page and page size.
 
+        Objects are only materialized one page at a time, which allows
+        paginating over large, lazily loaded data sources, e.g. the
+        results of a database query. The next page is prefetched in
+        the background, awaiting an async fetch callable or otherwise
+        fetching on a thread so the event loop is not blocked.
+
         Parameters
         ----------
-        objects: list
-            The list of objects to paginate.
+        objects: Sequence | Callable[[int, int], Iterable] | Iterable | param.rx
+            The objects to paginate, either a sized sequence, a (sync
+            or async) callable returning the objects given an offset
+            and a limit, an iterator or a reactive list, which is
+            sliced as a whole whenever it changes.
         layout: type[LayoutBase]
             The layout to use for the paginated items.
         page_size: int
             The number of items to display per page.
+        cache_size: int
+            The maximum number of pages to keep in memory.
+        prefetch: bool
+            Whether to load the next page after a page is displayed.
+        total: int | None
+            The total number of objects, if not provided and the
+            objects are not a sequence, the number of pages grows
+            as pages are loaded.
         params: dict
             Additional parameters to pass to the layout.
 
@@ -1126,13 +1184,45 @@ class Pagination(MaterialWidget):
         layout
             The layout with the paginated items.
         """
-        pagination = Pagination(count=len(objects)//page_size)
-        val_rx = pagination.rx()
-        objects_rx = param.rx(objects)[val_rx * page_size:(val_rx + 1) * page_size]
-        return Column(
-            layout(objects=objects_rx, **params),
-            pagination
-        )
+        if isinstance(objects, param.rx):
+            num_pages = objects.rx.pipe(lambda objs: -(-len(objs) // page_size))
+            pagination = Pagination(count=num_pages)
+            page = pagination.rx().rx.pipe(lambda page: page or 0)
+            return Column(
+                layout(objects=objects[page * page_size:(page + 1) * page_size], **params),
+                pagination
+            )
+
+        source = PagedSource(objects, page_size=page_size, cache_size=cache_size, total=total)
+        pagination = Pagination(count=source.num_pages)
+
+        async def load_next(page):
+            await source.aprefetch(page)
+            pagination.count = source.num_pages
+
+        def loaded(page, objects):
+            pagination.count = source.num_pages
+            if not prefetch or page is None:
+                return objects
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Without an event loop there is nothing to block
+                source.prefetch(page + 1)
+                pagination.count = source.num_pages
+            else:
+                state.execute(partial(load_next, page + 1))
+            return objects
+
+        if source.asynchronous:
+            async def aload(page):
+                return loaded(page, [] if page is None else await source.apage(page))
+            paged = param.bind(aload, pagination.param.value)
+        else:
+            paged = pagination.rx().rx.pipe(
+                lambda page: loaded(page, [] if page is None else source.page(page))
+            )
+        return Column(layout(objects=paged, **params), pagination)
 
 
 class MenuBar(NestedMenuBase):
@@ -1202,12 +1292,6 @@ class MenuBar(NestedMenuBase):
     _item_keys = ['label', 'icon', 'hint', 'items', 'disabled', 'checkbox', 'radio', '_radio_selected', 'group']
     _rename = {'value': None}
 
-    def _process_param_change(self, params):
-        params = super()._process_param_change(params)
-        if 'items' in params:
-            params['items'] = self._prepare_items(params['items'])
-        return params
-
     def _prepare_items(self, items):
         prepared = []
         for item in items:
@@ -1261,6 +1345,8 @@ class MenuBar(NestedMenuBase):
 
     def _find_item_at_path(self, path):
         items = self.items
+        if isinstance(items, MenuItems):
+            return items.lookup(tuple(path))
         item = None
         for i, idx in enumerate(path):
             if idx >= len(items):
@@ -1297,6 +1383,9 @@ class MenuBar(NestedMenuBase):
                     state.execute(partial(fn, item))
 
     def _update_item_at_path(self, path, key, value):
+        if isinstance(self.items, MenuItems):
+            self.items = self.items.replace({tuple(path): {key: value}})
+            return
         root_items = items = [
             dict(item) if isinstance(item, dict) else item
             for item in self.items
@@ -1316,6 +1405,15 @@ class MenuBar(NestedMenuBase):
         self.items = root_items
 
     def _select_radio(self, path, radio_value):
+        if isinstance(self.items, MenuItems):
+            *parent, _ = path
+            siblings = self.items.lookup(tuple(parent))['items'] if parent else self.items.to_items()
+            self.items = self.items.replace({
+                (*parent, i): {'_radio_selected': item['radio'] == radio_value}
+                for i, item in enumerate(siblings)
+                if isinstance(item, dict) and 'radio' in item
+            })
+            return
         root_items = items = [
             dict(item) if isinstance(item, dict) else item
             for item in self.items
@@ -1392,6 +1490,7 @@ __all__ = [
     "Breadcrumbs",
     "MenuBar",
     "MenuButton",
+    "MenuItems",
     "MenuList",
     "MenuToggle",
     "NestedBreadcrumbs",
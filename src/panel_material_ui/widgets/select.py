@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import typing as t
+from functools import cached_property, partial
 
 import param
-from panel.util import edit_readonly, indexOf, isIn
+from panel.util import edit_readonly, indexOf
 from panel.util.parameters import get_params_to_inherit
 from panel.widgets.base import Widget
 from panel.widgets.select import NestedSelect as _PnNestedSelect
 from panel.widgets.select import Select as _PnSelect
+from panel.widgets.select import SelectBase as _PnSelectBase
 from panel.widgets.select import SingleSelectBase as _PnSingleSelectBase
 from panel.widgets.select import _MultiSelectBase as _PnMultiSelectBase
 from typing_extensions import Self
@@ -17,7 +19,246 @@ from .base import MaterialWidget
 from .button import _ButtonLike
 
 
-class MaterialSingleSelectBase(MaterialWidget, _PnSingleSelectBase):
+def _first_index(items: list) -> dict[t.Any, int] | None:
+    """
+    Maps each item to the index of its first occurrence, returns None
+    if any of the items is not hashable.
+    """
+    index: dict[t.Any, int] = {}
+    try:
+        for i, item in enumerate(items):
+            index.setdefault(item, i)
+    except TypeError:
+        return None
+    return index
+
+
+def _lookup(index: dict[t.Any, int] | None, items: list, item: t.Any) -> int | None:
+    if index is not None:
+        try:
+            return index.get(item)
+        except TypeError:
+            pass
+    try:
+        return indexOf(item, items)
+    except ValueError:
+        return None
+
+
+def _ends(options: list | dict) -> tuple[t.Any, ...]:
+    # Cheap snapshot of the options to detect in-place edits
+    if not options:
+        return ()
+    if isinstance(options, dict):
+        (k0, v0), (k1, v1) = next(iter(options.items())), next(reversed(options.items()))
+        return (k0, v0, k1, v1)
+    return (options[0], options[-1])
+
+
+class _OptionsIndex:
+    """
+    Bidirectional mapping between the labels, values and indexes of a
+    set of options, allowing constant time conversions between them.
+
+    The labels, values and lookup tables are only computed when first
+    accessed, so creating the index is free. In-place edits of the
+    options are only detected if they change the length or the first
+    or last option, other edits require reassigning the options or
+    triggering the options parameter.
+    """
+
+    def __init__(
+        self,
+        options: list | dict,
+        groups: dict | None,
+        get_labels: t.Callable[[], list[str]],
+        get_values: t.Callable[[], list[t.Any]],
+    ):
+        self.options = options
+        self.groups = groups
+        self.size = (len(options), len(groups or ()))
+        self.ends = _ends(options)
+        self._get_labels = get_labels
+        self._get_values = get_values
+
+    def is_current(self, options: list | dict, groups: dict | None) -> bool:
+        return (
+            self.options is options and self.groups is groups and
+            self.size == (len(options), len(groups or ())) and
+            all(a is b for a, b in zip(self.ends, _ends(options), strict=True))
+        )
+
+    @cached_property
+    def labels(self) -> list[str]:
+        return list(self._get_labels())
+
+    @cached_property
+    def values(self) -> list[t.Any]:
+        return self._get_values()
+
+    @cached_property
+    def unicode_values(self) -> list[str]:
+        return [str(v) for v in self.values]
+
+    @cached_property
+    def items(self) -> dict[str, t.Any]:
+        return dict(zip(self.labels, self.values, strict=True))
+
+    @cached_property
+    def unique(self) -> bool:
+        return len(set(self.unicode_values)) == len(self.labels)
+
+    @cached_property
+    def _labels(self) -> dict[t.Any, int] | None:
+        return _first_index(self.labels)
+
+    @cached_property
+    def _unicode(self) -> dict[t.Any, int] | None:
+        return _first_index(self.unicode_values)
+
+    @cached_property
+    def _values(self) -> dict[t.Any, int] | None:
+        return _first_index(self.values)
+
+    def label_index(self, label: t.Any) -> int | None:
+        return _lookup(self._labels, self.labels, label)
+
+    def unicode_index(self, value: t.Any) -> int | None:
+        return _lookup(self._unicode, self.unicode_values, value)
+
+    def value_index(self, value: t.Any) -> int | None:
+        return _lookup(self._values, self.values, value)
+
+
+class _OptionsIndexMixin:
+    """
+    Mixin for select widgets caching the labels, values and the
+    mappings between them, invalidated when the options change.
+    """
+
+    _options_index_cache: _OptionsIndex | None = None
+
+    @property
+    def _options_index(self) -> _OptionsIndex:
+        index = self._options_index_cache
+        options = self.options  # type: ignore[attr-defined]
+        groups = getattr(self, 'groups', None)
+        if index is None or not index.is_current(options, groups):
+            if not options and groups:
+                # Select options may be declared as groups instead
+                get_labels = partial(_PnSelect.labels.fget, self)
+                get_values = partial(_PnSelect.values.fget, self)
+            else:
+                get_labels = partial(_PnSelectBase.labels.fget, self)  # type: ignore[attr-defined]
+                get_values = partial(_PnSelectBase.values.fget, self)  # type: ignore[attr-defined]
+            index = self._options_index_cache = _OptionsIndex(options, groups, get_labels, get_values)
+        return index
+
+    def _reset_options_index(self, *events) -> None:
+        self._options_index_cache = None
+
+    @property
+    def labels(self) -> list[str]:
+        return self._options_index.labels
+
+    @property
+    def values(self) -> list[t.Any]:
+        return self._options_index.values
+
+    @property
+    def unicode_values(self) -> list[str]:
+        return self._options_index.unicode_values
+
+    @property
+    def _items(self) -> dict[str, t.Any]:
+        return self._options_index.items
+
+
+class _IndexedSingleSelectBase(_OptionsIndexMixin, _PnSingleSelectBase):
+    """
+    Single select base class converting between values and labels
+    using the cached options index.
+
+    Value updates found in the index are converted directly, all other
+    updates are processed by the Panel base class.
+    """
+
+    __abstract = True
+
+    @param.depends('options', watch=True)
+    def _invalidate_options_index(self):
+        self._reset_options_index()
+
+    def _process_param_change(self, params: dict[str, t.Any]) -> dict[str, t.Any]:
+        if 'options' in params:
+            self._reset_options_index()
+            return super()._process_param_change(params)
+        if 'value' not in params:
+            return super()._process_param_change(params)
+        index = self._options_index
+        idx = index.value_index(params['value'])
+        if idx is None:
+            return super()._process_param_change(params)
+        props = super()._process_param_change({k: v for k, v in params.items() if k != 'value'})
+        unique = index.unique and self._allows_values
+        props['value'] = (index.unicode_values if unique else index.labels)[idx]
+        return props
+
+    def _process_property_change(self, props: dict[str, t.Any]) -> dict[str, t.Any]:
+        value = props.get('value')
+        if not isinstance(value, str) or value == '':
+            return super()._process_property_change(props)
+        index = self._options_index
+        idx = index.unicode_index(value)
+        if idx is None:
+            idx = index.label_index(value)
+        if idx is None:
+            return super()._process_property_change(props)
+        params = super()._process_property_change({k: v for k, v in props.items() if k != 'value'})
+        params['value'] = index.items[index.labels[idx]]
+        return params
+
+
+class _IndexedMultiSelectBase(_OptionsIndexMixin, _PnMultiSelectBase):
+    """
+    Multi select base class converting between values and labels
+    using the cached options index.
+
+    Value updates found in the index are converted directly, all other
+    updates are processed by the Panel base class.
+    """
+
+    __abstract = True
+
+    @param.depends('options', watch=True)
+    def _invalidate_options_index(self):
+        self._reset_options_index()
+
+    def _process_param_change(self, params: dict[str, t.Any]) -> dict[str, t.Any]:
+        if 'options' in params:
+            self._reset_options_index()
+            return super()._process_param_change(params)
+        if 'value' not in params:
+            return super()._process_param_change(params)
+        index = self._options_index
+        indexes = [index.value_index(v) for v in params['value']]
+        if None in indexes:
+            return super()._process_param_change(params)
+        props = super()._process_param_change({k: v for k, v in params.items() if k != 'value'})
+        props['value'] = [index.labels[i] for i in indexes]
+        return props
+
+    def _process_property_change(self, props: dict[str, t.Any]) -> dict[str, t.Any]:
+        if 'value' not in props:
+            return super()._process_property_change(props)
+        index = self._options_index
+        value = props['value']
+        params = super()._process_property_change({k: v for k, v in props.items() if k != 'value'})
+        params['value'] = [index.items[v] for v in value if index.label_index(v) is not None]
+        return params
+
+
+class MaterialSingleSelectBase(MaterialWidget, _IndexedSingleSelectBase):
     """
     Base class for Material UI single-select widgets.
 
@@ -36,7 +277,7 @@ class MaterialSingleSelectBase(MaterialWidget, _PnSingleSelectBase):
     __abstract = True
 
 
-class MaterialMultiSelectBase(MaterialWidget, _PnMultiSelectBase):
+class MaterialMultiSelectBase(MaterialWidget, _IndexedMultiSelectBase):
     """
     Base class for Material UI multi-select widgets.
 
@@ -154,7 +395,7 @@ class AutocompleteInput(MaterialSingleSelectBase):
 
     def _process_param_change(self, msg):
         props = super()._process_param_change(msg)
-        if 'value' in msg and not self.restrict and not isIn(msg['value'], self.values):
+        if 'value' in msg and not self.restrict and self._options_index.value_index(msg['value']) is None:
             with param.parameterized.discard_events(self):
                 self.value = props['value'] = msg['value']
         elif self.lazy_search and "options" in props:
@@ -166,8 +407,8 @@ class AutocompleteInput(MaterialSingleSelectBase):
         with edit_readonly(self):
             if self.value is None:
                 self.value_input = ''
-            elif isinstance(self.options, dict) and isIn(self.value, self.values):
-                self.value_input = self.labels[indexOf(self.value, self.values)]
+            elif isinstance(self.options, dict) and (idx := self._options_index.value_index(self.value)) is not None:
+                self.value_input = self.labels[idx]
             else:
                 self.value_input = self.value
 
@@ -281,6 +522,12 @@ class _SelectDropdownBase(MaterialWidget):
     filter_on_search = param.Boolean(default=True, doc="""
         Whether options are filtered or merely highlighted on search.""")
 
+    option_limit = param.Integer(default=None, bounds=(1, None), doc="""
+        Maximum number of options to display at once.""")
+
+    search_option_limit = param.Integer(default=None, bounds=(1, None), doc="""
+        Maximum number of options to display at once if search string is entered.""")
+
     dropdown_height = param.Integer(default=500, doc="Height of the dropdown menu")
 
     dropdown_open = param.Boolean(default=False, doc="Whether the dropdown is open")
@@ -589,12 +836,6 @@ class MultiChoice(_SelectDropdownBase, MultiSelect):
     delete_button = param.Boolean(default=True, doc="""
         Whether to display a button to delete a selected option.""")
 
-    option_limit = param.Integer(default=None, bounds=(1, None), doc="""
-        Maximum number of options to display at once.""")
-
-    search_option_limit = param.Integer(default=None, bounds=(1, None), doc="""
-        Maximum number of options to display at once if search string is entered.""")
-
     placeholder = param.String(default='', doc="""
         String displayed when no selection has been made.""")
 
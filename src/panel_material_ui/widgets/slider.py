@@ -6,12 +6,13 @@ import typing as t
 import param
 from bokeh.models.formatters import NumeralTickFormatter, TickFormatter
 from panel.util import datetime_as_utctimestamp, edit_readonly, value_as_date, value_as_datetime
-from panel.widgets.select import SingleSelectBase as _PnSingleSelectBase
 from panel.widgets.slider import _SliderBase
 from param.parameterized import resolve_value
 
 from ..base import COLORS, ColorType
+from ._options import encode_options
 from .base import MaterialWidget
+from .select import _IndexedSingleSelectBase
 
 
 class _ContinuousSlider(MaterialWidget, _SliderBase):
@@ -436,7 +437,7 @@ class DatetimeRangeSlider(DateRangeSlider):
     _constants = {"datetime": True, "loading_inset": -6}
 
 
-class DiscreteSlider(IntSlider, _PnSingleSelectBase):
+class DiscreteSlider(IntSlider, _IndexedSingleSelectBase):
     """
     The DiscreteSlider widget allows selecting a discrete value using a slider.
 
@@ -445,6 +446,10 @@ class DiscreteSlider(IntSlider, _PnSingleSelectBase):
     - https://panel-material-ui.holoviz.org/reference/widgets/DiscreteSlider.html
     - https://panel.holoviz.org/reference/widgets/DiscreteSlider.html
     - https://mui.com/material-ui/react-slider/
+
+    Long numeric or datetime options whose labels are the default
+    formatting of their values are sent to the frontend as a range or a
+    packed array and the labels are formatted on the frontend.
     """
 
     options = param.ClassSelector(default=[], class_=(dict, list), doc="""
@@ -464,17 +469,31 @@ class DiscreteSlider(IntSlider, _PnSingleSelectBase):
     _allows_values = False
     _constants = {"discrete": True, "loading_inset": -6}
 
+    # Minimum number of options to encode compactly
+    _encode_threshold: t.ClassVar[int] = 100
+
+    _encoded_options: tuple[t.Any, t.Any] | None = None
+
     @param.depends("options", watch=True)
     def _update_bounds(self):
         with edit_readonly(self):
             self.param.update(start=0, end=len(self.options)-1)
 
+    def _encode_options(self) -> list[str] | dict[str, t.Any]:
+        index = self._options_index
+        if len(index.labels) < self._encode_threshold:
+            return index.labels
+        if self._encoded_options is None or self._encoded_options[0] is not index:
+            encoded = encode_options(index.values, index.labels)
+            self._encoded_options = (index, encoded)
+        return self._encoded_options[1] or index.labels
+
     def _process_param_change(self, msg):
         msg = super()._process_param_change(msg)
         if 'options' in msg:
-            msg['options'] = self.labels
+            msg['options'] = self._encode_options()
         if 'value' in msg:
-            msg['value'] = self.labels.index(msg['value'])
+            msg['value'] = self._options_index.label_index(msg['value'])
         return msg
 
     def _process_property_change(self, msg):
@@ -0,0 +1,279 @@
+"""
+Benchmarks measuring the construction, rendering and sync cost of all
+MaterialComponents.
+
+The benchmarks only run when pytest is invoked with the --bench option
+and should not be run in parallel, i.e. without pytest-xdist:
+
+    pytest tests/benchmarks --bench
+
+Each measurement is compared against the baseline stored in
+baselines.json and fails if it regresses by more than the configured
+threshold (see --bench-time-threshold and --bench-size-threshold) or
+if it has no baseline.
+Timings are the best of several repetitions, sizes are measured in
+bytes of serialized JSON. To record new baselines run:
+
+    pytest tests/benchmarks --bench --bench-update
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+import time
+from datetime import date, datetime
+
+import param
+import pytest
+from bokeh.core.json_encoder import serialize_json
+from bokeh.document import Document
+from bokeh.protocol import Protocol
+
+from panel_material_ui.base import MaterialComponent
+from panel_material_ui.chat import ChatFeed
+from panel_material_ui.layout import Feed
+from panel_material_ui.widgets import Select, Tree
+
+pytestmark = pytest.mark.bench
+
+BASELINES = pathlib.Path(__file__).parent / 'baselines.json'
+
+REPEAT = 5
+
+# Absolute slack (in seconds) added to timing thresholds to avoid
+# flaky failures for very fast operations.
+TIME_SLACK = 0.005
+
+SKIP = {'NumberInput'}
+
+KWARGS = {
+    'DateRangeSlider': dict(
+        start=date(2025, 1, 1), end=date(2025, 12, 31),
+        value=(date(2025, 1, 1), date(2025, 6, 1))
+    ),
+    'DatetimeRangeSlider': dict(
+        start=datetime(2025, 1, 1), end=datetime(2025, 12, 31),
+        value=(datetime(2025, 1, 1), datetime(2025, 6, 1))
+    ),
+    'DiscreteSlider': dict(options=[1, 2, 3], value=1),
+}
+
+# Representative updates applied to every component in addition to
+# component specific value updates.
+COMMON_UPDATES = {'sx': {'color': 'red'}, 'loading': True}
+
+UPDATES = {
+    'AutocompleteInput': dict(options=['A', 'B', 'C'], value='B'),
+    'Checkbox': dict(value=True),
+    'DiscreteSlider': dict(value=2),
+    'FloatSlider': dict(value=0.5),
+    'IntSlider': dict(value=5),
+    'MultiChoice': dict(options=['A', 'B', 'C'], value=['A', 'B']),
+    'PasswordInput': dict(value='secret'),
+    'RangeSlider': dict(value=(10, 20)),
+    'Select': dict(options=['A', 'B', 'C'], value='B'),
+    'Switch': dict(value=True),
+    'TextAreaInput': dict(value='Lorem ipsum ' * 10),
+    'TextInput': dict(value='Lorem ipsum'),
+}
+
+
+def get_components():
+    descendants = param.concrete_descendents(MaterialComponent)
+    return [
+        (name, cls)
+        for name, cls in sorted(descendants.items())
+        if not name.startswith('_') and name not in SKIP
+    ]
+
+
+def timeit(fn, repeat=REPEAT):
+    """
+    Returns the best wall time of `repeat` calls to fn and the result
+    of the last call.
+    """
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def render(obj):
+    doc = Document()
+    model = obj.get_root(doc)
+    doc.add_root(model)
+    return doc
+
+
+_EMPTY_DOC_SIZE = len(serialize_json(Document().to_json()))
+
+def doc_size(doc):
+    """
+    Size of the serialized document excluding the model definitions
+    shared by all documents.
+    """
+    return len(serialize_json(doc.to_json())) - _EMPTY_DOC_SIZE
+
+
+def patch(doc, fn):
+    """
+    Executes fn and returns the time and size of the PATCH-DOC
+    message generated by the changes it applies to the document.
+    """
+    doc.hold('combine')
+    try:
+        start = time.perf_counter()
+        fn()
+        latency = time.perf_counter() - start
+        events = list(doc.callbacks._held_events)
+        doc.callbacks._held_events = []
+    finally:
+        doc.unhold()
+    if not events:
+        return latency, 0
+    return latency, len(Protocol().create('PATCH-DOC', events).content_json)
+
+
+@pytest.fixture(scope='module')
+def baselines(request):
+    stored = json.loads(BASELINES.read_text()) if BASELINES.is_file() else {}
+    recorded = {}
+    yield stored, recorded
+    if request.config.getoption('--bench-update') and recorded:
+        BASELINES.write_text(json.dumps(dict(stored, **recorded), indent=2, sort_keys=True) + '\n')
+
+
+class BaselineCheck:
+    """
+    Compares measurements against their stored baselines, or records
+    them as new baselines. Regressions are collected so all of a test's
+    measurements are reported by verify().
+    """
+
+    def __init__(self, stored, recorded, update, time_threshold, size_threshold):
+        self.stored = stored
+        self.recorded = recorded
+        self.update = update
+        self.time_threshold = time_threshold
+        self.size_threshold = size_threshold
+        self.failures = []
+
+    def __call__(self, key, value):
+        if self.update:
+            self.recorded[key] = round(value, 6) if isinstance(value, float) else value
+            return
+        elif key not in self.stored:
+            self.failures.append(f'{key}: no baseline, record it with --bench-update')
+            return
+        baseline = self.stored[key]
+        if key.endswith('_s'):
+            limit = baseline * self.time_threshold + TIME_SLACK
+        else:
+            limit = baseline * self.size_threshold
+        if value > limit:
+            self.failures.append(f'{key}: {value} exceeds baseline {baseline} (limit {limit:.6g})')
+
+    def verify(self):
+        assert not self.failures, 'Benchmark regressions:\n' + '\n'.join(self.failures)
+
+
+@pytest.fixture
+def check(request, baselines):
+    stored, recorded = baselines
+    return BaselineCheck(
+        stored, recorded,
+        update=request.config.getoption('--bench-update'),
+        time_threshold=float(request.config.getoption('--bench-time-threshold')),
+        size_threshold=float(request.config.getoption('--bench-size-threshold')),
+    )
+
+
+@pytest.mark.parametrize("name,cls", get_components(), ids=[c[0] for c in get_components()])
+def test_component_benchmark(name, cls, check):
+    kwargs = KWARGS.get(name, {})
+    construct, obj = timeit(lambda: cls(**kwargs))
+    check(f'{name}.construct_s', construct)
+
+    get_root, doc = timeit(lambda: render(obj))
+    check(f'{name}.get_root_s', get_root)
+    check(f'{name}.doc_bytes', doc_size(doc))
+
+    updates = dict(COMMON_UPDATES, **UPDATES.get(name, {}))
+    updates = {k: v for k, v in updates.items() if k in obj.param}
+    original = {k: getattr(obj, k) for k in updates}
+    latency = float('inf')
+    for _ in range(REPEAT):
+        update_latency, size = patch(doc, lambda: obj.param.update(**updates))
+        latency = min(latency, update_latency)
+        patch(doc, lambda: obj.param.update(**original))
+    check(f'{name}.update_s', latency)
+    check(f'{name}.update_bytes', size)
+    check.verify()
+
+
+@pytest.mark.parametrize('n', [10_000, 100_000])
+def test_select_options_scaling(n, check):
+    options = [f'Option {i}' for i in range(n)]
+    construct, select = timeit(lambda: Select(options=options), repeat=1)
+    check(f'Select[{n}].construct_s', construct)
+
+    get_root, doc = timeit(lambda: render(select), repeat=1)
+    check(f'Select[{n}].get_root_s', get_root)
+    check(f'Select[{n}].doc_bytes', doc_size(doc))
+
+    latency, size = patch(doc, lambda: setattr(select, 'value', options[-1]))
+    check(f'Select[{n}].update_s', latency)
+    check(f'Select[{n}].update_bytes', size)
+    check.verify()
+
+
+def test_tree_scaling(check):
+    items = [
+        {'label': f'Node {i}', 'items': [{'label': f'Leaf {i}.{j}'} for j in range(99)]}
+        for i in range(1000)
+    ]
+    construct, tree = timeit(lambda: Tree(items=items), repeat=1)
+    check('Tree[100000].construct_s', construct)
+
+    get_root, doc = timeit(lambda: render(tree), repeat=1)
+    check('Tree[100000].get_root_s', get_root)
+    check('Tree[100000].doc_bytes', doc_size(doc))
+
+    latency, size = patch(doc, lambda: setattr(tree, 'expanded', [(0,)]))
+    check('Tree[100000].update_s', latency)
+    check('Tree[100000].update_bytes', size)
+    check.verify()
+
+
+def test_feed_scaling(check):
+    objects = [f'Item {i}' for i in range(10_000)]
+    construct, feed = timeit(lambda: Feed(*objects), repeat=1)
+    check('Feed[10000].construct_s', construct)
+
+    get_root, doc = timeit(lambda: render(feed), repeat=1)
+    check('Feed[10000].get_root_s', get_root)
+    check('Feed[10000].doc_bytes', doc_size(doc))
+
+    latency, size = patch(doc, lambda: feed.append('Latest'))
+    check('Feed[10000].update_s', latency)
+    check('Feed[10000].update_bytes', size)
+    check.verify()
+
+
+def test_chat_feed_streaming(check):
+    feed = ChatFeed()
+    message = feed.send('Hello', user='User', respond=False)
+    doc = render(feed)
+
+    tokens = 200
+    start = time.perf_counter()
+    sizes = []
+    for i in range(tokens):
+        _, size = patch(doc, lambda: feed.stream(f' token{i}', message=message))
+        sizes.append(size)
+    elapsed = time.perf_counter() - start
+    check('ChatFeed[stream].token_s', elapsed / tokens)
+    check('ChatFeed[stream].token_bytes', sum(sizes) // tokens)
+    check.verify()
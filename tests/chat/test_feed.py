@@ -0,0 +1,241 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import panel as pn
+import pytest
+from panel.util import edit_readonly
+
+from panel_material_ui import CallbackExecutor, ChatFeed, ChatMessage
+from panel_material_ui.chat._history import HistorySource
+
+pn.extension()
+
+
+HISTORY = [f"Message {i}" for i in range(100)]
+
+
+def _scroll(feed, start, end):
+    with edit_readonly(feed._chat_log):
+        feed._chat_log.visible_range = (start, end)
+
+
+def _objects(feed):
+    return [message.object for message in feed.objects]
+
+
+def test_history_source_pages_sequence():
+    source = HistorySource(HISTORY)
+
+    assert source.fetch(0, 10) == HISTORY[90:]
+    assert source.fetch(90, 20) == HISTORY[:10]
+    assert source.total == 100
+    assert not source.has_more(100)
+
+
+def test_history_source_pages_iterator_from_newest():
+    source = HistorySource(reversed(HISTORY))
+
+    assert source.fetch(0, 10) == HISTORY[90:]
+    assert source.fetch(10, 10) == HISTORY[80:90]
+    assert source.has_more(20)
+
+
+def test_history_source_rejects_invalid_provider():
+    with pytest.raises(TypeError):
+        HistorySource(1)
+
+
+def test_chat_feed_history_loads_most_recent_page():
+    feed = ChatFeed(history=HISTORY, history_page_size=10)
+
+    assert _objects(feed) == HISTORY[90:]
+    assert all(isinstance(message, ChatMessage) for message in feed.objects)
+
+
+def test_chat_feed_history_from_fetch_callable():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append((offset, limit))
+        return [{"object": m, "user": "Bot"} for m in HISTORY[max(100 - offset - limit, 0):100 - offset]]
+
+    feed = ChatFeed(history=fetch, history_page_size=10)
+
+    assert calls == [(0, 10)]
+    assert _objects(feed) == HISTORY[90:]
+    assert feed.objects[0].user == "Bot"
+
+
+def test_chat_feed_history_loads_page_on_scroll_to_top():
+    feed = ChatFeed(history=HISTORY, history_page_size=10, load_buffer=10)
+
+    _scroll(feed, 1, 5)
+
+    assert _objects(feed) == HISTORY[80:]
+    assert feed._chat_log.visible_range == (11, 15)
+
+
+def test_chat_feed_history_keeps_sent_messages_last():
+    feed = ChatFeed(history=HISTORY, history_page_size=10, load_buffer=10)
+    feed.send("New", respond=False)
+
+    _scroll(feed, 0, 5)
+
+    assert _objects(feed) == HISTORY[80:] + ["New"]
+
+
+def test_chat_feed_history_disposes_messages_beyond_retention():
+    feed = ChatFeed(
+        history=HISTORY, history_page_size=10, history_retention=10, load_buffer=10
+    )
+    for _ in range(3):
+        _scroll(feed, 0, 5)
+    assert _objects(feed) == HISTORY[60:]
+
+    _scroll(feed, 35, 40)
+
+    assert _objects(feed) == HISTORY[85:]
+    assert feed._history_loaded == 15
+    assert feed._chat_log.visible_range == (10, 15)
+
+    _scroll(feed, 0, 5)
+    assert _objects(feed) == HISTORY[75:]
+
+
+def test_chat_feed_history_stops_at_start():
+    feed = ChatFeed(history=HISTORY[:15], history_page_size=10, load_buffer=10)
+    _scroll(feed, 0, 5)
+    _scroll(feed, 0, 5)
+
+    assert _objects(feed) == HISTORY[:15]
+
+
+def test_chat_feed_history_replaced():
+    feed = ChatFeed(history=HISTORY, history_page_size=10)
+    feed.send("New", respond=False)
+
+    feed.history = ["Other"]
+
+    assert _objects(feed) == ["Other", "New"]
+
+
+def test_chat_feed_clear_does_not_reload_history():
+    feed = ChatFeed(history=HISTORY, history_page_size=10, load_buffer=10)
+
+    feed.clear()
+    _scroll(feed, 0, 1)
+
+    assert feed.objects == []
+
+
+async def test_chat_feed_history_from_async_iterator():
+    async def newest_first():
+        for message in reversed(HISTORY):
+            yield message
+
+    feed = ChatFeed(history=newest_first(), history_page_size=10)
+    for _ in range(20):
+        if feed.objects:
+            break
+        await asyncio.sleep(0.05)
+
+    assert _objects(feed) == HISTORY[90:]
+
+
+async def _wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+async def test_callback_executor_caps_concurrency():
+    executor = CallbackExecutor(max_concurrency=1, max_session_concurrency=None)
+    release = asyncio.Event()
+
+    async def callback(contents):
+        await release.wait()
+        return contents
+
+    feeds = [ChatFeed(callback=callback, executor=executor) for _ in range(2)]
+    for feed in feeds:
+        feed.send("Hello")
+
+    await _wait_for(lambda: executor.queued == 1)
+    assert executor.active == 1
+
+    release.set()
+    await _wait_for(lambda: all(len(feed) == 2 for feed in feeds))
+    assert executor.active == 0
+
+
+async def test_callback_executor_queues_per_session():
+    executor = CallbackExecutor()
+    order = []
+
+    async def callback(contents):
+        order.append(f"start {contents}")
+        await asyncio.sleep(0.05)
+        order.append(f"end {contents}")
+
+    feeds = [ChatFeed(callback=callback, executor=executor) for _ in range(2)]
+    feeds[0].send("A")
+    feeds[1].send("B")
+
+    await _wait_for(lambda: len(order) == 4)
+    assert order == ["start A", "end A", "start B", "end B"]
+
+
+async def test_callback_executor_runs_sync_callback_on_executor():
+    pool = ThreadPoolExecutor(1, thread_name_prefix="chat-callback")
+
+    def callback(contents):
+        return threading.current_thread().name
+
+    feed = ChatFeed(callback=callback, executor=CallbackExecutor(pool))
+    feed.send("Hello")
+
+    await _wait_for(lambda: len(feed) == 2)
+    assert feed.objects[-1].object.startswith("chat-callback")
+    pool.shutdown()
+
+
+async def test_callback_executor_streams_sync_generator():
+    def callback(contents):
+        for i in range(3):
+            yield contents * (i + 1)
+
+    feed = ChatFeed(callback=callback, executor=ThreadPoolExecutor(1))
+    feed.send("a")
+
+    await _wait_for(lambda: len(feed) == 2 and feed.objects[-1].object == "aaa")
+
+
+async def test_callback_executor_stop_cancels_queued_callback():
+    executor = CallbackExecutor(max_concurrency=1, max_session_concurrency=None)
+    release = asyncio.Event()
+    called = []
+
+    async def callback(contents):
+        called.append(contents)
+        await release.wait()
+        return contents
+
+    running, queued = (ChatFeed(callback=callback, executor=executor) for _ in range(2))
+    running.send("A")
+    queued.send("B")
+    await _wait_for(lambda: executor.queued == 1)
+
+    assert queued.stop()
+    await _wait_for(lambda: executor.queued == 0)
+    release.set()
+    await _wait_for(lambda: executor.active == 0)
+
+    assert called == ["A"]
+
+
+def test_callback_executor_validates_limits():
+    with pytest.raises(ValueError):
+        CallbackExecutor(max_concurrency=0)
@@ -0,0 +1,65 @@
+import gc
+import weakref
+
+from bokeh.document import Document
+from bokeh.models import InlineStyleSheet
+
+from panel_material_ui._stylesheets import _registry, resolve_stylesheets
+from panel_material_ui.chat import ChatFeed, ChatMessage
+from panel_material_ui.chat.message import _MESSAGE_STYLESHEET
+from panel_material_ui.widgets import Button
+
+
+def _message_stylesheets(model):
+    return [
+        sts for sts in model.stylesheets
+        if isinstance(sts, InlineStyleSheet) and sts.css == _MESSAGE_STYLESHEET
+    ]
+
+
+def test_message_stylesheet_shared_across_messages(document, comm):
+    feed = ChatFeed(ChatMessage("Hello"), ChatMessage(Button(label='Click')))
+    models = [
+        model for model in feed.get_root(document, comm=comm).references()
+        if hasattr(model, 'stylesheets')
+    ]
+    stylesheets = {id(sts) for model in models for sts in _message_stylesheets(model)}
+    assert len(stylesheets) == 1
+    assert all(_MESSAGE_STYLESHEET not in model.stylesheets for model in models)
+
+
+def test_message_stylesheet_not_shared_across_documents(comm):
+    message = ChatMessage("Hello")
+    doc1, doc2 = Document(), Document()
+    model1 = message.get_root(doc1, comm=comm)
+    model2 = message.get_root(doc2, comm=comm)
+    assert _message_stylesheets(model1)[0] is not _message_stylesheets(model2)[0]
+
+
+def test_message_include_styles_skips_styled_children():
+    message = ChatMessage("Hello")
+    pane = message._object_panel
+    assert _MESSAGE_STYLESHEET in pane.stylesheets
+    events = []
+    pane.param.watch(events.append, ['stylesheets', 'css_classes', 'sizing_mode'])
+    message._include_styles(pane)
+    assert events == []
+
+
+def test_message_raw_css_not_registered(document, comm):
+    css = ".custom { color: red; }"
+    message = ChatMessage("Hello", stylesheets=[css])
+    model = message.get_root(document, comm=comm)
+    assert css in model.stylesheets
+    assert css in message._object_panel.stylesheets
+    assert css not in _registry
+
+
+def test_shared_stylesheets_released_with_document():
+    doc = Document()
+    props = resolve_stylesheets({'stylesheets': [_MESSAGE_STYLESHEET]}, doc)
+    doc.add_root(props['stylesheets'][0])
+    ref = weakref.ref(doc)
+    del doc, props
+    gc.collect()
+    assert ref() is None
@@ -62,6 +62,11 @@ optional_markers = {
         "marker-descr": "UI test marker",
         "skip-reason": "Test only runs with the --ui option."
     },
+    "bench": {
+        "help": "Runs benchmarks",
+        "marker-descr": "Benchmark test marker",
+        "skip-reason": "Test only runs with the --bench option."
+    },
 }
 
 
@@ -71,6 +76,12 @@ def pytest_addoption(parser):
                          default=False, help=info['help'])
     parser.addoption('--repeat', action='store',
         help='Number of times to repeat each test')
+    parser.addoption('--bench-update', action='store_true', default=False,
+        help='Record the benchmark results as the new baselines')
+    parser.addoption('--bench-time-threshold', action='store', default=2.0,
+        help='Maximum allowed ratio of benchmark timings to their baseline')
+    parser.addoption('--bench-size-threshold', action='store', default=1.1,
+        help='Maximum allowed ratio of benchmark message sizes to their baseline')
 
 
 def pytest_configure(config):
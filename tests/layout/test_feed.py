@@ -0,0 +1,74 @@
+from panel.pane import Markdown
+from panel.util import edit_readonly
+
+from panel_material_ui.layout import Feed
+
+
+def _report_heights(feed, model, heights):
+    refs = [child.ref["id"] for child in model.data.objects]
+    feed._handle_msg({"type": "heights", "heights": dict(zip(refs, heights))})
+
+
+def test_feed_spacers_empty_without_measurements():
+    feed = Feed(*(Markdown(str(i)) for i in range(100)), load_buffer=10)
+    model = feed.get_root()
+
+    assert model.data.spacer_heights == (0, 0)
+    assert len(model.data.objects) == 10
+
+
+def test_feed_caches_reported_heights():
+    feed = Feed(*(Markdown(str(i)) for i in range(100)), load_buffer=10)
+    model = feed.get_root()
+
+    _report_heights(feed, model, range(10, 20))
+
+    assert feed._object_heights(0, 10) == list(range(10, 20))
+    assert feed._object_heights(10, 11) == [14.5]
+
+
+def test_feed_spacers_sized_from_cached_heights():
+    feed = Feed(*(Markdown(str(i)) for i in range(100)), load_buffer=10)
+    model = feed.get_root()
+    _report_heights(feed, model, [20] * 10)
+
+    with edit_readonly(feed):
+        feed.visible_range = (40, 45)
+
+    assert feed._last_synced == (30, 55)
+    assert model.data.spacer_heights == (600, 900)
+    assert len(model.data.objects) == 25
+
+
+def test_feed_spacers_use_estimated_height():
+    feed = Feed(*(Markdown(str(i)) for i in range(100)), load_buffer=10, estimated_height=50)
+    model = feed.get_root()
+    _report_heights(feed, model, [20] * 10)
+
+    with edit_readonly(feed):
+        feed.visible_range = (40, 45)
+
+    assert model.data.spacer_heights == (10 * 20 + 20 * 50, 45 * 50)
+
+
+def test_feed_scroll_into_spacer_loads_objects_at_position():
+    feed = Feed(*(Markdown(str(i)) for i in range(100)), load_buffer=10)
+    model = feed.get_root()
+    _report_heights(feed, model, [20] * 10)
+
+    feed.scroll_position = 1010
+
+    assert feed.visible_range == (50, 51)
+    assert feed._last_synced == (40, 61)
+    assert model.data.spacer_heights == (800, 780)
+
+
+def test_feed_prunes_heights_of_removed_objects():
+    objects = [Markdown(str(i)) for i in range(100)]
+    feed = Feed(*objects, load_buffer=10)
+    model = feed.get_root()
+    _report_heights(feed, model, [20] * 10)
+
+    feed.objects = objects[5:]
+
+    assert set(feed._heights) == {id(obj) for obj in objects[5:10]}
@@ -0,0 +1,59 @@
+import pytest
+
+from panel_material_ui.layout import Accordion, Tabs
+
+
+def test_tabs_list_api_updates_names():
+    tabs = Tabs(("A", "a"), ("B", "b"))
+    tabs.append(("C", "c"))
+    tabs.insert(0, ("Z", "z"))
+    tabs.pop(1)
+    tabs[0] = ("Y", "y")
+    tabs.reverse()
+    assert tabs._names == ["C", "B", "Y"]
+    assert len(tabs._headers) == 3
+    assert [obj.object for obj in tabs] == ["c", "b", "y"]
+
+
+def test_accordion_batch_single_update():
+    accordion = Accordion(("A", "a"))
+    events = []
+    accordion.param.watch(lambda *events_: events.extend(events_), ["objects", "_names", "_headers"])
+    with accordion.batch():
+        for i in range(10):
+            accordion.append((f"Card {i}", f"Content {i}"))
+        assert len(accordion) == 11
+        assert accordion[-1].object == "Content 9"
+        assert len(accordion.objects) == 1
+        accordion.pop(0)
+    assert accordion._names == [f"Card {i}" for i in range(10)]
+    assert sorted(e.name for e in events) == ["_headers", "_names", "objects"]
+
+
+def test_accordion_batch_model_update():
+    accordion = Accordion(("A", "a"))
+    model = accordion.get_root()
+    with accordion.batch():
+        accordion.extend([("B", "b"), ("C", "c")])
+        accordion.remove(accordion[0])
+    assert model.data._names == ["B", "C"]
+    assert len(model.data.objects) == 2
+    assert len(model.data._headers) == 2
+
+
+def test_accordion_batch_rolls_back_on_error():
+    accordion = Accordion(("A", "a"))
+    with pytest.raises(RuntimeError):
+        with accordion.batch():
+            accordion.append(("B", "b"))
+            raise RuntimeError
+    assert accordion._names == ["A"]
+    assert len(accordion) == 1
+
+
+def test_tabs_apply_changes():
+    tabs = Tabs(("A", "a"), ("B", "b"))
+    tabs.apply_changes([("pop", 0), ("append", ("C", "c")), ("__setitem__", 0, ("D", "d"))])
+    assert tabs._names == ["D", "C"]
+    with pytest.raises(ValueError):
+        tabs.apply_changes([("objects", [])])
@@ -0,0 +1,138 @@
+import pytest
+from bokeh.document import Document
+
+from panel_material_ui.layout import Backdrop, Dialog, Drawer, Popup
+from panel_material_ui.widgets import Button
+
+
+@pytest.mark.parametrize('overlay_type', [Backdrop, Dialog, Drawer, Popup])
+def test_overlay_renders_contents_by_default(overlay_type):
+    button = Button(label='Click')
+    overlay = overlay_type(button)
+
+    model = overlay.get_root(Document())
+
+    assert len(model.data.objects) == 1
+    assert model.ref['id'] in button._models
+
+
+@pytest.mark.parametrize('overlay_type', [Backdrop, Dialog, Drawer, Popup])
+def test_overlay_lazy_defers_contents_until_open(overlay_type):
+    button = Button(label='Click')
+    overlay = overlay_type(button, lazy=True)
+
+    model = overlay.get_root(Document())
+
+    assert model.data.objects == []
+    assert not button._models
+
+    overlay.open = True
+
+    assert len(model.data.objects) == 1
+    assert model.ref['id'] in button._models
+
+
+def test_overlay_lazy_open_on_init_renders_contents():
+    button = Button(label='Click')
+    dialog = Dialog(button, lazy=True, open=True)
+
+    model = dialog.get_root(Document())
+
+    assert len(model.data.objects) == 1
+
+
+def test_overlay_lazy_retains_contents_after_close():
+    button = Button(label='Click')
+    dialog = Dialog(button, lazy=True)
+    model = dialog.get_root(Document())
+
+    dialog.open = True
+    dialog.open = False
+    dialog._handle_msg({'type': 'exited'})
+
+    assert len(model.data.objects) == 1
+    assert model.ref['id'] in button._models
+
+
+def test_overlay_destroy_on_close_waits_for_exit_transition():
+    button = Button(label='Click')
+    dialog = Dialog(button, lazy=True, destroy_on_close=True)
+    model = dialog.get_root(Document())
+
+    dialog.open = True
+    dialog.open = False
+
+    assert len(model.data.objects) == 1
+
+    dialog._handle_msg({'type': 'exited'})
+
+    assert model.data.objects == []
+    assert not button._models
+
+
+def test_overlay_destroy_on_close_recreates_contents_on_reopen():
+    button = Button(label='Click')
+    dialog = Dialog(button, lazy=True, destroy_on_close=True)
+    model = dialog.get_root(Document())
+
+    dialog.open = True
+    old = model.data.objects[0]
+    dialog.open = False
+    dialog._handle_msg({'type': 'exited'})
+    dialog.open = True
+
+    assert len(model.data.objects) == 1
+    assert model.data.objects[0] is not old
+
+
+def test_overlay_destroy_on_close_ignores_exit_after_reopen():
+    button = Button(label='Click')
+    dialog = Dialog(button, lazy=True, destroy_on_close=True)
+    model = dialog.get_root(Document())
+
+    dialog.open = True
+    dialog.open = False
+    dialog.open = True
+    dialog._handle_msg({'type': 'exited'})
+
+    assert len(model.data.objects) == 1
+
+
+def test_overlay_destroy_on_close_without_render():
+    dialog = Dialog(Button(label='Click'), lazy=True, destroy_on_close=True)
+
+    dialog.open = True
+    dialog.open = False
+    model = dialog.get_root(Document())
+
+    assert model.data.objects == []
+
+
+def test_overlay_lazy_objects_updated_while_closed():
+    dialog = Dialog(lazy=True)
+    model = dialog.get_root(Document())
+
+    dialog.append(Button(label='Click'))
+
+    assert model.data.objects == []
+
+    dialog.open = True
+
+    assert len(model.data.objects) == 1
+
+
+def test_drawer_lazy_permanent_renders_contents():
+    drawer = Drawer(Button(label='Click'), lazy=True, variant='permanent')
+
+    model = drawer.get_root(Document())
+
+    assert len(model.data.objects) == 1
+
+
+def test_overlay_lazy_not_synced():
+    dialog = Dialog(lazy=True, destroy_on_close=True)
+
+    model = dialog.get_root(Document())
+
+    assert 'lazy' not in model.data.properties()
+    assert 'destroy_on_close' not in model.data.properties()
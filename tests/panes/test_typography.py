@@ -0,0 +1,110 @@
+"""Tests for Typography component and the Markdown render cache."""
+
+from html import escape
+
+from panel.pane import Markdown
+
+from panel_material_ui import Typography
+from panel_material_ui._markdown import CachedMarkdown, IncrementalMarkdown, _cache, _render, clear_markdown_cache
+from panel_material_ui.chat import ChatMessage
+
+DOCUMENT = """# Title
+
+Some *text* with a [link](https://panel.holoviz.org).
+
+- item 1
+- item 2
+
+```python
+def f():
+    return 1
+```
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+> quote
+"""
+
+
+class TestMarkdownCache:
+
+    def test_incremental_render_matches_full_render(self):
+        pane = Markdown()
+        renderer = IncrementalMarkdown()
+        for i in range(len(DOCUMENT) + 1):
+            assert renderer.render(pane, DOCUMENT[:i]) == _render(pane, DOCUMENT[:i])
+
+    def test_incremental_render_merges_list_items(self):
+        pane = Markdown()
+        renderer = IncrementalMarkdown()
+        text = "1. First step\n\n2. Second step\n\n3. Third step\n"
+        for i in range(len(text) + 1):
+            assert renderer.render(pane, text[:i]) == _render(pane, text[:i])
+        assert renderer.render(pane, text).count('<ol>') == 1
+
+    def test_incremental_render_merges_blockquotes(self):
+        pane = Markdown()
+        renderer = IncrementalMarkdown()
+        text = "> quote\n\n> more\n\nParagraph\n\nEnd\n"
+        for i in range(len(text) + 1):
+            assert renderer.render(pane, text[:i]) == _render(pane, text[:i])
+
+    def test_incremental_render_unfinished_line_continues_paragraph(self):
+        pane = Markdown()
+        renderer = IncrementalMarkdown()
+        text = ''
+        for chunk in ("Here are the results\n", "***", "Important:*** check the logs\n"):
+            text += chunk
+            assert renderer.render(pane, text) == _render(pane, text)
+        assert renderer.render(pane, text).count('<p>') == 1
+
+    def test_incremental_render_retains_stable_blocks(self):
+        pane = Markdown()
+        renderer = IncrementalMarkdown()
+        renderer.render(pane, DOCUMENT)
+        assert renderer._source
+        assert DOCUMENT.startswith(renderer._source)
+        assert renderer._source != DOCUMENT
+
+    def test_render_memoized_across_panes(self):
+        clear_markdown_cache()
+        t1 = Typography(DOCUMENT)
+        t2 = Typography(DOCUMENT)
+        html = t1._transform_object(DOCUMENT)['object']
+        assert len(_cache) == 1
+        assert t2._transform_object(DOCUMENT)['object'] == html
+        assert len(_cache) == 1
+
+
+class TestTypography:
+
+    def test_typography_renders_markdown(self):
+        typography = Typography("Hello **world**")
+        model = typography.get_root()
+        assert model.data.object == escape("<p>Hello <strong>world</strong></p>\n")
+
+    def test_typography_streaming_sends_delta(self, document, comm, monkeypatch):
+        typography = Typography("Hello", enable_streaming=True)
+        model = typography.get_root(document, comm)
+        events = []
+        monkeypatch.setattr(document.callbacks, 'send_event', events.append)
+        typography.object = "Hello world"
+        assert typography.object == "Hello world"
+        assert model.data.object == escape("<p>Hello world</p>\n")
+        assert [event.data for event in events] == [
+            {'type': 'stream', 'start': len(escape('<p>Hello')), 'patch': ' world&lt;/p&gt;\n'}
+        ]
+
+
+def test_chat_message_uses_markdown_cache():
+    message = ChatMessage("# Title\n\nHello\n")
+    pane = message._object_panel
+    assert isinstance(pane, CachedMarkdown)
+    pane._transform_object(pane.object)
+
+    message.object = "# Title\n\nHello world\n"
+    assert message._object_panel is pane
+    assert pane._transform_object(pane.object)['object'] == escape(_render(pane, message.object))
+    assert pane._incremental_markdown._source == "# Title\n\n"
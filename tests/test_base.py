@@ -28,3 +28,32 @@ def test_render_esm_patches_utils_import():
         "const install_theme_hooks = pnmui.install_theme_hooks; "
         "const apply_global_css = pnmui.apply_global_css;"
     ) in esm_base
+
+
+def test_render_esm_base_declares_memoized_wrappers():
+    from panel_material_ui.widgets import Button
+
+    esm_base = Button._render_esm_base()
+    assert "const MemoPanelButton = React.memo(React.forwardRef(" in esm_base
+    assert "const MemoTooltipButton = React.memo(React.forwardRef(" in esm_base
+    assert "<MemoTooltipButton {...props}/>" in esm_base
+
+
+def test_render_esm_base_tooltip_does_not_redeclare_component():
+    from panel_material_ui.widgets import Button
+
+    esm_base = Button._render_esm_base()
+    tooltip = esm_base[esm_base.index("function TooltipButton"):]
+    tooltip = tooltip[:tooltip.index("\n}\n")]
+    assert "forwardRef" not in tooltip
+    assert "<MemoPanelButton {...props} ref={ref}/>" in tooltip
+
+
+def test_render_esm_base_tooltip_always_wraps_component():
+    from panel_material_ui.widgets import Button
+
+    esm_base = Button._render_esm_base()
+    tooltip = esm_base[esm_base.index("function TooltipButton"):]
+    tooltip = tooltip[:tooltip.index("\n}\n")]
+    assert 'title={description || ""}' in tooltip
+    assert tooltip.count("<MemoPanelButton") == 1
@@ -0,0 +1,120 @@
+import param
+
+from panel_material_ui.layout import Accordion
+from panel_material_ui.param import LazyParam, LiteralInputTyped, NumberInput
+from panel_material_ui.widgets import (
+    Button, DictInput, FloatSlider, MultiChoice, Pagination, Select, TextInput
+)
+
+
+class Config(param.Parameterized):
+
+    alpha = param.Number(default=1, bounds=(0, 10), precedence=1)
+
+    beta = param.String(default='b', precedence=1)
+
+    choice = param.Selector(default=0, objects=list(range(100)), precedence=2)
+
+    choices = param.ListSelector(default=[], objects=list(range(100)), precedence=2)
+
+    hidden = param.Integer(default=1, precedence=-1)
+
+
+def test_lazy_param_groups_sections_by_precedence():
+    form = LazyParam(Config())
+
+    assert form._sections == [
+        ('Alpha – Beta', ['alpha', 'beta']),
+        ('Choice – Choices', ['choice', 'choices']),
+    ]
+
+
+def test_lazy_param_only_builds_expanded_sections():
+    config = Config()
+    form = LazyParam(config, show_name=False)
+
+    assert list(form._widgets) == ['alpha', 'beta']
+    assert isinstance(form._widgets['alpha'], FloatSlider)
+    assert form._accordion[1].objects == []
+
+    form._accordion.active = [0, 1]
+
+    assert form.active == [0, 1]
+    assert list(form._widgets) == ['alpha', 'beta', 'choice', 'choices']
+    assert form._accordion[1].objects == [form._widgets['choice'], form._widgets['choices']]
+
+
+def test_lazy_param_links_built_widgets():
+    config = Config()
+    form = LazyParam(config)
+
+    form._widgets['alpha'].value = 5
+    assert config.alpha == 5
+
+    config.beta = 'c'
+    assert form._widgets['beta'].value == 'c'
+
+
+def test_lazy_param_paginates_long_sections():
+    form = LazyParam(Config(), page_size=1)
+
+    pagination = form._accordion[0][0][1]
+    assert isinstance(pagination, Pagination)
+    assert 'beta' not in form._widgets
+
+    pagination.value = 1
+    assert isinstance(form._widgets['beta'], TextInput)
+
+
+def test_lazy_param_limits_options_of_long_selectors():
+    form = LazyParam(Config(), active=[1], option_limit=10)
+
+    choice, choices = form._widgets['choice'], form._widgets['choices']
+    assert isinstance(choice, Select)
+    assert isinstance(choices, MultiChoice)
+    assert choice.option_limit == choices.option_limit == 10
+    assert choice.searchable and choices.searchable
+
+
+def test_lazy_param_does_not_limit_options_below_limit():
+    form = LazyParam(Config(), active=[1], option_limit=None)
+
+    assert form._widgets['choice'].option_limit is None
+    assert type(form._widgets['choices']).__name__ == 'MultiSelect'
+
+
+def test_lazy_param_rerenders_on_parameters_change():
+    form = LazyParam(Config(), active=[0, 1])
+
+    form.parameters = ['choice']
+
+    assert form._sections == [('Choice', ['choice'])]
+    assert 'alpha' not in form._widgets
+
+
+def test_lazy_param_calls_on_widget():
+    built = []
+    LazyParam(Config(), on_widget=lambda p, w: built.append(p))
+
+    assert built == ['alpha', 'beta']
+
+
+def test_lazy_param_widget_type_is_resolved_per_parameter_type():
+    assert LazyParam.widget_type(param.Number()) is FloatSlider
+    assert LazyParam._widget_types[param.Number] is param.Number
+    assert LazyParam.widget_type(param.Action()) is Button
+    assert LazyParam.widget_type(param.Number()) is FloatSlider
+
+
+def test_literal_input_typed_reuses_number_input():
+    assert LiteralInputTyped(param.Number()) is NumberInput
+    assert LiteralInputTyped(param.Integer()) is NumberInput
+
+
+def test_controls_lazy_links_widgets_as_they_are_built():
+    button = Button(label='Click')
+    controls = button.controls(lazy=True)
+
+    assert isinstance(controls[0].objects[-1], Accordion)
+    sx = [w for w in controls[0].select(DictInput) if w.name == 'Sx']
+    assert sx and sx[0].serializer == 'json'
@@ -0,0 +1,99 @@
+import gc
+
+import pytest
+from panel.models.esm import DataEvent
+
+from panel_material_ui.layout import Column
+from panel_material_ui.profiling import ComponentProfiler, profiler
+from panel_material_ui.widgets import FileInput, MultiChoice, TextInput
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.reset()
+    with profiler:
+        yield profiler
+    profiler.reset()
+
+
+def get_stat(stats, cls, operation):
+    for record in stats:
+        if record['class'] == cls and record['operation'] == operation:
+            return record
+
+
+def test_profiler_disabled_by_default(document, comm):
+    profiler.reset()
+    TextInput().get_root(document, comm=comm)
+    assert profiler.stats() == []
+
+
+def test_profiler_records_get_model(enabled_profiler, document, comm):
+    Column(MultiChoice(options=[str(i) for i in range(1000)]), TextInput()).get_root(document, comm=comm)
+
+    stats = enabled_profiler.stats()
+    multi_choice = get_stat(stats, 'MultiChoice', 'get_model')
+    text_input = get_stat(stats, 'TextInput', 'get_model')
+    column = get_stat(stats, 'Column', 'get_model')
+    assert multi_choice['count'] == text_input['count'] == column['count'] == 1
+    assert multi_choice['bytes'] > text_input['bytes']
+    # Children are not included in the serialized size of the parent
+    assert column['bytes'] < multi_choice['bytes']
+    assert stats[0]['class'] == 'MultiChoice'
+
+
+def test_profiler_records_updates(enabled_profiler, document, comm):
+    text_input = TextInput()
+    text_input.get_root(document, comm=comm)
+    text_input.value = 'foo'
+    text_input.focus()
+
+    stats = enabled_profiler.stats()
+    assert get_stat(stats, 'TextInput', 'set_on_model')['bytes'] > 0
+    assert get_stat(stats, 'TextInput', 'get_properties')['count'] == 1
+    assert get_stat(stats, 'TextInput', 'update_properties')['count'] >= 1
+    assert get_stat(stats, 'TextInput', 'send_msg')['count'] == 1
+
+
+def test_profiler_instance_stats(enabled_profiler, document, comm):
+    inputs = [TextInput(), TextInput()]
+    Column(*inputs).get_root(document, comm=comm)
+
+    stats = enabled_profiler.stats(by='instance')
+    instances = {r['name'] for r in stats if r['class'] == 'TextInput' and r['operation'] == 'get_model'}
+    assert len(instances) == 2
+
+
+def test_profiler_instance_stats_released_with_instance(enabled_profiler):
+    text_input = TextInput()
+    enabled_profiler.record(text_input, 'get_model', enabled_profiler.start())
+    assert len(enabled_profiler._instance_stats) == 1
+
+    del text_input
+    gc.collect()
+
+    assert len(enabled_profiler._instance_stats) == 0
+    assert get_stat(enabled_profiler.stats(), 'TextInput', 'get_model')['count'] == 1
+
+
+def test_profiler_records_handle_msg(enabled_profiler, document, comm):
+    file_input = FileInput()
+    model = file_input.get_root(document, comm=comm)
+    file_input._process_bokeh_event(document, DataEvent(model=model, data={'status': 'initializing'}))
+
+    record = get_stat(enabled_profiler.stats(), 'FileInput', 'handle_msg')
+    assert record['count'] == 1
+    assert record['bytes'] > 0
+
+
+def test_profiler_prometheus(enabled_profiler, document, comm):
+    TextInput().get_root(document, comm=comm)
+
+    text = enabled_profiler.to_prometheus()
+    assert '# TYPE panel_material_ui_component_calls_total counter' in text
+    assert 'panel_material_ui_component_calls_total{class="TextInput",operation="get_model"} 1' in text
+
+
+def test_profiler_invalid_aggregation():
+    with pytest.raises(ValueError):
+        ComponentProfiler().stats(by='session')
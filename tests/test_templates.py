@@ -94,3 +94,122 @@ def test_logo():
     page = pmui.Page(logo=STATIC_PATH / "logo_horizontal_light_theme.png")
     model = page.get_root()
     assert model.data.logo.startswith("data:image/png;")
+
+
+def test_page_template_cache_shared_across_instances(document):
+    pmui.Page.clear_template_cache()
+    page1 = pmui.Page(title='App', css_files=['https://example.com/a.css'])
+    page2 = pmui.Page(title='App', css_files=['https://example.com/a.css'])
+    doc1 = page1.server_doc(document)
+    doc2 = page2.server_doc()
+
+    assert len(pmui.Page._template_cache) == 1
+    assert doc1.template_variables['resources'] is doc2.template_variables['resources']
+    assert 'https://example.com/a.css' in doc1.template_variables['static_postamble']
+
+
+def test_page_template_cache_invalidated_on_config_change():
+    pmui.Page.clear_template_cache()
+    page = pmui.Page(css_files=['https://example.com/a.css'])
+    assert 'https://example.com/a.css' in _to_html(page)
+
+    page.config.css_files = ['https://example.com/b.css']
+    html = _to_html(page)
+    assert 'https://example.com/b.css' in html
+    assert 'https://example.com/a.css' not in html
+    assert len(pmui.Page._template_cache) == 2
+
+
+def test_page_skeleton():
+    html = _render_page(
+        title='My <App>', main=['# A', pmui.Column(height=300)], sidebar=['B'],
+        sidebar_width=250, main_width={'xs': '100%', 'md': 720}
+    )
+    assert '<div id="page-skeleton"' in html
+    assert 'My &lt;App&gt;' in html
+    assert 'flex: 0 0 250px' in html
+    assert 'class="skeleton-sidebar"' in html
+    assert html.count('class="skeleton-block" style=') == 2
+    assert 'style="height: 300px"' in html
+    assert '@media (min-width: 900px) { #page-skeleton .skeleton-content { max-width: 720px; } }' in html
+
+
+def test_page_skeleton_disabled():
+    html = _render_page(skeleton=False)
+    assert '<div id="page-skeleton"' not in html
+
+
+def test_page_theme_toggle_notifies_server_once(document, comm):
+    button = pmui.Button(label='Click')
+    page = pmui.Page(main=[button], dark_theme=False)
+    model = page.get_root(document, comm=comm)
+    assert model.data.sync_theme
+    assert model.data.esm_constants['follow_dark_mode']
+
+    try:
+        page._process_events({'dark_theme': True})
+        assert config.theme == 'dark'
+        assert not button.dark_theme
+    finally:
+        config.theme = 'default'
+
+
+def test_theme_toggle_sync_theme(document, comm):
+    toggle = pmui.ThemeToggle(sync_theme=False)
+    model = toggle.get_root(document, comm=comm)
+    assert not model.data.sync_theme
+    assert model.data.esm_constants['follow_dark_mode']
+
+
+def test_breakpoint_switcher_renders_both_branches(document, comm):
+    small, large = pmui.Button(label='Small'), pmui.Button(label='Large')
+    switcher = pmui.BreakpointSwitcher(small=small, large=large)
+
+    model = switcher.get_root(document, comm=comm)
+
+    assert model.data.small is not None
+    assert model.data.large is not None
+
+
+def test_breakpoint_switcher_lazy_renders_initial_branch(document, comm):
+    small, large = pmui.Button(label='Small'), pmui.Button(label='Large')
+    switcher = pmui.BreakpointSwitcher(small=small, large=large, lazy=True)
+
+    model = switcher.get_root(document, comm=comm)
+
+    assert model.data.small is None
+    assert model.data.large is not None
+    assert not small._models
+
+
+def test_breakpoint_switcher_lazy_renders_branch_on_switch(document, comm):
+    small, large = pmui.Button(label='Small'), pmui.Button(label='Large')
+    switcher = pmui.BreakpointSwitcher(small=small, large=large, lazy=True)
+    model = switcher.get_root(document, comm=comm)
+    large_model = model.data.large
+
+    switcher._handle_msg({'type': 'switch', 'current': 'small'})
+
+    assert switcher.current is small
+    assert model.data.small is not None
+    assert model.data.large is large_model
+
+
+def test_breakpoint_switcher_lazy_destroy_inactive(document, comm):
+    small, large = pmui.Button(label='Small'), pmui.Button(label='Large')
+    switcher = pmui.BreakpointSwitcher(
+        small=small, large=large, lazy=True, destroy_inactive=True
+    )
+    model = switcher.get_root(document, comm=comm)
+
+    switcher._handle_msg({'type': 'switch', 'current': 'small'})
+
+    assert model.data.small is not None
+    assert model.data.large is None
+    assert not large._models
+
+    switcher._handle_msg({'type': 'switch', 'current': 'large'})
+
+    assert model.data.small is None
+    assert model.data.large is not None
+    assert not small._models
@@ -0,0 +1,50 @@
+import colorsys
+
+import numpy as np
+
+from panel_material_ui.theme import (
+    _generate_palette, generate_palette, hex2rgb, hls2rgb, linear_gradient,
+    rgb2hex, rgb2hls,
+)
+
+
+def test_hex2rgb_roundtrip():
+    assert hex2rgb('#0072b5') == (0, 114, 181)
+    assert rgb2hex((0, 114/255, 181/255)) == '#0072b5'
+    assert hex2rgb('#fff') == (255, 255, 255)
+
+
+def test_hex2rgb_array_roundtrip():
+    colors = ['#0072b5', '#ffffff', '#000000', '#9d00b5']
+    rgb = hex2rgb(colors)
+    assert rgb.shape == (4, 3)
+    assert rgb2hex(rgb / 255) == colors
+
+
+def test_hls_matches_colorsys():
+    rng = np.random.default_rng(0)
+    rgb = rng.random((100, 3))
+    hls = rgb2hls(rgb)
+    expected = np.array([colorsys.rgb_to_hls(*c) for c in rgb])
+    np.testing.assert_allclose(hls, expected, atol=1e-12)
+    np.testing.assert_allclose(hls2rgb(hls), rgb, atol=1e-12)
+
+
+def test_linear_gradient():
+    gradient = linear_gradient('#ffffff', '#000000', 5)
+    assert len(gradient) == 5
+    assert gradient[0] == '#ffffff'
+    assert gradient[-1] != '#ffffff'
+    assert linear_gradient('#ffffff', '#000000', 1) == ['#ffffff']
+
+
+def test_generate_palette_matches_frontend():
+    assert generate_palette('#0072b5', 4) == ['#0072b5', '#9d00b5', '#b54300', '#18b500']
+
+
+def test_generate_palette_memoized():
+    _generate_palette.cache_clear()
+    palette = generate_palette('#0072b5', 10)
+    palette.append('#000000')
+    assert generate_palette('#0072b5', 10) == palette[:-1]
+    assert _generate_palette.cache_info().hits == 1
@@ -103,3 +103,23 @@ def test_toggle_format(page, button_type):
     else:
         button_color = page.locator(f'.MuiToggleButton-{button_type}')
     expect(button_color).to_have_count(1)
+
+
+def test_button_updates_do_not_remount(page):
+    page.add_init_script("window.__pmui_render_counts__ = {}")
+    widget = Button(label='Click', description='Tooltip')
+    serve_component(page, widget)
+    expect(page.locator('.MuiButton-root')).to_have_count(1)
+
+    widget.label = 'Clicked'
+    expect(page.locator('.MuiButton-root')).to_have_text('Clicked')
+    widget.description = 'Updated'
+    widget.description = None
+    widget.description = 'Restored'
+
+    def counts():
+        return page.evaluate("window.__pmui_render_counts__")
+
+    wait_until(lambda: all(count['renders'] > 1 for count in counts().values()), page)
+    assert counts()
+    assert all(count['mounts'] == 1 for count in counts().values())
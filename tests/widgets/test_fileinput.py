@@ -10,6 +10,7 @@ import pytest
 from panel_material_ui.widgets.input import FileInput
 
 import base64
+import hashlib
 import pytest
 
 from pathlib import Path
@@ -238,6 +239,87 @@ def test_incomplete_chunks():
     print("  ✓ Incomplete chunk sequence handled correctly")
 
 
+def test_chunk_acknowledgement_and_resume():
+    """Test per-chunk acknowledgements and resuming an interrupted upload."""
+    widget = FileInput()
+    msgs = []
+    widget._send_msg = msgs.append
+
+    chunk = {
+        "status": "upload_event",
+        "name": "resume.txt",
+        "file_id": "resume.txt:10:0",
+        "total_chunks": 2,
+        "mime_type": "text/plain",
+    }
+    widget._handle_msg({"status": "initializing"})
+    widget._handle_msg(dict(chunk, chunk=1, data=b"Hello"))
+    assert msgs == [{"status": "ack", "file_id": "resume.txt:10:0", "chunk": 1}]
+
+    # Upload is interrupted and restarted
+    widget._handle_msg({"status": "error", "error": "Connection lost"})
+    widget._handle_msg({"status": "initializing", "file_ids": ["resume.txt:10:0"]})
+    widget._handle_msg({"status": "resume", "file_id": "resume.txt:10:0"})
+    assert msgs[-1] == {"status": "resume", "file_id": "resume.txt:10:0", "chunks": [1]}
+
+    widget._handle_msg(dict(chunk, chunk=2, data=b"World"))
+    assert msgs[-1] == {"status": "ack", "file_id": "resume.txt:10:0", "chunk": 2}
+
+    widget._handle_msg({"status": "finished"})
+    assert msgs[-1] == {"status": "finished"}
+    assert widget.value == b"HelloWorld"
+    assert widget.filename == "resume.txt"
+
+
+def test_new_upload_drops_stale_partial_files():
+    """Test partially received files are dropped unless they are resumed."""
+    widget = FileInput()
+    widget._send_msg = lambda msg: None
+
+    chunk = {
+        "status": "upload_event",
+        "total_chunks": 2,
+        "mime_type": "text/plain",
+        "chunk": 1,
+        "data": b"Hello",
+    }
+    widget._handle_msg({"status": "initializing", "file_ids": ["a.txt:10:0", "b.txt:10:0"]})
+    widget._handle_msg(dict(chunk, name="a.txt", file_id="a.txt:10:0"))
+    widget._handle_msg(dict(chunk, name="b.txt", file_id="b.txt:10:0"))
+    widget._handle_msg({"status": "error", "error": "Connection lost"})
+    assert set(widget._file_buffer) == {"a.txt:10:0", "b.txt:10:0"}
+
+    widget._handle_msg({"status": "initializing", "file_ids": ["b.txt:10:0"]})
+    assert set(widget._file_buffer) == {"b.txt:10:0"}
+
+    widget._handle_msg({"status": "initializing"})
+    assert widget._file_buffer == {}
+
+
+def test_chunk_checksum_mismatch():
+    """Test chunks failing checksum verification are rejected."""
+    widget = FileInput()
+    msgs = []
+    widget._send_msg = msgs.append
+
+    data = b"Some content"
+    chunk = {
+        "name": "checked.txt",
+        "file_id": "checked.txt:12:0",
+        "chunk": 1,
+        "total_chunks": 1,
+        "mime_type": "text/plain",
+        "data": data,
+    }
+    widget._process_chunk(dict(chunk, checksum=hashlib.sha256(b"Other").hexdigest()))
+    assert msgs[-1]["status"] == "nack"
+    assert len(widget._buffer) == 0
+
+    widget._process_chunk(dict(chunk, checksum=hashlib.sha256(data).hexdigest()))
+    assert msgs[-1] == {"status": "ack", "file_id": "checked.txt:12:0", "chunk": 1}
+    assert widget._buffer[0]["value"] == data
+
+
 def run_all_tests():
     """Run all tests."""
     print("🧪 Running FileInput chunked upload tests...\n")
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from panel_material_ui.widgets import CircularProgress, LinearProgress
+
+
+@pytest.mark.parametrize('progress_type', [CircularProgress, LinearProgress])
+def test_progress_advance_flushes_immediately(progress_type):
+    progress = progress_type(flush_interval=0)
+
+    progress.advance(10)
+
+    assert progress.value == 10
+    assert progress.variant == 'determinate'
+
+
+@pytest.mark.parametrize('progress_type', [CircularProgress, LinearProgress])
+def test_progress_track_total(progress_type):
+    progress = progress_type()
+
+    with progress.track(total=200):
+        for _ in range(50):
+            progress.advance()
+
+    assert progress.value == 25
+
+
+def test_progress_advance_rate_limited():
+    progress = LinearProgress(flush_interval=10000)
+    values = []
+    progress.param.watch(lambda event: values.append(event.new), 'value')
+
+    with progress.track(total=1000):
+        for _ in range(1000):
+            progress.advance()
+
+    assert values == [0, 100]
+
+
+def test_progress_advance_deferred_flush():
+    progress = LinearProgress(flush_interval=50)
+
+    with progress.track():
+        progress.advance(30)
+        progress.advance(20)
+        assert progress.value == 0
+        time.sleep(0.2)
+        assert progress.value == 50
+
+
+def test_progress_advance_from_threads():
+    progress = LinearProgress(flush_interval=20)
+
+    def work():
+        for _ in range(250):
+            progress.advance()
+
+    with progress.track(total=1000):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert progress.value == 100
+
+
+def test_progress_advance_from_threads_never_regresses():
+    progress = LinearProgress(flush_interval=1)
+    values = []
+    progress.param.watch(lambda event: values.append(event.new), 'value')
+
+    def work():
+        for _ in range(25):
+            progress.advance(0.5)
+            time.sleep(0.0005)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    time.sleep(0.05)
+
+    assert values == sorted(values)
+    assert progress.value == 50
+
+
+@pytest.mark.parametrize('variant', ['buffer', 'query'])
+def test_progress_advance_keeps_variant(variant):
+    progress = LinearProgress(flush_interval=0, variant=variant, value_buffer=50)
+
+    progress.advance(10)
+
+    assert progress.value == 10
+    assert progress.variant == variant
+    assert progress.value_buffer == 50
+
+
+def test_progress_advance_clamped():
+    progress = CircularProgress(flush_interval=0)
+
+    progress.advance(150)
+
+    assert progress.value == 100
+
+
+def test_progress_flush_interval_not_synced(document, comm):
+    progress = LinearProgress(show_eta=True)
+    model = progress.get_root(document, comm=comm)
+
+    assert 'flush_interval' not in model.data.properties()
+    assert model.data.show_eta
+    assert model.data.interpolate
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from panel_material_ui import MenuBar, MenuItems, MenuList, Tree
+
+ITEMS = [
+    {"label": "A", "id": "a", "icon": "folder", "open": True, "items": [
+        {"label": "A1", "id": "a1"},
+        None,
+        {"label": "A2", "id": "a2", "selectable": False},
+    ]},
+    "B",
+]
+
+
+def test_menu_items_roundtrip():
+    items = MenuItems.from_items(ITEMS)
+    assert len(items) == 2
+    assert items.size == 5
+    assert items.to_items() == [dict(ITEMS[0]), {"label": "B"}]
+
+
+def test_menu_items_paths():
+    items = MenuItems.from_items(ITEMS)
+    assert items.row((0, 2)) == 3
+    assert items.path(3) == (0, 2)
+    assert items.row((0, 3)) is None
+    assert items.find({"id": "a2"}) == (0, 2)
+    assert items.find({"label": "B"}) == (1,)
+    assert items.expanded() == [(0,)]
+
+
+def test_menu_items_parents_must_precede_children():
+    with pytest.raises(ValueError):
+        MenuItems(["A", "B"], parents=[1, -1])
+
+
+def test_menu_items_replace_shares_columns():
+    items = MenuItems.from_items(ITEMS)
+    new = items.replace({(1,): {"label": "C", "disabled": True}})
+    assert new.lookup((1,)) == {"label": "C", "disabled": True}
+    assert items.lookup((1,)) == {"label": "B"}
+    assert new._parents is items._parents
+    assert new._columns["icon"] is items._columns["icon"]
+
+
+def test_menu_list_columnar_wire_format():
+    menu = MenuList(items=MenuItems.from_items(ITEMS))
+    model = menu.get_root()
+    payload = model.data.items
+    assert payload["columnar"]
+    assert payload["label"] == ["A", "A1", None, "A2", "B"]
+    np.testing.assert_array_equal(payload["parent"], [-1, 0, 0, 0, -1])
+    assert payload["fields"] == {"icon": ["folder", None, None, None, None]}
+    assert "id" not in payload
+
+
+def test_menu_list_columnar_click():
+    menu = MenuList(items=MenuItems.from_items(ITEMS))
+    clicks = []
+    menu.on_click(clicks.append)
+    menu._handle_msg({"type": "click", "item": [0, 0]})
+    assert menu.active == (0, 0)
+    assert menu.value == {"label": "A1", "id": "a1"}
+    assert clicks == [{"label": "A1", "id": "a1"}]
+
+
+def test_menu_list_columnar_update_item():
+    menu = MenuList(items=MenuItems.from_items(ITEMS))
+    model = menu.get_root()
+    menu.update_item(menu.items[1], label="C")
+    assert isinstance(menu.items, MenuItems)
+    assert model.data.items["label"][-1] == "C"
+
+
+def test_tree_columnar_expanded_remapped_by_id():
+    tree = Tree(items=MenuItems.from_items(ITEMS))
+    assert tree.expanded == [(0,)]
+    tree.expanded = [(0,)]
+    tree.items = MenuItems.from_items([{"label": "B", "id": "b"}, dict(ITEMS[0], open=False)])
+    assert tree.expanded == [(1,)]
+
+
+def test_tree_columnar_sync_value():
+    tree = Tree(items=MenuItems.from_items(ITEMS))
+    tree.value = [{"label": "A2", "id": "a2"}]
+    assert tree.active == [(0, 2)]
+
+
+def test_menu_bar_columnar_radio():
+    menu = MenuBar(items=MenuItems.from_items([
+        {"label": "View", "items": [
+            {"label": "Light", "radio": "light"},
+            {"label": "Dark", "radio": "dark"},
+        ]}
+    ]))
+    props = menu._process_param_change({"items": menu.items})
+    assert props["items"][0]["items"][0]["_radio_selected"]
+    menu._handle_msg({"type": "radio", "path": [0, 1], "value": "dark"})
+    assert [item.get("_radio_selected") for item in menu.items[0]["items"]] == [False, True]
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+
+import param
+import pytest
+
+from panel_material_ui import Pagination
+from panel_material_ui.widgets._paging import PagedSource
+
+
+def test_paged_source_sequence_counts_last_page():
+    source = PagedSource(list(range(25)), page_size=10)
+    assert source.num_pages == 3
+    assert source.page(2) == [20, 21, 22, 23, 24]
+    assert source.page(3) == []
+
+
+def test_paged_source_fetch_lru_cache():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(offset)
+        return list(range(offset, min(offset + limit, 35)))
+
+    source = PagedSource(fetch, page_size=10, cache_size=2)
+    assert source.num_pages == 1
+    source.page(0)
+    assert source.num_pages == 2
+    source.page(1)
+    source.page(0)
+    assert calls == [0, 10]
+    source.page(2)
+    source.page(1)
+    assert calls == [0, 10, 20, 10]
+    source.page(3)
+    assert source.total == 35
+    assert source.num_pages == 4
+
+
+def test_paged_source_iterator_exhausted_on_page_boundary():
+    source = PagedSource(iter(range(20)), page_size=10)
+    assert source.page(1) == list(range(10, 20))
+    assert source.page(0) == list(range(10))
+    source.prefetch(2)
+    assert source.num_pages == 2
+
+
+def test_paged_source_invalid_source():
+    with pytest.raises(TypeError):
+        PagedSource(1)
+
+
+def test_paginate_sequence():
+    layout, pagination = Pagination.paginate(list(range(25)), page_size=10).objects
+    assert pagination.count == 3
+    pagination.value = 2
+    assert [obj.object for obj in layout.objects] == [20, 21, 22, 23, 24]
+
+
+def test_paginate_fetch_grows_count_and_prefetches():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(offset)
+        return list(range(offset, min(offset + limit, 25)))
+
+    layout, pagination = Pagination.paginate(fetch, page_size=10).objects
+    assert calls == [0, 10]
+    assert pagination.count == 3
+    pagination.value = 2
+    assert len(layout.objects) == 5
+    assert pagination.count == 3
+
+
+async def _wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+async def test_paginate_prefetches_sync_fetch_on_thread():
+    threads = []
+
+    def fetch(offset, limit):
+        threads.append(threading.current_thread())
+        return list(range(offset, min(offset + limit, 25)))
+
+    _, pagination = Pagination.paginate(fetch, page_size=10).objects
+    await _wait_for(lambda: pagination.count == 3)
+    assert threads[0] is threading.main_thread()
+    assert threads[1] is not threading.main_thread()
+
+
+async def test_paginate_async_fetch():
+    calls = []
+
+    async def fetch(offset, limit):
+        calls.append(offset)
+        await asyncio.sleep(0)
+        return list(range(offset, min(offset + limit, 25)))
+
+    layout, pagination = Pagination.paginate(fetch, page_size=10).objects
+    await _wait_for(lambda: pagination.count == 3)
+    assert calls == [0, 10]
+    assert [obj.object for obj in layout.objects] == list(range(10))
+    pagination.value = 2
+    await _wait_for(lambda: len(layout.objects) == 5)
+
+
+def test_paginate_reactive_objects():
+    objects = param.rx(list(range(25)))
+    layout, pagination = Pagination.paginate(objects, page_size=10).objects
+    assert pagination.count == 3
+    pagination.value = 2
+    assert [obj.object for obj in layout.objects] == [20, 21, 22, 23, 24]
+    objects.rx.value = list(range(45))
+    assert pagination.count == 5
+    assert [obj.object for obj in layout.objects] == [20, 21, 22, 23, 24, 25, 26, 27, 28, 29]
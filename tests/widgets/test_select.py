@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 from panel.pane import panel
-from panel_material_ui.widgets import AutocompleteInput, Select
+from panel_material_ui.widgets import AutocompleteInput, MultiChoice, Select
 
 
 @pytest.mark.parametrize('widget', [AutocompleteInput, Select])
@@ -300,3 +300,56 @@ def test_autocomplete_lazy_search_options_present(document, comm):
     assert model.data.value == str(opts['1'])
     # Options should be present when lazy_search is False
     assert model.data.options == list(opts)
+
+def test_select_options_index_cached():
+    select = Select(options=[f'Option {i}' for i in range(1000)])
+    index = select._options_index
+    select.value = 'Option 500'
+    assert select._options_index is index
+    assert index.value_index('Option 999') == 999
+
+    select.options = ['A', 'B']
+    assert select._options_index is not index
+    assert select._options_index.value_index('B') == 1
+
+def test_select_options_index_built_lazily():
+    options = [f'Option {i}' for i in range(1000)]
+    select = Select(options=options)
+    index = select._options_index
+    assert select.values is options
+    assert '_values' not in vars(index) and 'labels' not in vars(index)
+
+    assert index.value_index('Option 10') == 10
+    assert '_values' in vars(index)
+
+
+def test_select_options_index_detects_in_place_edit():
+    options = ['A', 'B', 'C']
+    select = Select(options=options)
+    assert select.labels == ['A', 'B', 'C']
+
+    options[0] = 'X'
+    assert select.labels == ['X', 'B', 'C']
+    assert select._options_index.value_index('X') == 0
+
+
+def test_select_large_options_roundtrip(document, comm):
+    options = {f'Option {i}': i for i in range(10_000)}
+    select = Select(options=options, value=5000)
+    model = select.get_root(document, comm=comm)
+    assert model.data.value == 'Option 5000'
+
+    select._process_events({'value': 'Option 9999'})
+    assert select.value == 9999
+
+    select.value = 1
+    assert model.data.value == 'Option 1'
+
+def test_multi_choice_options_index(document, comm):
+    options = {f'Option {i}': i for i in range(1000)}
+    select = MultiChoice(options=options, value=[1, 999])
+    model = select.get_root(document, comm=comm)
+    assert model.data.value == ['Option 1', 'Option 999']
+
+    select._process_events({'value': ['Option 2', 'Option 3']})
+    assert select.value == [2, 3]
@@ -1,5 +1,133 @@
-from panel_material_ui import Rating
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from panel_material_ui import DiscreteSlider, IntSlider, Rating
+from panel_material_ui.widgets._options import encode_options
 
 def test_rating_initial_end():
     """Should not raise an exception when end is not set."""
     Rating(label='Max 10', end=10, value=7)
+
+
+def test_slider_update_policy_synced(document, comm):
+    slider = IntSlider(update_policy='throttle', update_delay=300)
+    model = slider.get_root(document, comm=comm)
+
+    assert model.data.update_policy == 'throttle'
+    assert model.data.update_delay == 300
+
+
+@pytest.mark.parametrize('policy', ['throttle', 'debounce'])
+def test_slider_update_policy_not_delayed_on_server(policy):
+    # Events are already held back by update_delay on the frontend
+    slider = IntSlider(update_policy=policy, update_delay=500)
+
+    assert slider._debounce == IntSlider()._debounce
+
+
+def test_discrete_slider_options_index(document, comm):
+    options = {f'{i}': i for i in range(1000)}
+    slider = DiscreteSlider(options=options, value=500)
+    model = slider.get_root(document, comm=comm)
+    assert model.data.value == 500
+
+    slider._process_events({'value': 999})
+    assert slider.value == 999
+
+    slider.options = {'A': 'a', 'B': 'b'}
+    slider.value = 'b'
+    assert model.data.value == 1
+
+
+def test_discrete_slider_short_options_sent_as_labels(document, comm):
+    slider = DiscreteSlider(options=[1, 2, 3], value=2)
+    model = slider.get_root(document, comm=comm)
+
+    assert model.data.options == ['1', '2', '3']
+
+
+def test_discrete_slider_numeric_range_options(document, comm):
+    options = list(range(0, 5000, 5))
+    slider = DiscreteSlider(options=options, value=50)
+    model = slider.get_root(document, comm=comm)
+
+    assert model.data.options == {
+        'size': 1000, 'format': {'float': False}, 'start': 0.0, 'step': 5.0
+    }
+    assert model.data.value == 10
+
+    slider._process_events({'value': 999})
+    assert slider.value == 4995
+
+
+def test_discrete_slider_datetime_range_options(document, comm):
+    dates = [dt.datetime(2025, 1, 1) + dt.timedelta(hours=i) for i in range(500)]
+    options = {str(d): d for d in dates}
+    slider = DiscreteSlider(options=options, value=dates[10])
+    model = slider.get_root(document, comm=comm)
+
+    assert model.data.options == {
+        'size': 500, 'format': {'datetime': '%Y-%m-%d %H:%M:%S'},
+        'start': dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc).timestamp() * 1000,
+        'step': 3600000.0
+    }
+
+
+def test_discrete_slider_custom_labels_not_encoded(document, comm):
+    options = {f'Option {i}': i for i in range(200)}
+    slider = DiscreteSlider(options=options, value=5)
+    model = slider.get_root(document, comm=comm)
+
+    assert model.data.options == list(options)
+
+
+def test_discrete_slider_encoded_options_updated(document, comm):
+    slider = DiscreteSlider(options=list(range(200)), value=0)
+    model = slider.get_root(document, comm=comm)
+
+    slider.options = list(range(0, 400, 2))
+
+    assert model.data.options['step'] == 2.0
+
+
+def test_encode_options_irregular_packed_offsets():
+    values = [i**2 for i in range(100)]
+    encoded = encode_options(values, [str(v) for v in values])
+
+    assert encoded['start'] == 0
+    assert encoded['offsets'].dtype == np.int32
+    np.testing.assert_array_equal(encoded['offsets'], values)
+
+
+def test_encode_options_irregular_packed_values():
+    values = list(np.geomspace(1, 1000, 100))
+    encoded = encode_options(values, [f'{v:.3f}' for v in values])
+
+    assert encoded['format'] == {'precision': 3}
+    np.testing.assert_array_equal(encoded['values'], values)
+
+
+def test_encode_options_float_labels():
+    values = [0.5 * i for i in range(-10, 10)]
+    encoded = encode_options(values, [str(v) for v in values])
+
+    assert encoded == {
+        'size': 20, 'format': {'float': True}, 'start': -5.0, 'step': 0.5
+    }
+
+
+def test_encode_options_datetime64_labels():
+    values = list(np.arange('2025-01-01', '2025-03-01', dtype='datetime64[D]'))
+    encoded = encode_options(values, [str(v) for v in values])
+
+    assert encoded['format'] == {'datetime': '%Y-%m-%d'}
+    assert encoded['step'] == 86400000.0
+
+
+@pytest.mark.parametrize('labels', [
+    ['1', '2', '3.5'], ['1', '2', 'three'], ['1.0', '2.0', '3.00']
+])
+def test_encode_options_mismatched_labels(labels):
+    assert encode_options([1, 2, 3.5], labels) is None